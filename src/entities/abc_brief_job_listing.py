@@ -1,11 +1,10 @@
 from abc import ABC
 import logging
-import re
-from typing import List
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import SearchSalary, UniversalConfig
 from models.enums.language import Language
 from services.misc.language_parser import LanguageParser
+from services.misc.term_matcher import TermMatcher
 
 
 class BriefJobListing(ABC):
@@ -47,11 +46,14 @@ class BriefJobListing(ABC):
     return self.__url
 
   def get_language(self) -> Language:
+    return self.__language_parser.get_language(self.get_language_content())
+
+  def get_language_content(self) -> str:
     content_blob = ""
     content_blob += f"{self.get_title()} "
     content_blob += f"{self.get_company()} "
     content_blob += self.get_location()
-    return self.__language_parser.get_language(content_blob)
+    return content_blob
 
   def _get_language_parser(self) -> LanguageParser:
     return self.__language_parser
@@ -137,18 +139,13 @@ class BriefJobListing(ABC):
     }
 
   def _is_ideal_listing(self, universal_config: UniversalConfig) -> bool:
-    title = self.__title.lower().strip()
-    for ideal_title in universal_config.bot_behavior.ideal.titles:
-      if self._phrase_is_in_phrase(ideal_title, title):
-        return True
-    company = self.__company.lower().strip()
-    for ideal_company in universal_config.bot_behavior.ideal.companies:
-      if self._phrase_is_in_phrase(ideal_company, company):
-        return True
-    location = self.__location.lower().strip()
-    for ideal_location in universal_config.bot_behavior.ideal.locations:
-      if self._phrase_is_in_phrase(ideal_location, location):
-        return True
+    ideal = universal_config.bot_behavior.ideal
+    if TermMatcher.for_terms(ideal.titles).find_first_match(self.__title) is not None:
+      return True
+    if TermMatcher.for_terms(ideal.companies).find_first_match(self.__company) is not None:
+      return True
+    if TermMatcher.for_terms(ideal.locations).find_first_match(self.__location) is not None:
+      return True
     self.set_ignore_category("Greedy Non-Inclusion")
     return False
 
@@ -161,36 +158,39 @@ class BriefJobListing(ABC):
     )
 
   def _title_is_passable(self, universal_config: UniversalConfig) -> bool:
-    title = self.__title.lower().strip()
-    for title_to_ignore in universal_config.bot_behavior.ignore.titles:
-      if self._phrase_is_in_phrase(title_to_ignore, title):
-        logging.info("Found ignore term in title: %s", title_to_ignore)
-        assert isinstance(title_to_ignore, str)
-        self.set_ignore_category("Title")
-        self.set_ignore_term(title_to_ignore)
-        return False
+    title_to_ignore = TermMatcher.for_terms(universal_config.bot_behavior.ignore.titles).find_first_match(
+      self.__title
+    )
+    if title_to_ignore is not None:
+      logging.info("Found ignore term in title: %s", title_to_ignore)
+      assert isinstance(title_to_ignore, str)
+      self.set_ignore_category("Title")
+      self.set_ignore_term(title_to_ignore)
+      return False
     return True
 
   def _company_is_passable(self, univseral_config: UniversalConfig) -> bool:
-    company = self.__company.lower().strip()
-    for company_to_ignore in univseral_config.bot_behavior.ignore.companies:
-      if self._phrase_is_in_phrase(company_to_ignore, company):
-        logging.info("Found ignore term in company: %s", company_to_ignore)
-        assert isinstance(company_to_ignore, str)
-        self.set_ignore_category("Company")
-        self.set_ignore_term(company_to_ignore)
-        return False
+    company_to_ignore = TermMatcher.for_terms(univseral_config.bot_behavior.ignore.companies).find_first_match(
+      self.__company
+    )
+    if company_to_ignore is not None:
+      logging.info("Found ignore term in company: %s", company_to_ignore)
+      assert isinstance(company_to_ignore, str)
+      self.set_ignore_category("Company")
+      self.set_ignore_term(company_to_ignore)
+      return False
     return True
 
   def _location_is_passable(self, universal_config: UniversalConfig) -> bool:
-    location = self.__location.lower().strip()
-    for location_to_ignore in universal_config.bot_behavior.ignore.locations:
-      if self._phrase_is_in_phrase(location_to_ignore, location):
-        logging.info("Found ignore term in location: %s", location_to_ignore)
-        assert isinstance(location_to_ignore, str)
-        self.set_ignore_category("Location")
-        self.set_ignore_term(location_to_ignore)
-        return False
+    location_to_ignore = TermMatcher.for_terms(universal_config.bot_behavior.ignore.locations).find_first_match(
+      self.__location
+    )
+    if location_to_ignore is not None:
+      logging.info("Found ignore term in location: %s", location_to_ignore)
+      assert isinstance(location_to_ignore, str)
+      self.set_ignore_category("Location")
+      self.set_ignore_term(location_to_ignore)
+      return False
     return True
 
   def _pay_is_passable(self, expected_salary: SearchSalary) -> bool:
@@ -213,21 +213,3 @@ class BriefJobListing(ABC):
       self.set_ignore_term(str(self.__min_pay))
       return False
     return True
-
-  def _phrase_is_in_phrase(self, phrase_one: str | List, phrase_two: str) -> bool:
-    if isinstance(phrase_one, str):
-      phrase_one = phrase_one.lower().strip()
-      phrase_two = phrase_two.lower().strip()
-      return self._matches_pattern(phrase_one, phrase_two)
-    elif isinstance(phrase_one, List):
-      for item in phrase_one:
-        if not self._phrase_is_in_phrase(item, phrase_two):
-          return False
-      return True
-
-  def _matches_pattern(self, phrase_to_ignore: str, phrase: str) -> bool:
-    pattern = rf"(?<!\w)\(?{re.escape(phrase_to_ignore)}\)?(?!\w)"
-    return (
-      re.search(pattern, phrase) is not None
-      or phrase_to_ignore == phrase
-    )
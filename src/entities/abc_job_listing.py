@@ -2,8 +2,8 @@ import logging
 from entities.abc_brief_job_listing import BriefJobListing
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
-from models.enums.language import Language
 from services.misc.language_parser import LanguageParser
+from services.misc.term_matcher import TermMatcher
 
 
 class JobListing(BriefJobListing):
@@ -23,7 +23,7 @@ class JobListing(BriefJobListing):
   def get_description(self) -> str | None:
     return self.__description
 
-  def get_language(self) -> Language:
+  def get_language_content(self) -> str:
     content_blob = ""
     content_blob += f"{self.get_title()} "
     content_blob += f"{self.get_company()} "
@@ -32,7 +32,7 @@ class JobListing(BriefJobListing):
       content_blob += self.__description
     else:
       content_blob += self.get_location()
-    return self._get_language_parser().get_language(content_blob)
+    return content_blob
 
   def set_min_yoe(self, yoe: int | None) -> None:
     self.__min_yoe = yoe
@@ -75,24 +75,17 @@ class JobListing(BriefJobListing):
         return True
 
   def _is_ideal_listing(self, universal_config: UniversalConfig) -> bool:
-    title = self.get_title().lower().strip()
-    for ideal_title in universal_config.bot_behavior.ideal.titles:
-      if self._phrase_is_in_phrase(ideal_title, title):
-        return True
-    company = self.get_company().lower().strip()
-    for ideal_company in universal_config.bot_behavior.ideal.companies:
-      if self._phrase_is_in_phrase(ideal_company, company):
-        return True
-    location = self.get_location().lower().strip()
-    for ideal_location in universal_config.bot_behavior.ideal.locations:
-      if self._phrase_is_in_phrase(ideal_location, location):
-        return True
+    ideal = universal_config.bot_behavior.ideal
+    if TermMatcher.for_terms(ideal.titles).find_first_match(self.get_title()) is not None:
+      return True
+    if TermMatcher.for_terms(ideal.companies).find_first_match(self.get_company()) is not None:
+      return True
+    if TermMatcher.for_terms(ideal.locations).find_first_match(self.get_location()) is not None:
+      return True
     description = self.get_description()
     if description:
-      description = description.lower().strip()
-      for ideal_description in universal_config.bot_behavior.ideal.descriptions:
-        if self._phrase_is_in_phrase(ideal_description, description):
-          return True
+      if TermMatcher.for_terms(ideal.descriptions).find_first_match(description) is not None:
+        return True
     return False
 
   def _passes_ignore_filters(self, universal_config: UniversalConfig) -> bool:
@@ -144,12 +137,13 @@ class JobListing(BriefJobListing):
   def _description_is_passable(self, universal_config: UniversalConfig) -> bool:
     description = self.get_description()
     if description:
-      description = description.lower().strip()
-      for description_to_ignore in universal_config.bot_behavior.ignore.descriptions:
-        if self._phrase_is_in_phrase(description_to_ignore, description):
-          logging.info("Found ignore term in description: %s.", description_to_ignore)
-          description_to_ignore = str(description_to_ignore)
-          self.set_ignore_category("Description")
-          self.set_ignore_term(description_to_ignore)
-          return False
+      description_to_ignore = TermMatcher.for_terms(
+        universal_config.bot_behavior.ignore.descriptions
+      ).find_first_match(description)
+      if description_to_ignore is not None:
+        logging.info("Found ignore term in description: %s.", description_to_ignore)
+        description_to_ignore = str(description_to_ignore)
+        self.set_ignore_category("Description")
+        self.set_ignore_term(description_to_ignore)
+        return False
     return True
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+from typing import List
+from models.enums.element_type import ElementType
+from models.enums.form_field_type import FormFieldType
+
+
+@dataclass
+class FormField:
+  field_type: FormFieldType
+  value: str
+  label_text: str | None = None
+  label_element_type: ElementType = ElementType.LABEL
+  input_names: List[str] = field(default_factory=list)
+  required: bool = False
+
+  def describe(self) -> str:
+    if self.label_text is not None:
+      return self.label_text
+    return " | ".join(self.input_names)
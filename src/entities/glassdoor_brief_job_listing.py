@@ -1,26 +1,28 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
+from typing import Any, Dict
 from entities.abc_brief_job_listing import BriefJobListing
 from services.misc.language_parser import LanguageParser
 
 
 class GlassdoorBriefJobListing(BriefJobListing):
+  __company_rating: float | None
+  __easy_apply: bool | None
 
-  def __init__(self, language_parser: LanguageParser, job_listing_li: WebElement):
+  def __init__(self, language_parser: LanguageParser, job_card: Dict[str, Any]):
     super().__init__(language_parser)
-    job_title_anchor_class = "JobCard_jobTitle__GLyJ1"
-    job_title_anchor = job_listing_li.find_element(By.CLASS_NAME, job_title_anchor_class)
-    self.set_title(job_title_anchor.text.strip())
-    company_span_class = "EmployerProfile_compactEmployerName__9MGcV"
-    company_span = job_listing_li.find_element(By.CLASS_NAME, company_span_class)
-    self.set_company(company_span.text.strip())
-    location_div_class = "JobCard_location__Ds1fM"
-    location_div = job_listing_li.find_element(By.CLASS_NAME, location_div_class)
-    self.set_location(location_div.text.strip())
-    self.set_min_pay(None)
-    self.set_max_pay(None)
-    job_anchor_class = "JobCard_trackingLink__HMyun"
-    job_anchor = job_listing_li.find_element(By.CLASS_NAME, job_anchor_class)
-    url = job_anchor.get_attribute("href")
+    self.set_title(job_card["title"])
+    self.set_company(job_card["company"])
+    self.set_location(job_card["location"])
+    # Only cards matched to the page state carry pay, rating and apply type
+    self.set_min_pay(job_card.get("min_pay"))
+    self.set_max_pay(job_card.get("max_pay"))
+    url = job_card["url"]
     assert url
     self.set_url(url)
+    self.__company_rating = job_card.get("company_rating")
+    self.__easy_apply = job_card.get("easy_apply")
+
+  def get_company_rating(self) -> float | None:
+    return self.__company_rating
+
+  def is_easy_apply(self) -> bool | None:
+    return self.__easy_apply
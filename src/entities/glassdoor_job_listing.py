@@ -17,7 +17,8 @@ class GlassdoorJobListing(JobListing):
     language_parser: LanguageParser,
     brief_job_listing: GlassdoorBriefJobListing,
     job_info_div: WebElement | None = None,
-    url: str | None = None
+    url: str | None = None,
+    job_description_html: str | None = None
   ):
     super().__init__(language_parser)
     self.set_title(brief_job_listing.get_title())
@@ -31,6 +32,7 @@ class GlassdoorJobListing(JobListing):
     timeout = 3
     timed_out = True
     start_time = time.time()
+    raw_description = job_description_html
     if job_info_div:
       while time.time() - start_time < timeout:
         try:
@@ -45,6 +47,7 @@ class GlassdoorJobListing(JobListing):
       raw_description = description_div.get_attribute("innerHTML")
       if raw_description is None:
         raw_description = ""
+    if raw_description is not None:
       soup = BeautifulSoup(raw_description, "html.parser")
       description = soup.get_text(separator="\n", strip=True)
       self.set_description(description)
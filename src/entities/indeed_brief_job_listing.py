@@ -1,26 +1,28 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
+from typing import Any, Dict
 from entities.abc_brief_job_listing import BriefJobListing
 from services.misc.language_parser import LanguageParser
 
 
 class IndeedBriefJobListing(BriefJobListing):
+  __job_key: str
+  __applied: bool
 
-  def __init__(self, language_parser: LanguageParser, job_listing_li: WebElement):
+  def __init__(self, language_parser: LanguageParser, job_card: Dict[str, Any]):
     super().__init__(language_parser)
-    relative_title_span_xpath = "./div/div/div/div/div/div/table/tbody/tr/td/div[1]/h2/a/span"
-    relative_title_span = job_listing_li.find_element(By.XPATH, relative_title_span_xpath)
-    self.set_title(relative_title_span.text.strip())
-    relative_company_span_xpath = "./div/div/div/div/div/div/table/tbody/tr/td/div[2]/div/div[1]/span"
-    relative_company_span = job_listing_li.find_element(By.XPATH, relative_company_span_xpath)
-    self.set_company(relative_company_span.text.strip())
-    relative_location_div_xpath = "./div/div/div/div/div/div/table/tbody/tr/td/div[2]/div/div[2]"
-    relative_location_div = job_listing_li.find_element(By.XPATH, relative_location_div_xpath)
-    self.set_location(relative_location_div.text.strip())
-    self.set_min_pay(None)
-    self.set_max_pay(None)
-    relative_title_anchor_xpath = "./div/div/div/div/div/div/table/tbody/tr/td/div[1]/h2/a"
-    relative_title_anchor = job_listing_li.find_element(By.XPATH, relative_title_anchor_xpath)
-    url = relative_title_anchor.get_attribute("href")
+    self.set_title(job_card["title"])
+    self.set_company(job_card["company"])
+    self.set_location(job_card["location"])
+    # Only the embedded page data carries pay and applied status -- cards read off the DOM have neither
+    self.set_min_pay(job_card.get("min_pay"))
+    self.set_max_pay(job_card.get("max_pay"))
+    url = job_card["url"]
     assert url
     self.set_url(url)
+    self.__job_key = job_card["job_key"]
+    self.__applied = job_card.get("applied", False)
+
+  def get_job_key(self) -> str:
+    return self.__job_key
+
+  def is_applied(self) -> bool:
+    return self.__applied
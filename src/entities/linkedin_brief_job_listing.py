@@ -1,35 +1,35 @@
 import re
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException
+from typing import Dict
 from entities.abc_brief_job_listing import BriefJobListing
 from services.misc.language_parser import LanguageParser
 
 
 class LinkedinBriefJobListing(BriefJobListing):
+  __job_id: str
 
-  def __init__(self, language_parser: LanguageParser, job_listing_li: WebElement):
+  def __init__(self, language_parser: LanguageParser, job_card: Dict[str, str | None]):
     super().__init__(language_parser)
-    relative_job_title_span_xpath = "./div/a/div/div/div[2]/div[1]/div[1]/span[1]/strong"
-    job_title_span = job_listing_li.find_element(By.XPATH, relative_job_title_span_xpath)
-    self.set_title(job_title_span.text)
-    relative_company_div_xpath = "./div/a/div/div/div[2]/div[1]/div[2]/div"
-    company_div = job_listing_li.find_element(By.XPATH, relative_company_div_xpath)
-    self.set_company(company_div.text)
-    relative_location_div_xpath = "./div/a/div/div/div[2]/div[1]/div[3]/div"
-    location_div = job_listing_li.find_element(By.XPATH, relative_location_div_xpath)
-    self.set_location(location_div.text)
-    try:
-      relative_pay_div_xpath = "./div/a/div/div/div[2]/div[1]/div[4]/div[1]"
-      pay_div = job_listing_li.find_element(By.XPATH, relative_pay_div_xpath)
-      self.__handle_linkedin_pay(pay_div.text)
-    except NoSuchElementException:
+    title = job_card["title"]
+    company = job_card["company"]
+    location = job_card["location"]
+    url = job_card["url"]
+    job_id = job_card["job_id"]
+    assert title is not None and company is not None and location is not None
+    assert url and job_id
+    self.set_title(title)
+    self.set_company(company)
+    self.set_location(location)
+    raw_pay = job_card["pay"]
+    if raw_pay:
+      self.__handle_linkedin_pay(raw_pay)
+    else:
       self.set_min_pay(None)
       self.set_max_pay(None)
-    job_listing_anchor = job_listing_li.find_element(By.XPATH, "./div/a")
-    url = job_listing_anchor.get_attribute("href")
-    assert url
     self.set_url(url)
+    self.__job_id = job_id
+
+  def get_job_id(self) -> str:
+    return self.__job_id
 
   def __handle_linkedin_pay(self, raw_pay_string: str) -> None:
     raw_pay_string = raw_pay_string.lower().strip()
@@ -14,7 +14,8 @@ class LinkedinJobListing(JobListing):
     language_parser: LanguageParser,
     brief_job_listing: LinkedinBriefJobListing,
     job_description_content_div: WebElement | None = None,
-    url: str | None = None
+    url: str | None = None,
+    job_description_html: str | None = None
   ):
     super().__init__(language_parser)
     self.set_title(brief_job_listing.get_title())
@@ -24,9 +25,11 @@ class LinkedinJobListing(JobListing):
     self.set_max_pay(brief_job_listing.get_max_pay())
     self.set_ignore_category(brief_job_listing.get_ignore_category())
     self.set_ignore_term(brief_job_listing.get_ignore_term())
+    raw_description = job_description_html
     if job_description_content_div:
       self.__wait_for_populated_description(job_description_content_div)
       raw_description = job_description_content_div.get_attribute("outerHTML") or ""
+    if raw_description is not None:
       soup = BeautifulSoup(raw_description, "html.parser")
       description = soup.get_text(separator="\n", strip=True)
       self.set_description(description)
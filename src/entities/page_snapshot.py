@@ -0,0 +1,26 @@
+from typing import Dict, List
+from models.enums.element_type import ElementType
+
+
+class PageSnapshot:
+  __url: str
+  __visible_texts: Dict[str, List[str]]
+
+  def __init__(self, url: str, visible_texts: Dict[str, List[str]]):
+    self.__url = url
+    self.__visible_texts = visible_texts
+
+  def get_url(self) -> str:
+    return self.__url
+
+  def text_is_present(self, some_text: str, element_type: ElementType) -> bool:
+    some_text = some_text.lower().strip()
+    return any(some_text in visible_text for visible_text in self.__get_visible_texts(element_type))
+
+  def exact_text_is_present(self, some_text: str, element_type: ElementType) -> bool:
+    some_text = some_text.lower().strip()
+    return some_text in self.__get_visible_texts(element_type)
+
+  def __get_visible_texts(self, element_type: ElementType) -> List[str]:
+    assert element_type.value in self.__visible_texts, f"{element_type.value} was not captured in this snapshot"
+    return self.__visible_texts[element_type.value]
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from models.enums.platform import Platform
+
+
+@dataclass
+class PlatformRunResult:
+  platform: Platform
+  succeeded: bool
+  duration: float
+  jobs_applied: int
+  error: str | None = None
@@ -4,80 +4,44 @@ import argparse
 import logging
 import time
 import traceback
+from typing import TYPE_CHECKING, List
 import yaml
-import undetected_chromedriver as uc
 from dacite import from_dict
 from models.configs.full_config import FullConfig
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
-from services.misc.proxy_manager import ProxyManager
-from services.misc.selenium_helper import SeleniumHelper
-from services.orchestration.glassdoor_orchestration_engine import GlassdoorOrchestrationEngine
-from services.orchestration.indeed_orchestration_engine import IndeedOrchestrationEngine
-from services.orchestration.linkedin_orchestration_engine import LinkedinOrchestrationEngine
-from services.pages.indeed_apply_now_page.indeed_apply_now_page import IndeedApplyNowPage
-from services.misc.language_parser import LanguageParser
+
+if TYPE_CHECKING:
+  import undetected_chromedriver as uc
+  from entities.platform_run_result import PlatformRunResult
+  from services.misc.language_parser import LanguageParser
+  from services.misc.proxy_manager import ProxyManager
+  from services.misc.selenium_helper import SeleniumHelper
+  from services.orchestration.glassdoor_orchestration_engine import GlassdoorOrchestrationEngine
+  from services.orchestration.indeed_orchestration_engine import IndeedOrchestrationEngine
+  from services.orchestration.linkedin_orchestration_engine import LinkedinOrchestrationEngine
 
 
 class Start:
+  __start_time: float
   __config: FullConfig
-  __driver: uc.Chrome
-  __proxy_manager: ProxyManager
-  __selenium_helper: SeleniumHelper
+  __driver: "uc.Chrome"
+  __proxy_manager: "ProxyManager"
+  __selenium_helper: "SeleniumHelper"
   __database_manager: DatabaseManager
-  __indeed_orchestration_engine: IndeedOrchestrationEngine
-  __glassdoor_orchestration_engine: GlassdoorOrchestrationEngine
-  __linkedin_orchestration_engine: LinkedinOrchestrationEngine
-  __language_parser: LanguageParser
+  __indeed_orchestration_engine: "IndeedOrchestrationEngine"
+  __glassdoor_orchestration_engine: "GlassdoorOrchestrationEngine"
+  __linkedin_orchestration_engine: "LinkedinOrchestrationEngine"
+  __language_parser: "LanguageParser"
 
   def __init__(self):
+    # Only what every command needs -- the browser and everything behind it are built by apply()
+    self.__start_time = time.time()
     self.__configure_logger()
     with open("config.yml", "r", encoding='utf-8') as config_file:
       raw_config = yaml.safe_load(config_file)
     self.__config = from_dict(data_class=FullConfig, data=raw_config)
     self.__database_manager = DatabaseManager(self.__config.system.database)
-    self.__proxy_manager = ProxyManager(self.__config.system.proxies, self.__database_manager)
-    self.__selenium_helper = SeleniumHelper(
-      self.__config.system,
-      self.__config.quick_settings.bot_behavior.default_page_load_timeout,
-      self.__proxy_manager
-    )
-    self.__driver = self.__selenium_helper.get_driver()
-    self.__language_parser = LanguageParser()
-    self.__indeed_orchestration_engine = IndeedOrchestrationEngine(
-      self.__driver,
-      self.__selenium_helper,
-      self.__database_manager,
-      self.__language_parser,
-      self.__config.universal,
-      self.__config.quick_settings,
-      self.__config.indeed
-    )
-    self.__glassdoor_orchestration_engine = GlassdoorOrchestrationEngine(
-      self.__driver,
-      self.__selenium_helper,
-      self.__database_manager,
-      self.__language_parser,
-      self.__config.universal,
-      self.__config.quick_settings,
-      self.__config.glassdoor,
-      IndeedApplyNowPage(
-        self.__driver,
-        self.__selenium_helper,
-        self.__config.universal,
-        self.__config.quick_settings
-      )
-    )
-    self.__linkedin_orchestration_engine = LinkedinOrchestrationEngine(
-      self.__driver,
-      self.__selenium_helper,
-      self.__database_manager,
-      self.__language_parser,
-      self.__config.universal,
-      self.__config.quick_settings,
-      self.__config.linkedin,
-      self.__proxy_manager
-    )
 
   def execute(self):
     parser = argparse.ArgumentParser()
@@ -88,34 +52,202 @@ class Start:
     get_parser = subparsers.add_parser("get", help="Gets scrapped job info.")
     get_parser.add_argument("--ignore-terms", type=int, required=True)
     get_parser.set_defaults(func=self.__get)
+    benchmark_parser = subparsers.add_parser("benchmark", help="Benchmarks parsers against scrapped job info.")
+    benchmark_parser.add_argument("--yoe-parser", type=int, required=True)
+    benchmark_parser.set_defaults(func=self.__benchmark)
     args = parser.parse_args()
-    args.func(args)
+    logging.info("Ready to run %s after %.3fs", args.command, time.time() - self.__start_time)
+    try:
+      args.func(args)
+    finally:
+      self.__database_manager.close()
 
   def apply(self, args: argparse.Namespace):    # pylint: disable=unused-argument
+    if self.__config.quick_settings.bot_behavior.run_platforms_concurrently:
+      self.__apply_concurrently()
+      return
+    self.__build_browser_services()
+    logging.info("Browser ready after %.3fs", time.time() - self.__start_time)
+    run_results: List["PlatformRunResult"] = []
+    start_time = time.time()
     try:
-      for some_platform in self.__config.quick_settings.bot_behavior.platform_order:
-        platform = str(some_platform).lower()
-        if platform == Platform.LINKEDIN.value.lower():
-          self.__linkedin_orchestration_engine.login()
-        elif platform == Platform.GLASSDOOR.value.lower():
-          self.__glassdoor_orchestration_engine.login()
-        elif platform == Platform.INDEED.value.lower():
-          self.__indeed_orchestration_engine.login()
-      for some_platform in self.__config.quick_settings.bot_behavior.platform_order:
-        platform = str(some_platform).lower()
-        if platform == Platform.LINKEDIN.value.lower():
-          self.__apply_on_linkedin()
-        elif platform == Platform.GLASSDOOR.value.lower():
-          self.__apply_on_glassdoor()
-        elif platform == Platform.INDEED.value.lower():
-          self.__apply_on_indeed()
+      for platform in self.__parse_platform_order():
+        self.__get_orchestration_engine(platform).login()
+      for platform in self.__parse_platform_order():
+        run_results.append(self.__apply_on_platform(platform))
+      self.__print_run_summary(run_results, time.time() - start_time)
       input("\n\tPress enter to exit...")
       self.__remove_all_tabs_except_first()
+    except Exception:
+      traceback.print_exc()
+      self.__print_run_summary(run_results, time.time() - start_time)
+      input("\tPress enter to exit...")
+    finally:
+      self.__selenium_helper.get_wait_engine().log_time_spent()
+      self.__database_manager.flush()
+      self.__selenium_helper.quit()
+
+  def __apply_concurrently(self) -> None:
+    # pylint: disable=import-outside-toplevel
+    from services.misc.language_parser import LanguageParser
+    from services.orchestration.platform_worker import PlatformWorker
+    self.__language_parser = LanguageParser()
+    bot_behavior = self.__config.quick_settings.bot_behavior
+    if bot_behavior.pause_after_each_platform or bot_behavior.remove_tabs_after_each_platform:
+      # Platforms finish at different times in browsers of their own, which are all closed at the end of the run
+      logging.warning(
+        "pause_after_each_platform and remove_tabs_after_each_platform are ignored when running platforms concurrently."
+      )
+    workers: List[PlatformWorker] = []
+    try:
+      # Browsers are started one at a time -- undetected_chromedriver patches a shared binary and races with itself
+      for platform in self.__parse_platform_order():
+        selenium_helper = self.__build_platform_services(platform)
+        workers.append(PlatformWorker(platform, selenium_helper, self.__get_orchestration_engine(platform)))
+      logging.info("%s browsers ready after %.3fs", len(workers), time.time() - self.__start_time)
+      start_time = time.time()
+      for worker in workers:
+        worker.start()
+      for worker in workers:
+        worker.join()
+      self.__print_run_summary(
+        [run_result for worker in workers if (run_result := worker.get_result())],
+        time.time() - start_time
+      )
+      input("\n\tPress enter to exit...")
     except Exception:
       traceback.print_exc()
       input("\tPress enter to exit...")
     finally:
-      self.__driver.quit()
+      for worker in workers:
+        logging.info("%s wait times:", worker.get_platform().value)
+        worker.get_selenium_helper().get_wait_engine().log_time_spent()
+      self.__database_manager.flush()
+      for worker in workers:
+        worker.get_selenium_helper().quit()
+
+  def __parse_platform_order(self) -> List[Platform]:
+    platforms = []
+    for some_platform in self.__config.quick_settings.bot_behavior.platform_order:
+      platform = str(some_platform).lower()
+      if platform == Platform.LINKEDIN.value.lower():
+        platforms.append(Platform.LINKEDIN)
+      elif platform == Platform.GLASSDOOR.value.lower():
+        platforms.append(Platform.GLASSDOOR)
+      elif platform == Platform.INDEED.value.lower():
+        platforms.append(Platform.INDEED)
+    return platforms
+
+  def __get_orchestration_engine(
+    self,
+    platform: Platform
+  ) -> "IndeedOrchestrationEngine | GlassdoorOrchestrationEngine | LinkedinOrchestrationEngine":
+    if platform == Platform.LINKEDIN:
+      return self.__linkedin_orchestration_engine
+    if platform == Platform.GLASSDOOR:
+      return self.__glassdoor_orchestration_engine
+    return self.__indeed_orchestration_engine
+
+  def __build_browser_services(self) -> None:
+    # pylint: disable=import-outside-toplevel
+    from services.misc.language_parser import LanguageParser
+    from services.misc.proxy_manager import ProxyManager
+    from services.misc.selenium_helper import SeleniumHelper
+    self.__proxy_manager = ProxyManager(self.__config.system.proxies, self.__database_manager)
+    self.__selenium_helper = SeleniumHelper(
+      self.__config.system,
+      self.__config.quick_settings.bot_behavior.default_page_load_timeout,
+      self.__proxy_manager,
+      capture_network_events=(
+        self.__config.linkedin.capture_job_postings
+        and Platform.LINKEDIN in self.__parse_platform_order()
+      ),
+      profile_name=self.__get_profile_name()
+    )
+    self.__driver = self.__selenium_helper.get_driver()
+    self.__language_parser = LanguageParser()
+    for platform in Platform:
+      self.__build_orchestration_engine(platform, self.__selenium_helper, self.__proxy_manager)
+
+  def __build_platform_services(self, platform: Platform) -> "SeleniumHelper":
+    # pylint: disable=import-outside-toplevel
+    from services.misc.proxy_manager import ProxyManager
+    from services.misc.selenium_helper import SeleniumHelper
+    # Each platform gets its own proxy manager, so each one picks whichever proxy that platform has rate limited least
+    proxy_manager = ProxyManager(self.__config.system.proxies, self.__database_manager)
+    selenium_helper = SeleniumHelper(
+      self.__config.system,
+      self.__config.quick_settings.bot_behavior.default_page_load_timeout,
+      proxy_manager,
+      platform,
+      capture_network_events=platform == Platform.LINKEDIN and self.__config.linkedin.capture_job_postings,
+      profile_name=self.__get_profile_name(platform)
+    )
+    self.__build_orchestration_engine(platform, selenium_helper, proxy_manager)
+    return selenium_helper
+
+  def __get_profile_name(self, platform: Platform | None = None) -> str:
+    # Named after the account(s) too, so switching accounts never picks up someone else's session
+    if platform == Platform.LINKEDIN:
+      return f"linkedin-{self.__config.linkedin.email}"
+    if platform == Platform.GLASSDOOR:
+      return f"glassdoor-{self.__config.glassdoor.email}"
+    if platform == Platform.INDEED:
+      return f"indeed-{self.__config.indeed.email}"
+    return "-".join(["shared"] + [
+      self.__get_profile_name(ordered_platform).split("-", 1)[1]
+      for ordered_platform in self.__parse_platform_order()
+    ])
+
+  def __build_orchestration_engine(
+    self,
+    platform: Platform,
+    selenium_helper: "SeleniumHelper",
+    proxy_manager: "ProxyManager"
+  ) -> None:
+    # pylint: disable=import-outside-toplevel
+    driver = selenium_helper.get_driver()
+    if platform == Platform.INDEED:
+      from services.orchestration.indeed_orchestration_engine import IndeedOrchestrationEngine
+      self.__indeed_orchestration_engine = IndeedOrchestrationEngine(
+        driver,
+        selenium_helper,
+        self.__database_manager,
+        self.__language_parser,
+        self.__config.universal,
+        self.__config.quick_settings,
+        self.__config.indeed
+      )
+    elif platform == Platform.GLASSDOOR:
+      from services.orchestration.glassdoor_orchestration_engine import GlassdoorOrchestrationEngine
+      from services.pages.indeed_apply_now_page.indeed_apply_now_page import IndeedApplyNowPage
+      self.__glassdoor_orchestration_engine = GlassdoorOrchestrationEngine(
+        driver,
+        selenium_helper,
+        self.__database_manager,
+        self.__language_parser,
+        self.__config.universal,
+        self.__config.quick_settings,
+        self.__config.glassdoor,
+        IndeedApplyNowPage(
+          driver,
+          selenium_helper,
+          self.__config.universal,
+          self.__config.quick_settings
+        )
+      )
+    elif platform == Platform.LINKEDIN:
+      from services.orchestration.linkedin_orchestration_engine import LinkedinOrchestrationEngine
+      self.__linkedin_orchestration_engine = LinkedinOrchestrationEngine(
+        driver,
+        selenium_helper,
+        self.__database_manager,
+        self.__language_parser,
+        self.__config.universal,
+        self.__config.quick_settings,
+        self.__config.linkedin,
+        proxy_manager
+      )
 
   def __configure_logger(self):
     def custom_time(record):
@@ -136,26 +268,33 @@ class Start:
     for name in noisy_loggers:
       logging.getLogger(name).setLevel(logging.WARNING)
 
-  def __apply_on_indeed(self) -> None:
-    self.__indeed_orchestration_engine.apply()
-    if self.__config.quick_settings.bot_behavior.pause_after_each_platform:
-      input("\nFinished with Indeed. Press enter to proceed...")
-    if self.__config.quick_settings.bot_behavior.remove_tabs_after_each_platform:
-      self.__remove_all_tabs_except_first()
-
-  def __apply_on_glassdoor(self) -> None:
-    self.__glassdoor_orchestration_engine.apply()
-    if self.__config.quick_settings.bot_behavior.pause_after_each_platform:
-      input("\nFinished with Glassdoor. Press enter to proceed...")
-    if self.__config.quick_settings.bot_behavior.remove_tabs_after_each_platform:
-      self.__remove_all_tabs_except_first()
-
-  def __apply_on_linkedin(self) -> None:
-    self.__linkedin_orchestration_engine.apply()
+  def __apply_on_platform(self, platform: Platform) -> "PlatformRunResult":
+    from entities.platform_run_result import PlatformRunResult   # pylint: disable=import-outside-toplevel
+    orchestration_engine = self.__get_orchestration_engine(platform)
+    start_time = time.time()
+    try:
+      orchestration_engine.apply()
+      run_result = PlatformRunResult(
+        platform=platform,
+        succeeded=True,
+        duration=time.time() - start_time,
+        jobs_applied=orchestration_engine.get_jobs_applied_count()
+      )
+    except Exception as e:
+      # Same as a concurrent run -- the failure gets its row in the summary and the next platform still runs
+      logging.error("%s failed:\n%s", platform.value, traceback.format_exc())
+      run_result = PlatformRunResult(
+        platform=platform,
+        succeeded=False,
+        duration=time.time() - start_time,
+        jobs_applied=orchestration_engine.get_jobs_applied_count(),
+        error=f"{type(e).__name__}: {e}"
+      )
     if self.__config.quick_settings.bot_behavior.pause_after_each_platform:
-      input("\nFinished with Linkedin. Press enter to proceed...")
+      input(f"\nFinished with {platform.value}. Press enter to proceed...")
     if self.__config.quick_settings.bot_behavior.remove_tabs_after_each_platform:
       self.__remove_all_tabs_except_first()
+    return run_result
 
   def __remove_all_tabs_except_first(self) -> None:
     while len(self.__driver.window_handles) > 1:
@@ -179,4 +318,50 @@ class Start:
       print(f"{category:>22}   {term:<40} {count:{width},}")
     print()
 
+  def __print_run_summary(self, run_results: List["PlatformRunResult"], total_duration: float) -> None:
+    print("\n" + "Run Summary".center(100))
+    print(f"{"Platform":>22}   {"Status":<12} {"Applied":>8} {"Duration":>10}   {"Error"}")
+    print("─" * 100)
+    for run_result in run_results:
+      status = "Succeeded" if run_result.succeeded else "Failed"
+      error = run_result.error or ""
+      print(
+        f"{run_result.platform.value:>22}   {status:<12} {run_result.jobs_applied:>8,} "
+        f"{run_result.duration:>9.1f}s   {error[:40]}"
+      )
+    print("─" * 100)
+    total_applied = sum(run_result.jobs_applied for run_result in run_results)
+    print(f"{"Total":>22}   {"":<12} {total_applied:>8,} {total_duration:>9.1f}s")
+    print()
+
+  def __benchmark(self, args: argparse.Namespace) -> None:
+    if args.yoe_parser:
+      self.__benchmark_yoe_parser(args.yoe_parser)
+
+  def __benchmark_yoe_parser(self, limit: int) -> None:
+    from services.misc.yoe_parser import YoeParser   # pylint: disable=import-outside-toplevel
+    descriptions = self.__database_manager.get_job_listing_descriptions(limit)
+    yoe_parser = YoeParser()
+    start_time = time.perf_counter()
+    reference_results = [yoe_parser.parse_reference(description) for description in descriptions]
+    reference_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    results = [yoe_parser.parse(description) for description in descriptions]
+    single_pass_time = time.perf_counter() - start_time
+    mismatches = [
+      (description, reference_result, result)
+      for description, reference_result, result in zip(descriptions, reference_results, results)
+      if reference_result != result
+    ]
+    print("\n" + "YoE Parser Benchmark".center(100))
+    print("─" * 100)
+    print(f"{"Descriptions":>22}   {len(descriptions):,}")
+    print(f"{"Reference":>22}   {reference_time:.3f}s")
+    print(f"{"Single Pass":>22}   {single_pass_time:.3f}s")
+    print(f"{"Speedup":>22}   {reference_time / max(single_pass_time, 1e-9):.1f}x")
+    print(f"{"Mismatches":>22}   {len(mismatches):,}")
+    for description, reference_result, result in mismatches[:10]:
+      print(f"{"":>22}   {reference_result} != {result}: {description[:60]!r}")
+    print()
+
 Start().execute()
@@ -5,3 +5,4 @@ from dataclasses import dataclass
 class GlassdoorConfig:
   email: str = ""
   password: str = ""
+  max_job_listings_per_query: int = 300
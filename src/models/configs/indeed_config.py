@@ -4,3 +4,6 @@ from dataclasses import dataclass
 @dataclass
 class IndeedConfig:
   email: str = ""
+  start_page: int = 1
+  prefetch_next_page: bool = True
+  apply_workers: int = 0
@@ -5,3 +5,6 @@ from dataclasses import dataclass
 class LinkedinConfig:
   email: str = ""
   password: str = ""
+  start_page: int = 1
+  prefetch_next_page: bool = True
+  capture_job_postings: bool = True
@@ -22,6 +22,11 @@ class BotBehavior:
   default_page_load_timeout: int = 30
   pause_every_x_jobs: int | None = None
   platform_order: list = field(default_factory=list)
+  run_platforms_concurrently: bool = False
+  pipeline_queue_size: int = 20
+  job_tab_look_ahead: int = 3
+  fetch_descriptions_over_http: bool = False
+  http_fetch_workers: int = 4
 
 @dataclass
 class QuickSettings:
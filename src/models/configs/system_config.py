@@ -11,9 +11,38 @@ class DatabaseConfig:
   port: int = 3306
   name: str = ""
 
+@dataclass
+class RequestBlockingAllowLists:
+  glassdoor: List[str] = field(default_factory=lambda: ["*://challenges.cloudflare.com/*", "*://*.hcaptcha.com/*"])
+  indeed: List[str] = field(default_factory=lambda: ["*://challenges.cloudflare.com/*", "*://*.hcaptcha.com/*"])
+  linkedin: List[str] = field(default_factory=lambda: [
+    "*://*.arkoselabs.com/*",
+    "*://www.google.com/recaptcha/*",
+    "*://www.gstatic.com/recaptcha/*"
+  ])
+
+@dataclass
+class RequestBlockingConfig:
+  enabled: bool = False
+  resource_types: List[str] = field(default_factory=lambda: ["image", "font", "media"])
+  url_patterns: List[str] = field(default_factory=lambda: [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*bat.bing.com*",
+    "*px.ads.linkedin.com*",
+    "*scorecardresearch.com*"
+  ])
+  allow_lists: RequestBlockingAllowLists = field(default_factory=RequestBlockingAllowLists)
+
 @dataclass
 class BrowserConfig:
   path: str = ""
+  profiles_path: str = ""
+  request_blocking: RequestBlockingConfig = field(default_factory=RequestBlockingConfig)
 
 @dataclass
 class ProxyConfig:
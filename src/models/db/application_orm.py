@@ -1,11 +1,18 @@
 from datetime import datetime, timezone
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 from models.db.base import Base
 
 
 class ApplicationORM(Base):
   __tablename__ = 'applications'
+  # Not unique -- ignore_category/ignore_term are usually NULL, and NULLs never conflict
+  __table_args__ = (
+    Index(
+      'ix_applications_duplicate_check',
+      'job_listing_id', 'first_name', 'last_name', 'applied', 'ignore_category', 'ignore_term'
+    ),
+  )
   id = Column(Integer, primary_key=True)
   first_name = Column(String)
   last_name = Column(String)
@@ -1,11 +1,14 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
 from sqlalchemy.orm import relationship
 from models.db.base import Base
 
 
 class JobListingORM(Base):
   __tablename__ = 'job_listings'
+  __table_args__ = (
+    Index('ix_job_listings_natural_key', 'job_title', 'company', 'location', 'platform', unique=True),
+  )
   id = Column(Integer, primary_key=True)
   job_title = Column(String)
   company = Column(String)
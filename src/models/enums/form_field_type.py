@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class FormFieldType(Enum):
+  INPUT = "input"
+  RADIO = "radio"
+  SELECT = "select"
+  TYPEAHEAD = "typeahead"
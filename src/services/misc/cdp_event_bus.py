@@ -0,0 +1,190 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set
+import undetected_chromedriver as uc
+from selenium.common.exceptions import WebDriverException
+
+
+@dataclass
+class CdpEvent:
+  sequence: int
+  method: str
+  params: Dict[str, Any]
+  target_id: str | None
+
+
+class CdpEventBus:
+  # Chrome's performance log carries the Page (and optionally Network) events of every tab chromedriver is attached to.
+  # One thread drains it and wakes whoever is waiting, so callers block on an event instead of polling the driver.
+  # The Target domain isn't logged -- an event from a tab the bus hasn't seen yet is published as Target.targetCreated.
+  # Reading the log is still a driver round trip, sent alongside the main thread's commands. So the log is only read
+  # every 50ms while a wait_for is running and every 2s otherwise, which keeps chromedriver's buffer short.
+  # Subscribers that need everything up to now call drain() themselves.
+  TARGET_CREATED = "Target.targetCreated"
+  __NAVIGATION_EVENTS = ("Page.frameNavigated", "Page.navigatedWithinDocument")
+  __ACTIVE_POLL_INTERVAL = 0.05
+  __IDLE_POLL_INTERVAL = 2.0
+  __HISTORY_SIZE = 1000
+  __driver: uc.Chrome
+  __history: deque
+  __sequence: int
+  __condition: threading.Condition
+  __subscribers: Dict[str, List[Callable[[CdpEvent], None]]]
+  __known_target_ids: Set[str]
+  __waiter_count: int
+  __wake: threading.Event
+  __drain_lock: threading.Lock
+  __stopping: threading.Event
+  __thread: threading.Thread | None
+
+  def __init__(self, driver: uc.Chrome):
+    self.__driver = driver
+    self.__history = deque(maxlen=self.__HISTORY_SIZE)
+    self.__sequence = 0
+    self.__condition = threading.Condition()
+    self.__subscribers = {}
+    self.__known_target_ids = set()
+    self.__waiter_count = 0
+    self.__wake = threading.Event()
+    self.__drain_lock = threading.Lock()
+    self.__stopping = threading.Event()
+    self.__thread = None
+
+  def start(self) -> None:
+    self.__known_target_ids = {self.__get_target_id(window_handle) for window_handle in self.__driver.window_handles}
+    self.__thread = threading.Thread(target=self.__run, name="CdpEventBus", daemon=True)
+    self.__thread.start()
+
+  def stop(self) -> None:
+    self.__stopping.set()
+    self.__wake.set()
+    if self.__thread:
+      self.__thread.join()
+
+  def drain(self) -> None:
+    # Publishes everything logged so far before returning
+    with self.__drain_lock:
+      try:
+        entries = self.__driver.get_log("performance")
+      except WebDriverException:
+        if not self.__stopping.is_set():
+          logging.debug("Failed to read the performance log. Trying again...")
+        return
+      for entry in entries:
+        message = json.loads(entry["message"])
+        target_id = message.get("webview")
+        if target_id and target_id not in self.__known_target_ids:
+          self.__known_target_ids.add(target_id)
+          self.__publish(self.TARGET_CREATED, {"targetInfo": {"targetId": target_id}}, target_id)
+        self.__publish(message["message"]["method"], message["message"].get("params", {}), target_id)
+
+  def subscribe(self, method: str, callback: Callable[[CdpEvent], None]) -> None:
+    # Callbacks run on the bus thread -- they shouldn't touch the driver
+    with self.__condition:
+      self.__subscribers.setdefault(method, []).append(callback)
+
+  def get_cursor(self) -> int:
+    with self.__condition:
+      return self.__sequence
+
+  def wait_for(
+    self,
+    predicate: Callable[[CdpEvent], bool],
+    timeout: float,
+    since: int | None = None
+  ) -> CdpEvent | None:
+    # Considers every event published after since (a cursor) -- taking the cursor before acting means nothing is missed
+    deadline = time.time() + timeout
+    with self.__condition:
+      self.__waiter_count += 1
+      self.__wake.set()
+      try:
+        last_seen = self.__sequence if since is None else since
+        while True:
+          for event in self.__history:
+            if event.sequence > last_seen and predicate(event):
+              return event
+          if self.__history:
+            last_seen = max(last_seen, self.__history[-1].sequence)
+          remaining = deadline - time.time()
+          if remaining <= 0:
+            return None
+          self.__condition.wait(remaining)
+      finally:
+        self.__waiter_count -= 1
+
+  def wait_for_url(self, predicate: Callable[[str], bool], timeout: float) -> bool:
+    # Waits for the current tab's url to satisfy predicate -- re-reads it first, so a missed event only costs a timeout
+    since = self.get_cursor()
+    target_id = self.__get_target_id(self.__driver.current_window_handle)
+    if predicate(self.__driver.current_url):
+      return True
+    return self.wait_for(
+      lambda event: (
+        event.target_id == target_id
+        and event.method in self.__NAVIGATION_EVENTS
+        and self.__is_main_frame_navigation(event)
+        and predicate(self.__get_navigation_url(event))
+      ),
+      timeout,
+      since
+    ) is not None
+
+  def wait_for_new_tab(self, starting_window_handles: List[str], timeout: float) -> str | None:
+    # chromedriver only logs a tab once it has noticed it, which listing the window handles makes it do
+    start_time = time.time()
+    while True:
+      since = self.get_cursor()
+      new_window_handles = [
+        window_handle for window_handle in self.__driver.window_handles
+        if window_handle not in starting_window_handles
+      ]
+      if new_window_handles:
+        return new_window_handles[-1]
+      remaining = timeout - (time.time() - start_time)
+      if remaining <= 0:
+        return None
+      self.wait_for(lambda event: event.method == self.TARGET_CREATED, min(remaining, 1.0), since)
+
+  def __run(self) -> None:
+    while not self.__stopping.is_set():
+      self.drain()
+      with self.__condition:
+        is_waited_on = self.__waiter_count > 0
+      if is_waited_on:
+        self.__stopping.wait(self.__ACTIVE_POLL_INTERVAL)
+      else:
+        self.__wake.wait(self.__IDLE_POLL_INTERVAL)
+        self.__wake.clear()
+
+  def __publish(self, method: str, params: Dict[str, Any], target_id: str | None) -> None:
+    with self.__condition:
+      self.__sequence += 1
+      event = CdpEvent(self.__sequence, method, params, target_id)
+      self.__history.append(event)
+      subscribers = list(self.__subscribers.get(method, []))
+      self.__condition.notify_all()
+    for callback in subscribers:
+      try:
+        callback(event)
+      except Exception:
+        logging.exception("CDP event subscriber failed on %s.", method)
+
+  def __is_main_frame_navigation(self, event: CdpEvent) -> bool:
+    if event.method == "Page.frameNavigated":
+      return "parentId" not in event.params["frame"]
+    # A tab's main frame shares its target's id
+    return event.params.get("frameId") == event.target_id
+
+  def __get_navigation_url(self, event: CdpEvent) -> str:
+    if event.method == "Page.frameNavigated":
+      return event.params["frame"]["url"]
+    return event.params["url"]
+
+  def __get_target_id(self, window_handle: str) -> str:
+    # Older chromedrivers prefix window handles -- the rest is the target id
+    return window_handle.removeprefix("CDwindow-")
@@ -1,12 +1,13 @@
 
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 from urllib.parse import quote_plus
-from sqlalchemy import create_engine, desc, func
+from sqlalchemy import and_, create_engine, desc, exists, func, insert, literal, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, Session
-from entities.abc_job_listing import JobListing
 from models.configs.system_config import DatabaseConfig
 from models.configs.universal_config import UniversalConfig
 from models.db.application_orm import ApplicationORM
@@ -14,11 +15,20 @@ from models.db.base import Base
 from models.db.job_listing_orm import JobListingORM
 from models.db.rate_limit import RateLimitORM
 from models.enums.platform import Platform
+from services.misc.database_writer import DatabaseWriter, PendingWrite
+
+if TYPE_CHECKING:
+  # Kept out of the runtime imports so read-only commands don't pull in the parsers behind it
+  from entities.abc_job_listing import JobListing
 
 
 class DatabaseManager:
+  __JOB_LISTING_NATURAL_KEY = ["job_title", "company", "location", "platform"]
+  __UPSERT_DIALECTS = ["postgresql", "sqlite", "mysql", "mariadb"]
   __engine: Engine
+  __supports_upsert: bool
   __session_factory: sessionmaker
+  __database_writer: DatabaseWriter
 
   def __init__(self, database_config: DatabaseConfig):
     engine = database_config.engine
@@ -30,81 +40,53 @@ class DatabaseManager:
     name = database_config.name
     self.__engine = create_engine(f"{engine}://{username}:{password}@{host}:{port}/{name}")
     Base.metadata.create_all(self.__engine)
+    self.__supports_upsert = self.__create_missing_indexes()
     self.__session_factory = sessionmaker(bind=self.__engine)
+    self.__database_writer = DatabaseWriter(self.__write_batch)
 
   def get_session(self) -> Session:
     return self.__session_factory()
 
   def create_new_job_listing(
     self,
-    job_listing: JobListing,
+    job_listing: "JobListing",
     platform: Platform
   ) -> None:
-    job_listing_orm = self.__build_job_listing_orm(job_listing, platform)
-    with self.get_session() as session:
-      job_listing_entry = session.query(JobListingORM).filter_by(
-        job_title=job_listing_orm.job_title,
-        company=job_listing_orm.company,
-        location=job_listing_orm.location,
-        platform=platform.value,
-      ).first()
-      if job_listing_entry:
-        if job_listing_entry.min_pay != job_listing.get_min_pay():
-          job_listing_entry.min_pay = job_listing.get_min_pay()
-        if job_listing_entry.max_pay != job_listing.get_max_pay():
-          job_listing_entry.max_pay = job_listing.get_max_pay()
-        if job_listing_entry.min_yoe != job_listing.get_min_yoe():
-          job_listing_entry.min_yoe = job_listing.get_min_yoe()
-        if job_listing_entry.max_yoe != job_listing.get_max_yoe():
-          job_listing_entry.max_yoe = job_listing.get_max_yoe()
-        if job_listing_entry.description != job_listing.get_description():
-          job_listing_entry.description = job_listing.get_description()
-        if job_listing_entry.url != job_listing.get_url():
-          job_listing_entry.url = job_listing.get_url()
-        session.commit()
-      else:
-        session.add(job_listing_orm)
-        session.commit()
+    self.__database_writer.submit_job_listing(
+      self.__build_job_listing_key(job_listing, platform),
+      self.__build_job_listing_values(job_listing, platform)
+    )
 
   def create_new_application(
     self,
     universal_config: UniversalConfig,
-    job_listing: JobListing,
+    job_listing: "JobListing",
     platform: Platform
   ) -> None:
     applied = job_listing.get_ignore_category() is None and job_listing.get_ignore_term() is None
-    with self.get_session() as session:
-      job_listing_orm = session.query(JobListingORM).filter_by(
-        job_title=job_listing.get_title(),
-        company=job_listing.get_company(),
-        location=job_listing.get_location(),
-        platform=platform.value
-      ).first()
-      if not job_listing_orm:
-        job_listing_orm = self.__build_job_listing_orm(job_listing, platform)
-        session.add(job_listing_orm)
-        session.flush()
-      application_orm = ApplicationORM(
-        first_name=universal_config.about_me.name.first,
-        last_name=universal_config.about_me.name.last,
-        applied=applied,
-        ignore_category=job_listing.get_ignore_category(),
-        ignore_term=job_listing.get_ignore_term(),
-        job_listing=job_listing_orm
-      )
-      application_entry = session.query(ApplicationORM).filter_by(
-        first_name=application_orm.first_name,
-        last_name=application_orm.last_name,
-        applied=applied,
-        ignore_category=application_orm.ignore_category,
-        ignore_term=application_orm.ignore_term,
-        job_listing_id=job_listing_orm.id
-      ).first()
-      if not application_entry:
-        session.add(application_orm)
-        session.commit()
+    self.__database_writer.submit_application(
+      self.__build_job_listing_key(job_listing, platform),
+      self.__build_job_listing_values(job_listing, platform),
+      {
+        "first_name": universal_config.about_me.name.first,
+        "last_name": universal_config.about_me.name.last,
+        "applied": applied,
+        "ignore_category": job_listing.get_ignore_category(),
+        "ignore_term": job_listing.get_ignore_term()
+      }
+    )
+
+  def flush(self) -> None:
+    self.__database_writer.flush()
+
+  def close(self) -> None:
+    self.__database_writer.close()
+
+  def get_write_queue_depth(self) -> int:
+    return self.__database_writer.get_queue_depth()
 
   def get_highest_job_listing_ignore_keywords(self, limit=10) -> List[Tuple[str, str, int]]:
+    self.flush()
     with self.get_session() as session:
       top_ignore_terms_query = (
         session.query(
@@ -124,6 +106,18 @@ class DatabaseManager:
       top_ignore_terms = top_ignore_terms_query.all()
       return top_ignore_terms
 
+  def get_job_listing_descriptions(self, limit=5000) -> List[str]:
+    self.flush()
+    with self.get_session() as session:
+      descriptions = (
+        session.query(JobListingORM.description)
+          .filter(JobListingORM.description.isnot(None))
+          .order_by(desc(JobListingORM.timestamp))
+          .limit(limit)
+          .all()
+      )
+      return [description for (description,) in descriptions]
+
   def log_rate_limit_block(self, ip_address: str, platform: Platform) -> None:
     logging.warning("Rate limited by %s on address: %s", platform.value, ip_address)
     rate_limit = RateLimitORM(
@@ -160,17 +154,136 @@ class DatabaseManager:
     time_delta = now - last_logged_rate_limit_timestamp
     return time_delta
 
-  def __build_job_listing_orm(self, job_listing: JobListing, platform: Platform) -> JobListingORM:
-    job_listing_orm = JobListingORM(
-      job_title=job_listing.get_title(),
-      company=job_listing.get_company(),
-      location=job_listing.get_location(),
-      min_pay=job_listing.get_min_pay(),
-      max_pay=job_listing.get_max_pay(),
-      min_yoe=job_listing.get_min_yoe(),
-      max_yoe=job_listing.get_max_yoe(),
-      description=job_listing.get_description(),
-      platform=platform.value,
-      url=job_listing.get_url()
+  def __write_batch(self, pending_writes: List[PendingWrite]) -> None:
+    try:
+      with self.get_session() as session:
+        for pending_write in pending_writes:
+          self.__write_pending_write(session, pending_write)
+        session.commit()
+    except SQLAlchemyError:
+      # One bad row shouldn't cost the whole batch -- retry each write in its own transaction
+      logging.exception("Failed to write batch of %s. Retrying individually...", len(pending_writes))
+      for pending_write in pending_writes:
+        try:
+          with self.get_session() as session:
+            self.__write_pending_write(session, pending_write)
+            session.commit()
+        except SQLAlchemyError:
+          logging.exception("Failed to write job listing: %s", pending_write.key)
+
+  def __create_missing_indexes(self) -> bool:
+    # create_all() skips tables that already exist, so indexes added later have to be created separately
+    for index in [*JobListingORM.__table__.indexes, *ApplicationORM.__table__.indexes]:
+      try:
+        index.create(self.__engine, checkfirst=True)
+      except SQLAlchemyError:
+        logging.warning("Failed to create index: %s. Duplicate rows may need to be removed first.", index.name)
+        if index.unique:
+          return False
+    if self.__engine.dialect.name not in self.__UPSERT_DIALECTS:
+      logging.warning("Upserts are not supported for %s. Falling back to lookups.", self.__engine.dialect.name)
+      return False
+    return True
+
+  def __write_pending_write(self, session: Session, pending_write: PendingWrite) -> None:
+    if self.__supports_upsert:
+      self.__upsert_job_listing(session, pending_write)
+    else:
+      self.__merge_job_listing(session, pending_write)
+    if not pending_write.applications:
+      return
+    job_listing_values = pending_write.job_listing_values
+    job_listing_id = session.execute(
+      select(JobListingORM.id).filter_by(
+        **{column: job_listing_values[column] for column in self.__JOB_LISTING_NATURAL_KEY}
+      ).order_by(JobListingORM.id)
+    ).scalars().first()
+    for application_values in pending_write.applications:
+      self.__insert_application_if_missing(session, job_listing_id, application_values)
+
+  def __upsert_job_listing(self, session: Session, pending_write: PendingWrite) -> None:
+    job_listing_values = pending_write.job_listing_values
+    updated_columns = [
+      column for column in job_listing_values
+      if column not in self.__JOB_LISTING_NATURAL_KEY
+    ]
+    dialect_name = self.__engine.dialect.name
+    if dialect_name in ["mysql", "mariadb"]:
+      mysql_statement = mysql.insert(JobListingORM).values(**job_listing_values)
+      if pending_write.update_job_listing:
+        mysql_statement = mysql_statement.on_duplicate_key_update(
+          {column: mysql_statement.inserted[column] for column in updated_columns}
+        )
+      else:
+        mysql_statement = mysql_statement.on_duplicate_key_update(id=JobListingORM.id)
+      session.execute(mysql_statement)
+      return
+    insert_function = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    statement = insert_function(JobListingORM).values(**job_listing_values)
+    if pending_write.update_job_listing:
+      statement = statement.on_conflict_do_update(
+        index_elements=self.__JOB_LISTING_NATURAL_KEY,
+        set_={column: statement.excluded[column] for column in updated_columns}
+      )
+    else:
+      statement = statement.on_conflict_do_nothing(index_elements=self.__JOB_LISTING_NATURAL_KEY)
+    session.execute(statement)
+
+  def __merge_job_listing(self, session: Session, pending_write: PendingWrite) -> None:
+    job_listing_values = pending_write.job_listing_values
+    job_listing_orm = session.query(JobListingORM).filter_by(
+      **{column: job_listing_values[column] for column in self.__JOB_LISTING_NATURAL_KEY}
+    ).first()
+    if not job_listing_orm:
+      session.add(JobListingORM(**job_listing_values))
+      session.flush()
+    elif pending_write.update_job_listing:
+      for column, value in job_listing_values.items():
+        if getattr(job_listing_orm, column) != value:
+          setattr(job_listing_orm, column, value)
+      session.flush()
+
+  def __insert_application_if_missing(
+    self,
+    session: Session,
+    job_listing_id: int,
+    application_values: Dict[str, Any]
+  ) -> None:
+    # INSERT ... SELECT ... WHERE NOT EXISTS -- the duplicate check and insert run as one indexed statement
+    application_values = {"job_listing_id": job_listing_id, **application_values}
+    columns = list(application_values)
+    duplicate_check = and_(*[
+      getattr(ApplicationORM, column).is_(None) if value is None else getattr(ApplicationORM, column) == value
+      for column, value in application_values.items()
+    ])
+    statement = insert(ApplicationORM).from_select(
+      columns,
+      select(*[literal(application_values[column]) for column in columns]).where(
+        ~exists().where(duplicate_check)
+      )
     )
-    return job_listing_orm
+    session.execute(statement)
+
+  def __build_job_listing_key(self, job_listing: "JobListing", platform: Platform) -> Tuple[str, ...]:
+    return (
+      job_listing.get_title() or "",
+      job_listing.get_company() or "",
+      job_listing.get_location() or "",
+      platform.value
+    )
+
+  def __build_job_listing_values(self, job_listing: "JobListing", platform: Platform) -> Dict[str, Any]:
+    # Captured now since the listing keeps changing after it's handed to the writer thread
+    # NULLs never conflict on the natural key index, so its columns are stored as "" instead
+    return {
+      "job_title": job_listing.get_title() or "",
+      "company": job_listing.get_company() or "",
+      "location": job_listing.get_location() or "",
+      "min_pay": job_listing.get_min_pay(),
+      "max_pay": job_listing.get_max_pay(),
+      "min_yoe": job_listing.get_min_yoe(),
+      "max_yoe": job_listing.get_max_yoe(),
+      "description": job_listing.get_description(),
+      "platform": platform.value,
+      "url": job_listing.get_url()
+    }
@@ -0,0 +1,151 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+
+@dataclass
+class PendingWrite:
+  key: Tuple[str, ...]
+  job_listing_values: Dict[str, Any]
+  update_job_listing: bool
+  applications: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class DatabaseWriter:
+  __write_batch: Callable[[List[PendingWrite]], None]
+  __max_batch_size: int
+  __flush_interval: float
+  __key_queue: queue.Queue
+  __pending_writes: Dict[Tuple[str, ...], PendingWrite]
+  __lock: threading.Lock
+  __stop_event: threading.Event
+  __thread: threading.Thread
+  __flush_count: int
+  __written_count: int
+  __merged_count: int
+  __max_queue_depth: int
+  __total_flush_latency: float
+  __max_flush_latency: float
+
+  def __init__(
+    self,
+    write_batch: Callable[[List[PendingWrite]], None],
+    max_queue_size: int = 256,
+    max_batch_size: int = 50,
+    flush_interval: float = 1.0
+  ):
+    self.__write_batch = write_batch
+    self.__max_batch_size = max_batch_size
+    self.__flush_interval = flush_interval
+    self.__key_queue = queue.Queue(maxsize=max_queue_size)
+    self.__pending_writes = {}
+    self.__lock = threading.Lock()
+    self.__stop_event = threading.Event()
+    self.__flush_count = 0
+    self.__written_count = 0
+    self.__merged_count = 0
+    self.__max_queue_depth = 0
+    self.__total_flush_latency = 0.0
+    self.__max_flush_latency = 0.0
+    self.__thread = threading.Thread(target=self.__run, name="DatabaseWriter", daemon=True)
+    self.__thread.start()
+    atexit.register(self.close)
+
+  def submit_job_listing(self, key: Tuple[str, ...], job_listing_values: Dict[str, Any]) -> None:
+    self.__submit(key, job_listing_values, True, None)
+
+  def submit_application(
+    self,
+    key: Tuple[str, ...],
+    job_listing_values: Dict[str, Any],
+    application_values: Dict[str, Any]
+  ) -> None:
+    self.__submit(key, job_listing_values, False, application_values)
+
+  def flush(self) -> None:
+    if self.__thread.is_alive():
+      self.__key_queue.join()
+
+  def close(self) -> None:
+    if self.__stop_event.is_set():
+      return
+    self.flush()
+    self.__stop_event.set()
+    self.__thread.join()
+    self.log_metrics()
+
+  def get_queue_depth(self) -> int:
+    return self.__key_queue.qsize()
+
+  def log_metrics(self) -> None:
+    average_flush_latency = self.__total_flush_latency / self.__flush_count if self.__flush_count else 0.0
+    logging.info(
+      "Database writer: %s writes over %s flushes, %s merged, max queue depth: %s, flush latency avg: %.3fs max: %.3fs",
+      self.__written_count,
+      self.__flush_count,
+      self.__merged_count,
+      self.__max_queue_depth,
+      average_flush_latency,
+      self.__max_flush_latency
+    )
+
+  def __submit(
+    self,
+    key: Tuple[str, ...],
+    job_listing_values: Dict[str, Any],
+    update_job_listing: bool,
+    application_values: Dict[str, Any] | None
+  ) -> None:
+    assert not self.__stop_event.is_set(), "Database writer is closed"
+    with self.__lock:
+      pending_write = self.__pending_writes.get(key)
+      if pending_write:
+        # Still waiting on the writer thread -- fold this write into the pending one
+        if update_job_listing:
+          pending_write.job_listing_values = job_listing_values
+          pending_write.update_job_listing = True
+        if application_values:
+          pending_write.applications.append(application_values)
+        self.__merged_count += 1
+        return
+      self.__pending_writes[key] = PendingWrite(
+        key=key,
+        job_listing_values=job_listing_values,
+        update_job_listing=update_job_listing,
+        applications=[application_values] if application_values else []
+      )
+    # Blocks when the queue is full so the browser loop can't outrun the database indefinitely
+    self.__key_queue.put(key)
+    self.__max_queue_depth = max(self.__max_queue_depth, self.__key_queue.qsize())
+
+  def __run(self) -> None:
+    while not self.__stop_event.is_set():
+      try:
+        keys = [self.__key_queue.get(timeout=self.__flush_interval)]
+      except queue.Empty:
+        continue
+      while len(keys) < self.__max_batch_size:
+        try:
+          keys.append(self.__key_queue.get_nowait())
+        except queue.Empty:
+          break
+      with self.__lock:
+        batch = [self.__pending_writes.pop(key) for key in keys]
+      start_time = time.time()
+      try:
+        self.__write_batch(batch)
+        self.__written_count += len(batch)
+      except Exception:
+        logging.exception("Failed to write %s pending writes to the database.", len(batch))
+      finally:
+        flush_latency = time.time() - start_time
+        self.__flush_count += 1
+        self.__total_flush_latency += flush_latency
+        self.__max_flush_latency = max(self.__max_flush_latency, flush_latency)
+        logging.debug("Flushed %s pending writes to the database in %.3fs", len(batch), flush_latency)
+        for _ in keys:
+          self.__key_queue.task_done()
@@ -1,43 +1,150 @@
 import imaplib
 import email
+import logging
 import os
-from email.header import decode_header
 import re
+import select
+import ssl
 import time
+from email.header import decode_header, make_header
+from email.utils import parseaddr
 
 
 class EmailHandler:
+  # One connection stays logged in and waits in IDLE, so the server says when mail arrives instead of being searched
+  # over and over. Waits are cut into short stretches that each end with a fresh search, in case a wakeup is missed.
+  __INDEED_SENDER = "indeed"
+  __IDLE_TAG = b"IDLE1"
+  __IDLE_REFRESH = 3.0
+  __MIN_READ_TIMEOUT = 1.0
+  __host: str
+  __port: int
+  __use_ssl: bool
+  __imap: imaplib.IMAP4 | None
+
+  def __init__(self, host="imap.mail.com", port=993, use_ssl=True):
+    self.__host = host
+    self.__port = port
+    self.__use_ssl = use_ssl
+    self.__imap = None
 
   def get_indeed_one_time_code_from_mdc(self, timeout=10) -> str:
+    deadline = time.time() + timeout
+    while True:
+      try:
+        imap = self.__get_connection(deadline)
+        # Every blocking read is bounded by what's left of the wait, so a server that goes quiet can't hang it
+        imap.sock.settimeout(self.__get_read_timeout(deadline))
+        code = self.__find_one_time_code(imap, self.__INDEED_SENDER)
+        if code:
+          return code
+        if deadline - time.time() > 0:
+          self.__idle(imap, deadline)
+      except (imaplib.IMAP4.abort, OSError):
+        logging.warning("Lost the IMAP connection. Reconnecting...")
+        self.__drop_connection()
+        time.sleep(min(max(deadline - time.time(), 0), 1))
+      if time.time() >= deadline:
+        raise TimeoutError("Timed out waiting for one-time code.")
+
+  def close(self) -> None:
+    if self.__imap is None:
+      return
+    try:
+      self.__imap.logout()
+    except (imaplib.IMAP4.error, OSError):
+      pass
+    self.__imap = None
+
+  def __drop_connection(self) -> None:
+    if self.__imap is None:
+      return
+    try:
+      self.__imap.shutdown()
+    except OSError:
+      pass
+    self.__imap = None
+
+  def __get_connection(self, deadline: float) -> imaplib.IMAP4:
+    if self.__imap is not None:
+      return self.__imap
     USERNAME = os.getenv("MAIL_DOT_COM_EMAIL")
     PASSWORD = os.getenv("MAIL_DOT_COM_PASS")
     assert USERNAME
     assert PASSWORD
-
-    imap = imaplib.IMAP4_SSL("imap.mail.com")
+    if self.__use_ssl:
+      imap = imaplib.IMAP4_SSL(self.__host, self.__port, timeout=self.__get_read_timeout(deadline))
+    else:
+      imap = imaplib.IMAP4(self.__host, self.__port, timeout=self.__get_read_timeout(deadline))
     imap.login(USERNAME, PASSWORD)
     imap.select("INBOX")
+    self.__imap = imap
+    return imap
 
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      _, raw_ids = imap.search(None, 'UNSEEN')
-      email_ids = raw_ids[0].split()
-      if email_ids:
-        latest_id = email_ids[-1]
-        _, msg_data = imap.fetch(latest_id, "(RFC822)")
-        raw_email = msg_data[0][1] if msg_data and msg_data[0] else None
-
-        if isinstance(raw_email, bytes):
-          msg = email.message_from_bytes(raw_email)
-          subject, encoding = decode_header(msg["Subject"])[0]
-          if isinstance(subject, bytes):
-            subject = subject.decode(encoding or "utf-8")
-          raw_code = re.search(r"[0-9]+", subject)
-          assert raw_code
-          code = raw_code.group()
-          imap.store(latest_id, '+FLAGS', '\\Deleted')
-          imap.expunge()
-          imap.logout()
-          return code
-    imap.logout()
-    raise TimeoutError("Timed out waiting for one-time code.")
+  def __find_one_time_code(self, imap: imaplib.IMAP4, sender: str) -> str | None:
+    _, raw_uids = imap.uid("SEARCH", "UNSEEN", "FROM", f'"{sender}"')
+    for uid in reversed(raw_uids[0].split()):   # Newest first -- older codes have likely expired
+      _, msg_data = imap.uid("FETCH", uid, "(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT)])")
+      raw_headers = msg_data[0][1] if msg_data and isinstance(msg_data[0], tuple) else None
+      if not isinstance(raw_headers, bytes):
+        continue
+      msg = email.message_from_bytes(raw_headers)
+      if sender not in parseaddr(msg["From"] or "")[1].lower():
+        continue
+      subject = str(make_header(decode_header(msg["Subject"] or "")))
+      raw_code = re.search(r"[0-9]+", subject)
+      if not raw_code:
+        continue
+      imap.uid("STORE", uid, "+FLAGS", "(\\Deleted)")
+      imap.expunge()
+      return raw_code.group()
+    return None
+
+  def __get_read_timeout(self, deadline: float) -> float:
+    # Past the deadline a response that's already on its way still gets a moment to arrive
+    return max(deadline - time.time(), self.__MIN_READ_TIMEOUT)
+
+  def __idle(self, imap: imaplib.IMAP4, deadline: float) -> None:
+    # imaplib has no IDLE here, so it's spoken over the connection directly and always ended before imaplib reads again
+    idle_deadline = min(deadline, time.time() + self.__IDLE_REFRESH)
+    imap.send(self.__IDLE_TAG + b" IDLE\r\n")
+    if not imap.readline().startswith(b"+"):
+      # IDLE was refused -- the refresh interval turns this into a slow poll
+      time.sleep(max(idle_deadline - time.time(), 0))
+      return
+    try:
+      while self.__wait_for_data(imap, idle_deadline - time.time()):
+        line = imap.readline()
+        if not line:
+          raise imaplib.IMAP4.abort("The IMAP server closed the connection.")
+        if line.rstrip().endswith(b"EXISTS"):
+          return
+    finally:
+      imap.send(b"DONE\r\n")
+      imap.sock.settimeout(self.__get_read_timeout(deadline))
+      while True:
+        line = imap.readline()
+        if not line:
+          raise imaplib.IMAP4.abort("The IMAP server closed the connection.")
+        if line.startswith(self.__IDLE_TAG):
+          break
+
+  def __wait_for_data(self, imap: imaplib.IMAP4, timeout: float) -> bool:
+    if timeout <= 0:
+      return False
+    if self.__has_buffered_data(imap):
+      return True
+    readable, _, _ = select.select([imap.sock], [], [], timeout)
+    return bool(readable)
+
+  def __has_buffered_data(self, imap: imaplib.IMAP4) -> bool:
+    # readline() reads ahead, so a line that came in the same packet as the last one is already off the socket where
+    # select() can't see it. A non-blocking peek finds it, or what TLS has decrypted but not handed over yet.
+    read_timeout = imap.sock.gettimeout()
+    imap.sock.setblocking(False)
+    try:
+      return bool(imap.file.peek(1))
+    except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+      return False
+    finally:
+      imap.sock.settimeout(read_timeout)
@@ -0,0 +1,120 @@
+import json
+import re
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+import undetected_chromedriver as uc
+from bs4 import BeautifulSoup
+
+
+class GlassdoorPageStateExtractor:
+  # Search results are serialized into the page's Next.js data and Apollo cache as "jobview" objects.
+  # The tree is searched for them rather than walked by path, since the path moves between page versions.
+  __APOLLO_STATE_MARKER = re.compile(r"window\.__APOLLO_STATE__\s*=\s*")
+  __GET_PAGE_STATE_JS = """
+    const nextDataScript = document.getElementById('__NEXT_DATA__');
+    try {
+      return JSON.stringify({
+        nextData: window.__NEXT_DATA__ || (nextDataScript ? JSON.parse(nextDataScript.textContent) : null),
+        apolloState: window.__APOLLO_STATE__ || null
+      });
+    } catch (e) {
+      return null;
+    }
+  """
+  __PAY_PERIODS_PER_YEAR = {
+    "annual": 1,
+    "monthly": 12,
+    "weekly": 52,
+    "daily": 260,
+    "hourly": 2080
+  }
+
+  def get_job_cards(self, driver: uc.Chrome) -> List[Dict[str, Any]] | None:
+    raw_page_state = driver.execute_script(self.__GET_PAGE_STATE_JS)
+    if not raw_page_state:
+      return None
+    return self.__build_job_cards(json.loads(raw_page_state), driver.current_url)
+
+  def get_job_cards_from_html(self, page_html: str, page_url: str) -> List[Dict[str, Any]] | None:
+    page_state: Dict[str, Any] = {"nextData": None, "apolloState": None}
+    next_data_script = BeautifulSoup(page_html, "html.parser").find("script", id="__NEXT_DATA__")
+    if next_data_script and next_data_script.string:
+      try:
+        page_state["nextData"] = json.loads(next_data_script.string)
+      except json.JSONDecodeError:
+        pass
+    match = self.__APOLLO_STATE_MARKER.search(page_html)
+    if match:
+      try:
+        page_state["apolloState"], _ = json.JSONDecoder().raw_decode(page_html, match.end())
+      except json.JSONDecodeError:
+        pass
+    return self.__build_job_cards(page_state, page_url)
+
+  def __build_job_cards(self, page_state: Dict[str, Any], page_url: str) -> List[Dict[str, Any]] | None:
+    job_views: List[Dict[str, Any]] = []
+    self.__find_job_views(page_state, job_views)
+    if not job_views:
+      return None
+    job_cards = []
+    seen_listing_ids = set()
+    for job_view in job_views:
+      job_card = self.__build_job_card(job_view, page_url)
+      if job_card and job_card["listing_id"] not in seen_listing_ids:
+        seen_listing_ids.add(job_card["listing_id"])
+        job_cards.append(job_card)
+    return job_cards
+
+  def __find_job_views(self, node: Any, job_views: List[Dict[str, Any]]) -> None:
+    if isinstance(node, dict):
+      job_view = node.get("jobview")
+      if isinstance(job_view, dict) and isinstance(job_view.get("header"), dict):
+        job_views.append(job_view)
+        return
+      for value in node.values():
+        self.__find_job_views(value, job_views)
+    elif isinstance(node, list):
+      for value in node:
+        self.__find_job_views(value, job_views)
+
+  def __build_job_card(self, job_view: Dict[str, Any], page_url: str) -> Dict[str, Any] | None:
+    header = job_view["header"]
+    job = job_view.get("job") if isinstance(job_view.get("job"), dict) else {}
+    employer = header.get("employer") if isinstance(header.get("employer"), dict) else {}
+    title = header.get("jobTitleText") or job.get("jobTitleText")
+    company = header.get("employerNameFromSearch") or employer.get("name")
+    job_link = header.get("jobLink")
+    if not title or not company or not job_link:
+      return None
+    url = urljoin(page_url, job_link)
+    listing_id = job.get("listingId") or parse_qs(urlparse(url).query).get("jl", [None])[0]
+    if not listing_id:
+      return None
+    min_pay, max_pay = self.__get_annual_pay(header)
+    rating = header.get("rating")
+    return {
+      "listing_id": str(listing_id),
+      "title": title.strip(),
+      "company": company.strip(),
+      "location": (header.get("locationName") or "").strip(),
+      "url": url,
+      "min_pay": min_pay,
+      "max_pay": max_pay,
+      "company_rating": float(rating) if rating else None,
+      "easy_apply": header.get("easyApply")
+    }
+
+  def __get_annual_pay(self, header: Dict[str, Any]) -> Tuple[float | None, float | None]:
+    adjusted_pay = header.get("payPeriodAdjustedPay")
+    if not isinstance(adjusted_pay, dict):
+      return None, None
+    periods_per_year = self.__PAY_PERIODS_PER_YEAR.get(str(header.get("payPeriod")).lower())
+    if periods_per_year is None:
+      return None, None
+    # p10 to p90 is the range Glassdoor itself shows as the pay estimate
+    min_pay = adjusted_pay.get("p10")
+    max_pay = adjusted_pay.get("p90")
+    return (
+      float(min_pay) * periods_per_year if min_pay else None,
+      float(max_pay) * periods_per_year if max_pay else None
+    )
@@ -0,0 +1,112 @@
+import json
+import re
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse
+import undetected_chromedriver as uc
+
+
+class IndeedPageDataExtractor:
+  # Indeed ships the data it renders as inline script state -- reading that skips the DOM and its XPaths entirely.
+  # Every getter returns None when the state isn't there, so callers can fall back to the DOM.
+  __JOB_CARDS_MARKER = re.compile(r"window\.mosaic\.providerData\[[\"']mosaic-provider-jobcards[\"']\]\s*=\s*")
+  __INITIAL_DATA_MARKER = re.compile(r"window\._initialData\s*=\s*")
+  __GET_JOB_CARD_RESULTS_JS = """
+    try {
+      return window.mosaic.providerData['mosaic-provider-jobcards'].metaData.mosaicProviderJobCardsModel.results;
+    } catch (e) {
+      return null;
+    }
+  """
+  __GET_JOB_DESCRIPTION_JS = """
+    try {
+      return window._initialData.jobInfoWrapperModel.jobInfoModel.sanitizedJobDescription;
+    } catch (e) {
+      return null;
+    }
+  """
+  __PAY_PERIODS_PER_YEAR = {
+    "yearly": 1,
+    "monthly": 12,
+    "weekly": 52,
+    "daily": 260,
+    "hourly": 2080
+  }
+
+  def get_job_cards(self, driver: uc.Chrome) -> List[Dict[str, Any]] | None:
+    results = driver.execute_script(self.__GET_JOB_CARD_RESULTS_JS)
+    return self.__build_job_cards(results, driver.current_url)
+
+  def get_job_cards_from_html(self, page_html: str, page_url: str) -> List[Dict[str, Any]] | None:
+    job_cards_data = self.__parse_script_state(page_html, self.__JOB_CARDS_MARKER)
+    try:
+      results = job_cards_data["metaData"]["mosaicProviderJobCardsModel"]["results"]
+    except (KeyError, TypeError):
+      return None
+    return self.__build_job_cards(results, page_url)
+
+  def get_job_description_html(self, driver: uc.Chrome) -> str | None:
+    return self.__get_description_content(driver.execute_script(self.__GET_JOB_DESCRIPTION_JS))
+
+  def get_job_description_html_from_html(self, page_html: str) -> str | None:
+    initial_data = self.__parse_script_state(page_html, self.__INITIAL_DATA_MARKER)
+    try:
+      sanitized_job_description = initial_data["jobInfoWrapperModel"]["jobInfoModel"]["sanitizedJobDescription"]
+    except (KeyError, TypeError):
+      return None
+    return self.__get_description_content(sanitized_job_description)
+
+  def __build_job_cards(self, results: Any, page_url: str) -> List[Dict[str, Any]] | None:
+    if not isinstance(results, list):
+      return None
+    parsed_url = urlparse(page_url)
+    job_cards = []
+    for result in results:
+      if not isinstance(result, dict):
+        continue
+      job_key = result.get("jobkey")
+      title = result.get("displayTitle") or result.get("title")
+      company = result.get("company")
+      if not job_key or not title or not company:
+        continue
+      min_pay, max_pay = self.__get_annual_pay(result.get("extractedSalary"))
+      job_cards.append({
+        "job_key": job_key,
+        "title": title.strip(),
+        "company": company.strip(),
+        "location": (result.get("formattedLocation") or "").strip(),
+        "url": f"{parsed_url.scheme}://{parsed_url.netloc}/viewjob?jk={job_key}",
+        "min_pay": min_pay,
+        "max_pay": max_pay,
+        "applied": bool(result.get("applied"))
+      })
+    return job_cards
+
+  def __get_annual_pay(self, extracted_salary: Any) -> Tuple[float | None, float | None]:
+    if not isinstance(extracted_salary, dict):
+      return None, None
+    periods_per_year = self.__PAY_PERIODS_PER_YEAR.get(str(extracted_salary.get("type")).lower())
+    if periods_per_year is None:
+      return None, None
+    min_pay = extracted_salary.get("min")
+    max_pay = extracted_salary.get("max")
+    return (
+      float(min_pay) * periods_per_year if min_pay else None,
+      float(max_pay) * periods_per_year if max_pay else None
+    )
+
+  def __get_description_content(self, sanitized_job_description: Any) -> str | None:
+    if isinstance(sanitized_job_description, dict):
+      sanitized_job_description = sanitized_job_description.get("content")
+    if isinstance(sanitized_job_description, str) and sanitized_job_description.strip():
+      return sanitized_job_description
+    return None
+
+  def __parse_script_state(self, page_html: str, marker: re.Pattern) -> Any:
+    match = marker.search(page_html)
+    if match is None:
+      return None
+    try:
+      state, _ = json.JSONDecoder().raw_decode(page_html, match.end())
+    except json.JSONDecodeError:
+      return None
+    return state
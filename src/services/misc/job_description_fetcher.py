@@ -0,0 +1,63 @@
+import logging
+from typing import Any, Dict, List
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from models.configs.system_config import ProxyConfig
+
+
+class JobDescriptionFetcher:
+  # Reads job descriptions straight off the job view pages, skipping the browser's tab and render entirely.
+  # Shared by the pipeline's filter workers -- the connection pool is sized so each one keeps a connection alive.
+  __session: requests.Session
+  __timeout: float
+
+  def __init__(self, max_connections=4, timeout=10.0, proxy_config: ProxyConfig | None = None):
+    self.__session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+    self.__session.mount("http://", adapter)
+    self.__session.mount("https://", adapter)
+    if proxy_config:
+      # Same exit as the browser the cookies came from -- socks5h resolves hosts on the proxy, like Chrome does
+      proxy_url = f"socks5h://{proxy_config.host}:{proxy_config.port}"
+      self.__session.proxies = {"http": proxy_url, "https": proxy_url}
+    self.__timeout = timeout
+
+  def sync_session(self, user_agent: str, cookies: List[Dict[str, Any]]) -> None:
+    self.__session.headers["User-Agent"] = user_agent
+    for cookie in cookies:
+      self.__session.cookies.set(
+        cookie["name"],
+        cookie["value"],
+        domain=cookie.get("domain", ""),
+        path=cookie.get("path", "/")
+      )
+
+  def fetch_description_html(self, url: str, description_selector: str) -> str | None:
+    page_html = self.fetch_html(url)
+    if page_html is None:
+      return None
+    description_html = self.select_inner_html(page_html, description_selector)
+    if description_html is None:
+      logging.debug("No job description found at: %s", url)
+    return description_html
+
+  def fetch_html(self, url: str) -> str | None:
+    try:
+      response = self.__session.get(url, timeout=self.__timeout)
+    except requests.RequestException as e:
+      logging.debug("Failed to fetch: %s -- %s", url, e)
+      return None
+    if response.status_code != 200:
+      logging.debug("Failed to fetch: %s -- HTTP %s", url, response.status_code)
+      return None
+    return response.text
+
+  def select_inner_html(self, page_html: str, selector: str) -> str | None:
+    element = BeautifulSoup(page_html, "html.parser").select_one(selector)
+    if element is None:
+      return None
+    return element.decode_contents()
+
+  def close(self) -> None:
+    self.__session.close()
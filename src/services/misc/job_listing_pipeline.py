@@ -0,0 +1,286 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+
+@dataclass
+class PipelineStageMetrics:
+  name: str
+  processed: int = 0
+  dropped: int = 0
+  failed: int = 0
+  max_queue_depth: int = 0
+  blocked_time: float = 0.0
+  busy_time: float = 0.0
+
+
+@dataclass
+class ApplyStage:
+  apply: Callable[[Any], None]
+  # Starts loading an item that's coming up -- called from the same thread as apply
+  prefetch: Callable[[Any], None] | None = None
+
+
+class JobListingPipeline:
+  # Discovery (the caller) -> filter thread -> apply workers, each hop a bounded queue.
+  # A full queue blocks the stage feeding it, so discovery can never run further ahead than the queues allow.
+  __STOP = object()
+  __POLL_INTERVAL = 0.1
+  __name: str
+  __filter_stage: Callable[[Any], bool]
+  __apply_stage: ApplyStage
+  __look_ahead: int
+  __filter_queue: queue.Queue
+  __apply_queue: queue.Queue
+  __filter_threads: List[threading.Thread]
+  __apply_threads: List[threading.Thread]
+  __metrics: Dict[str, PipelineStageMetrics]
+  __metrics_lock: threading.Lock
+  __in_flight: int
+  __condition: threading.Condition
+  __closing: threading.Event
+
+  def __init__(
+    self,
+    name: str,
+    filter_stage: Callable[[Any], bool],
+    apply_stage: ApplyStage,
+    apply_worker_stages: List[ApplyStage] | None = None,
+    max_queue_size: int = 20,
+    look_ahead: int = 0,
+    filter_workers: int = 1
+  ):
+    self.__name = name
+    self.__filter_stage = filter_stage
+    self.__apply_stage = apply_stage
+    self.__look_ahead = look_ahead
+    self.__filter_queue = queue.Queue(maxsize=max_queue_size)
+    self.__apply_queue = queue.Queue(maxsize=max_queue_size)
+    self.__metrics = {
+      "discovery": PipelineStageMetrics("discovery"),
+      "filter": PipelineStageMetrics("filter"),
+      "apply": PipelineStageMetrics("apply"),
+      "prefetch": PipelineStageMetrics("prefetch")
+    }
+    self.__metrics_lock = threading.Lock()
+    self.__in_flight = 0
+    self.__condition = threading.Condition()
+    self.__closing = threading.Event()
+    self.__filter_threads = []
+    for i in range(max(filter_workers, 1)):
+      filter_thread = threading.Thread(target=self.__run_filter_stage, name=f"{name}Filter{i + 1}", daemon=True)
+      filter_thread.start()
+      self.__filter_threads.append(filter_thread)
+    self.__apply_threads = []
+    for i, apply_worker_stage in enumerate(apply_worker_stages or []):
+      apply_thread = threading.Thread(
+        target=self.__run_apply_worker,
+        args=(apply_worker_stage,),
+        name=f"{name}Apply{i + 1}",
+        daemon=True
+      )
+      apply_thread.start()
+      self.__apply_threads.append(apply_thread)
+
+  def submit(self, item: Any) -> None:
+    with self.__condition:
+      self.__in_flight += 1
+    start_time = time.time()
+    while True:
+      if not self.__apply_threads and self.__filter_queue.full():
+        # Nobody else can apply -- discovery does it until there's room again
+        self.__apply_ready_items()
+      try:
+        self.__filter_queue.put(item, timeout=self.__POLL_INTERVAL)
+        break
+      except queue.Full:
+        pass
+    self.__record("discovery", processed=1, blocked_time=time.time() - start_time)
+    self.__record_queue_depth("filter", self.__filter_queue)
+
+  def drain(self) -> None:
+    # Returns once every submitted item has been dropped or applied to
+    while True:
+      if not self.__apply_threads:
+        self.__apply_ready_items()
+      with self.__condition:
+        if self.__in_flight == 0:
+          return
+        self.__condition.wait(timeout=self.__POLL_INTERVAL)
+
+  def close(self) -> None:
+    # Anything still in flight wasn't drained (discovery bailed out) and is discarded
+    self.__closing.set()
+    for _ in self.__filter_threads:
+      self.__filter_queue.put(self.__STOP)
+    for _ in self.__apply_threads:
+      self.__apply_queue.put(self.__STOP)
+    for filter_thread in self.__filter_threads:
+      filter_thread.join()
+    for apply_thread in self.__apply_threads:
+      apply_thread.join()
+    self.log_metrics()
+
+  def get_queue_depths(self) -> Dict[str, int]:
+    return {
+      "filter": self.__filter_queue.qsize(),
+      "apply": self.__apply_queue.qsize()
+    }
+
+  def get_metrics(self) -> List[PipelineStageMetrics]:
+    with self.__metrics_lock:
+      return [PipelineStageMetrics(**vars(metrics)) for metrics in self.__metrics.values()]
+
+  def log_metrics(self) -> None:
+    for metrics in self.get_metrics():
+      logging.info(
+        "%s pipeline %s: %s processed, %s dropped, %s failed, max queue depth: %s, blocked: %.3fs, busy: %.3fs",
+        self.__name,
+        metrics.name,
+        metrics.processed,
+        metrics.dropped,
+        metrics.failed,
+        metrics.max_queue_depth,
+        metrics.blocked_time,
+        metrics.busy_time
+      )
+
+  def __run_filter_stage(self) -> None:
+    while True:
+      item = self.__filter_queue.get()
+      if item is self.__STOP:
+        return
+      if self.__closing.is_set():
+        self.__finish_item()
+        continue
+      start_time = time.time()
+      failed = 0
+      try:
+        passed = self.__filter_stage(item)
+      except Exception:
+        logging.exception("%s pipeline filter stage failed. Dropping the item...", self.__name)
+        failed = 1
+        passed = False
+      self.__record(
+        "filter",
+        processed=1,
+        dropped=0 if passed else 1,
+        failed=failed,
+        busy_time=time.time() - start_time
+      )
+      if not passed:
+        self.__finish_item()
+        continue
+      start_time = time.time()
+      while not self.__closing.is_set():
+        try:
+          self.__apply_queue.put(item, timeout=self.__POLL_INTERVAL)
+          break
+        except queue.Full:
+          pass
+      else:
+        self.__finish_item()
+      self.__record("filter", blocked_time=time.time() - start_time)
+      self.__record_queue_depth("apply", self.__apply_queue)
+
+  def __run_apply_worker(self, apply_stage: ApplyStage) -> None:
+    look_ahead_items: deque = deque()
+    stopping = False
+    while look_ahead_items or not stopping:
+      if not look_ahead_items:
+        item = self.__apply_queue.get()
+        if item is self.__STOP:
+          return
+        look_ahead_items.append(item)
+      if not stopping:
+        stopping = self.__fill_look_ahead(apply_stage, look_ahead_items)
+      item = look_ahead_items.popleft()
+      if self.__closing.is_set():
+        self.__finish_item()
+        continue
+      try:
+        self.__apply(apply_stage, item)
+      except Exception:
+        logging.exception("%s pipeline apply stage failed. Moving on to the next item...", self.__name)
+
+  def __apply_ready_items(self) -> None:
+    look_ahead_items: deque = deque()
+    while True:
+      if not look_ahead_items:
+        try:
+          look_ahead_items.append(self.__apply_queue.get_nowait())
+        except queue.Empty:
+          return
+      self.__fill_look_ahead(self.__apply_stage, look_ahead_items)
+      try:
+        self.__apply(self.__apply_stage, look_ahead_items.popleft())
+      except Exception:
+        # The reserved items won't be applied to now -- hand them back as finished so drain() can't hang on them
+        for _ in look_ahead_items:
+          self.__finish_item()
+        raise
+
+  def __fill_look_ahead(self, apply_stage: ApplyStage, look_ahead_items: deque) -> bool:
+    # Reserves up to look_ahead items behind the current one and starts loading them. Returns whether STOP came up.
+    if apply_stage.prefetch is None:
+      return False
+    while len(look_ahead_items) <= self.__look_ahead:
+      try:
+        item = self.__apply_queue.get_nowait()
+      except queue.Empty:
+        return False
+      if item is self.__STOP:
+        return True
+      look_ahead_items.append(item)
+      start_time = time.time()
+      try:
+        apply_stage.prefetch(item)
+        self.__record("prefetch", processed=1)
+      except Exception:
+        logging.exception("%s pipeline prefetch stage failed. The item will load when it's applied to...", self.__name)
+        self.__record("prefetch", failed=1)
+      self.__record("prefetch", busy_time=time.time() - start_time)
+    return False
+
+  def __apply(self, apply_stage: ApplyStage, item: Any) -> None:
+    start_time = time.time()
+    try:
+      apply_stage.apply(item)
+      self.__record("apply", processed=1)
+    except Exception:
+      self.__record("apply", failed=1)
+      raise
+    finally:
+      self.__record("apply", busy_time=time.time() - start_time)
+      self.__finish_item()
+
+  def __finish_item(self) -> None:
+    with self.__condition:
+      self.__in_flight -= 1
+      self.__condition.notify_all()
+
+  def __record(
+    self,
+    name: str,
+    processed=0,
+    dropped=0,
+    failed=0,
+    blocked_time=0.0,
+    busy_time=0.0
+  ) -> None:
+    with self.__metrics_lock:
+      metrics = self.__metrics[name]
+      metrics.processed += processed
+      metrics.dropped += dropped
+      metrics.failed += failed
+      metrics.blocked_time += blocked_time
+      metrics.busy_time += busy_time
+
+  def __record_queue_depth(self, name: str, some_queue: queue.Queue) -> None:
+    with self.__metrics_lock:
+      metrics = self.__metrics[name]
+      metrics.max_queue_depth = max(metrics.max_queue_depth, some_queue.qsize())
@@ -1,19 +1,91 @@
-import time
-import langid
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, List
 from models.enums.language import Language
 
 class LanguageParser:
-  def __init__(self):
-    langid.set_languages(['en', 'es', 'fr'])
+  __LANGUAGES = {
+    "en": Language.ENGLISH,
+    "es": Language.SPANISH,
+    "fr": Language.FRENCH
+  }
+  __ENGLISH_STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "have", "in", "is", "it", "of", "on",
+    "or", "our", "that", "the", "this", "to", "we", "will", "with", "you", "your"
+  ])
+  __FOREIGN_STOPWORDS = frozenset([
+    "al", "avec", "con", "dans", "de", "del", "des", "du", "el", "en", "es", "est", "et", "la", "las", "le",
+    "les", "los", "nous", "para", "por", "pour", "que", "qui", "sur", "un", "una", "une", "vous", "y"
+  ])
+  # Most listings are English -- a shaky guess from the model shouldn't be enough to drop one
+  __MIN_CONFIDENCE = 0.8
+  __word_regex = re.compile(r"[a-z]+")
+  __identifier: Any = None
+  __cache: OrderedDict
+  __cache_size: int
+  __lock: threading.Lock
+
+  def __init__(self, cache_size=4096):
+    self.__cache = OrderedDict()
+    self.__cache_size = cache_size
+    self.__lock = threading.Lock()
 
   def get_language(self, string: str) -> Language:
-    lang_code = langid.classify("Senior Software Engineer")[0]
-    if lang_code == "en":
+    return self.get_languages([string])[0]
+
+  def get_languages(self, strings: List[str]) -> List[Language]:
+    keys = [hashlib.blake2b(string.encode("utf-8"), digest_size=16).digest() for string in strings]
+    languages: List[Language | None] = []
+    with self.__lock:
+      for key in keys:
+        language = self.__cache.get(key)
+        if language is not None:
+          self.__cache.move_to_end(key)
+        languages.append(language)
+    for i, string in enumerate(strings):
+      if languages[i] is None:
+        languages[i] = self.__classify(string)
+    with self.__lock:
+      for key, language in zip(keys, languages):
+        assert language
+        self.__cache[key] = language
+        self.__cache.move_to_end(key)
+      while len(self.__cache) > self.__cache_size:
+        self.__cache.popitem(last=False)
+    return [language for language in languages if language]
+
+  def __classify(self, string: str) -> Language:
+    if self.__is_obviously_english(string):
       return Language.ENGLISH
-    input("Not english")
-    if lang_code == "es":
-      return Language.SPANISH
-    elif lang_code == "fr":
-      return Language.FRENCH
-    else:
-      return Language.UNKNOWN
+    lang_code, confidence = self.__get_identifier().classify(string)
+    language = self.__LANGUAGES.get(lang_code, Language.UNKNOWN)
+    if language != Language.ENGLISH and confidence < self.__MIN_CONFIDENCE:
+      logging.debug("Low confidence (%.2f) that text is %s. Treating it as english.", confidence, lang_code)
+      return Language.ENGLISH
+    return language
+
+  def __is_obviously_english(self, string: str) -> bool:
+    if not string.isascii():
+      return False
+    english_count = 0
+    foreign_count = 0
+    for word in self.__word_regex.findall(string.lower()):
+      if word in self.__ENGLISH_STOPWORDS:
+        english_count += 1
+      elif word in self.__FOREIGN_STOPWORDS:
+        foreign_count += 1
+    # Card text often has no stopwords at all -- that's no evidence either way, so the model decides
+    return english_count > foreign_count
+
+  def __get_identifier(self) -> Any:
+    # langid pulls in numpy and unpacks its model, so that's put off until something actually needs it
+    with self.__lock:
+      if LanguageParser.__identifier is None:
+        from langid.langid import LanguageIdentifier, model   # pylint: disable=import-outside-toplevel
+        identifier = LanguageIdentifier.from_modelstring(model, norm_probs=True)
+        identifier.set_languages(list(self.__LANGUAGES))
+        LanguageParser.__identifier = identifier
+      return LanguageParser.__identifier
@@ -0,0 +1,118 @@
+import base64
+import html
+import json
+import logging
+import re
+import threading
+from typing import Any, Dict
+import undetected_chromedriver as uc
+from selenium.common.exceptions import WebDriverException
+from services.misc.cdp_event_bus import CdpEvent, CdpEventBus
+
+
+class LinkedinNetworkCapture:
+  # The search UI loads its cards and postings as JSON from the voyager API. The event bus reports those
+  # responses and their bodies are read back over CDP, so descriptions get indexed by job id as they
+  # stream in rather than read off the page after clicking each card.
+  __VOYAGER_API_URL = re.compile(r"^https://www\.linkedin\.com/voyager/api/")
+  __JOB_URN = re.compile(r"^urn:li:\w*?job(?:Posting|Description):(\d+)$", re.IGNORECASE)
+  __driver: uc.Chrome
+  __event_bus: CdpEventBus
+  __pending_requests: Dict[str, str]
+  __finished_requests: Dict[str, str]
+  __job_descriptions: Dict[str, str]
+  __lock: threading.Lock
+
+  def __init__(self, driver: uc.Chrome, event_bus: CdpEventBus):
+    self.__driver = driver
+    self.__event_bus = event_bus
+    self.__pending_requests = {}
+    self.__finished_requests = {}
+    self.__job_descriptions = {}
+    self.__lock = threading.Lock()
+    event_bus.subscribe("Network.responseReceived", self.__on_response_received)
+    event_bus.subscribe("Network.loadingFinished", self.__on_loading_finished)
+    event_bus.subscribe("Network.loadingFailed", self.__on_loading_failed)
+
+  def capture(self) -> None:
+    # Bodies are read over the driver, so this belongs on the thread driving the browser
+    self.__event_bus.drain()
+    with self.__lock:
+      finished_requests = self.__finished_requests
+      self.__finished_requests = {}
+    for request_id, url in finished_requests.items():
+      try:
+        body = self.__driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+      except WebDriverException:
+        # Bodies only live as long as their tab and Chrome's buffer -- the page still has the data
+        logging.debug("Response body is gone for: %s", url)
+        continue
+      self.__index_response_body(body["body"], body.get("base64Encoded", False))
+
+  def index_har(self, har: Dict[str, Any]) -> None:
+    # Replays responses recorded in a HAR file, the same way they'd be captured live
+    for entry in har["log"]["entries"]:
+      if not self.__VOYAGER_API_URL.match(entry["request"]["url"]):
+        continue
+      content = entry["response"].get("content", {})
+      if "json" in content.get("mimeType", "") and content.get("text"):
+        self.__index_response_body(content["text"], content.get("encoding") == "base64")
+
+  def get_job_description_html(self, job_id: str) -> str | None:
+    with self.__lock:
+      return self.__job_descriptions.get(job_id)
+
+  def get_job_description_count(self) -> int:
+    with self.__lock:
+      return len(self.__job_descriptions)
+
+  def __on_response_received(self, event: CdpEvent) -> None:
+    response = event.params["response"]
+    if self.__VOYAGER_API_URL.match(response["url"]) and "json" in response.get("mimeType", ""):
+      with self.__lock:
+        self.__pending_requests[event.params["requestId"]] = response["url"]
+
+  def __on_loading_finished(self, event: CdpEvent) -> None:
+    with self.__lock:
+      url = self.__pending_requests.pop(event.params["requestId"], None)
+      if url is not None:
+        self.__finished_requests[event.params["requestId"]] = url
+
+  def __on_loading_failed(self, event: CdpEvent) -> None:
+    with self.__lock:
+      self.__pending_requests.pop(event.params["requestId"], None)
+
+  def __index_response_body(self, body: str, base64_encoded: bool) -> None:
+    if base64_encoded:
+      body = base64.b64decode(body).decode("utf-8", errors="replace")
+    try:
+      response = json.loads(body)
+    except json.JSONDecodeError:
+      return
+    job_descriptions: Dict[str, str] = {}
+    self.__find_job_descriptions(response, job_descriptions)
+    with self.__lock:
+      self.__job_descriptions.update(job_descriptions)
+
+  def __find_job_descriptions(self, node: Any, job_descriptions: Dict[str, str]) -> None:
+    if isinstance(node, dict):
+      match = self.__JOB_URN.match(str(node.get("entityUrn", "")))
+      if match:
+        description_text = self.__get_description_text(node)
+        if description_text:
+          # Plain text from the API -- escaped so it reads the same as a description div's html
+          job_descriptions[match.group(1)] = html.escape(description_text)
+      for value in node.values():
+        self.__find_job_descriptions(value, job_descriptions)
+    elif isinstance(node, list):
+      for value in node:
+        self.__find_job_descriptions(value, job_descriptions)
+
+  def __get_description_text(self, node: Dict[str, Any]) -> str | None:
+    # Older postings nest it under "description", the dash models under "descriptionText"
+    for key in ("description", "descriptionText"):
+      description = node.get(key)
+      if isinstance(description, dict) and isinstance(description.get("text"), str):
+        if description["text"].strip():
+          return description["text"]
+    return None
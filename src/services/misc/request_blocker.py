@@ -0,0 +1,139 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import List
+import undetected_chromedriver as uc
+from models.configs.system_config import RequestBlockingConfig
+from models.enums.platform import Platform
+
+
+@dataclass
+class PageLoadStats:
+  url: str
+  transferred_bytes: int
+  load_time: float | None
+  blocked_requests: int
+
+
+class RequestBlocker:
+  # Blocked requests fail inside Chrome before they go out, so they cost neither bandwidth nor load time.
+  # Chrome keeps a blocklist per tab, so each tab has to get it before it starts loading.
+  __RESOURCE_TYPE_URL_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico", "*.svg"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.m4a", "*.ogg"]
+  }
+  __GET_PAGE_LOAD_STATS_JS = """
+    const [blockedUrlRegexes, allowedUrlPatterns] = arguments;
+    const blocked = blockedUrlRegexes.map((regex) => new RegExp(regex));
+    const allowed = [];
+    if (typeof URLPattern !== 'undefined') {
+      for (const pattern of allowedUrlPatterns) {
+        try {
+          allowed.push(new URLPattern(pattern));
+        } catch (e) {}
+      }
+    }
+    const isBlocked = (url) => blocked.some((regex) => regex.test(url)) && !allowed.some((p) => p.test(url));
+    const urls = new Set();
+    for (const el of document.querySelectorAll('img, source, video, audio, iframe, script[src], link[href]')) {
+      const url = el.currentSrc || el.src || el.href;
+      if (url) {
+        urls.add(url);
+      }
+    }
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const navigationBytes = navigation ? navigation.transferSize : 0;
+    return {
+      transferredBytes: resources.reduce((total, resource) => total + resource.transferSize, navigationBytes),
+      loadTime: navigation && navigation.loadEventEnd ? navigation.loadEventEnd / 1000 : null,
+      blockedRequests: Array.from(urls).filter(isBlocked).length
+    };
+  """
+  __enabled: bool
+  __blocked_urls: List[str]
+  __allowed_url_patterns: List[str]
+  __page_load_stats: List[PageLoadStats]
+
+  def __init__(self, request_blocking_config: RequestBlockingConfig, platform: Platform | None = None):
+    self.__enabled = request_blocking_config.enabled
+    self.__blocked_urls = []
+    for resource_type in request_blocking_config.resource_types:
+      for url_pattern in self.__RESOURCE_TYPE_URL_PATTERNS[resource_type]:
+        self.__blocked_urls.append(url_pattern)
+        self.__blocked_urls.append(f"{url_pattern}?*")
+    self.__blocked_urls.extend(request_blocking_config.url_patterns)
+    allow_lists = request_blocking_config.allow_lists
+    if platform == Platform.GLASSDOOR:
+      self.__allowed_url_patterns = list(allow_lists.glassdoor)
+    elif platform == Platform.INDEED:
+      self.__allowed_url_patterns = list(allow_lists.indeed)
+    elif platform == Platform.LINKEDIN:
+      self.__allowed_url_patterns = list(allow_lists.linkedin)
+    else:
+      # One browser for every platform -- anything any of them allows stays allowed
+      self.__allowed_url_patterns = list(dict.fromkeys(
+        allow_lists.glassdoor + allow_lists.indeed + allow_lists.linkedin
+      ))
+    self.__page_load_stats = []
+
+  def is_enabled(self) -> bool:
+    return self.__enabled
+
+  def apply(self, driver: uc.Chrome) -> None:
+    # Only reaches the current tab
+    if not self.__enabled:
+      return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {
+      "urls": self.__blocked_urls,
+      # Chrome versions without urlPatterns ignore it, and the allow lists along with it
+      "urlPatterns": [
+        {"urlPattern": url_pattern, "block": False}
+        for url_pattern in self.__allowed_url_patterns
+      ]
+    })
+
+  def record_page_load(self, driver: uc.Chrome) -> PageLoadStats:
+    # Blocked requests never go out, so what they'd have cost shows up by comparing against a run with blocking off
+    raw_page_load_stats = driver.execute_script(
+      self.__GET_PAGE_LOAD_STATS_JS,
+      [self.__get_url_regex(url_pattern) for url_pattern in self.__blocked_urls] if self.__enabled else [],
+      self.__allowed_url_patterns
+    )
+    page_load_stats = PageLoadStats(
+      driver.current_url,
+      int(raw_page_load_stats["transferredBytes"]),
+      raw_page_load_stats["loadTime"],
+      raw_page_load_stats["blockedRequests"]
+    )
+    self.__page_load_stats.append(page_load_stats)
+    logging.debug(
+      "Page load: %s KB transferred, %s load time, %s requests blocked -- %s",
+      round(page_load_stats.transferred_bytes / 1024),
+      f"{page_load_stats.load_time:.2f}s" if page_load_stats.load_time is not None else "unknown",
+      page_load_stats.blocked_requests,
+      page_load_stats.url
+    )
+    return page_load_stats
+
+  def get_page_load_stats(self) -> List[PageLoadStats]:
+    return list(self.__page_load_stats)
+
+  def log_summary(self) -> None:
+    if not self.__page_load_stats:
+      return
+    load_times = [stats.load_time for stats in self.__page_load_stats if stats.load_time is not None]
+    logging.info(
+      "%s page loads (request blocking %s): %s KB transferred on average, %s average load time, %s requests blocked",
+      len(self.__page_load_stats),
+      "on" if self.__enabled else "off",
+      round(sum(stats.transferred_bytes for stats in self.__page_load_stats) / len(self.__page_load_stats) / 1024),
+      f"{sum(load_times) / len(load_times):.2f}s" if load_times else "unknown",
+      sum(stats.blocked_requests for stats in self.__page_load_stats)
+    )
+
+  def __get_url_regex(self, url_pattern: str) -> str:
+    # The same whole-url wildcard matching Chrome does for blocked urls
+    return "^" + ".*".join(re.escape(part) for part in url_pattern.split("*")) + "$"
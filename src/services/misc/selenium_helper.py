@@ -1,14 +1,22 @@
 import logging
+import os
+import re
+from typing import List
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException
-from selenium.common.exceptions import StaleElementReferenceException
-from models.configs.system_config import SystemConfig
+from entities.form_field import FormField
+from entities.page_snapshot import PageSnapshot
+from models.configs.system_config import ProxyConfig, SystemConfig
 from models.enums.element_type import ElementType
+from models.enums.platform import Platform
+from services.misc.cdp_event_bus import CdpEventBus
 from services.misc.proxy_manager import ProxyManager
+from services.misc.request_blocker import RequestBlocker
+from services.misc.wait_engine import IS_VISIBLE_JS, WaitEngine
 
 
 class SeleniumHelper:
@@ -16,22 +24,52 @@ class SeleniumHelper:
   __system_config: SystemConfig
   __default_page_load_timeout: int
   __proxy_manager: ProxyManager
+  __platform: Platform | None
+  __capture_network_events: bool
+  __profile_name: str | None
+  __proxy_config: ProxyConfig | None
+  __wait_engine: WaitEngine
+  __event_bus: CdpEventBus
+  __request_blocker: RequestBlocker
+  __clones: List["SeleniumHelper"]
 
   def __init__(
     self,
     system_config: SystemConfig,
     default_page_load_timeout: int,
-    proxy_manager: ProxyManager
+    proxy_manager: ProxyManager,
+    platform: Platform | None = None,
+    capture_network_events: bool = False,
+    profile_name: str | None = None
   ):
     self.__system_config = system_config
     self.__default_page_load_timeout = default_page_load_timeout
     self.__proxy_manager = proxy_manager
+    self.__platform = platform
+    self.__capture_network_events = capture_network_events
+    self.__profile_name = profile_name
+    self.__proxy_config = None
     self.__driver = self.get_new_driver()
     self.__driver.set_page_load_timeout(default_page_load_timeout)
+    self.__wait_engine = WaitEngine(self.__driver)
+    self.__event_bus = CdpEventBus(self.__driver)
+    self.__event_bus.start()
+    self.__request_blocker = RequestBlocker(system_config.browser.request_blocking, platform)
+    self.__request_blocker.apply(self.__driver)
+    self.__clones = []
 
   def get_driver(self) -> uc.Chrome:
     return self.__driver
 
+  def get_wait_engine(self) -> WaitEngine:
+    return self.__wait_engine
+
+  def get_event_bus(self) -> CdpEventBus:
+    return self.__event_bus
+
+  def has_persistent_profile(self) -> bool:
+    return self.__get_user_data_dir() is not None
+
   def get_new_driver(self) -> uc.Chrome:
     logging.debug("Getting a new driver...")
     options = uc.ChromeOptions()
@@ -43,18 +81,100 @@ class SeleniumHelper:
     options.add_argument("--disable-popup-blocking")
     options.add_argument("--force-dark-mode")
     self.__handle_proxy_configuration(options)
+    # Page events (and Network events, when they're captured) go to the performance log the event bus reads
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {
+      "enableNetwork": self.__capture_network_events,
+      "enablePage": True
+    })
+    user_data_dir = self.__get_user_data_dir()
+    if user_data_dir:
+      # The stored session is the point of a persistent profile, so it's left as is
+      logging.debug("Using browser profile: %s", user_data_dir)
+      os.makedirs(user_data_dir, exist_ok=True)
+      return uc.Chrome(options=options, user_data_dir=user_data_dir)
     driver = uc.Chrome(options=options)
     driver.delete_all_cookies()
     driver.execute_script("window.localStorage.clear();")
     driver.execute_script("window.sessionStorage.clear();")
     return driver
 
+  def clone(self) -> "SeleniumHelper":
+    # A second browser behind the same proxy manager, signed in with this one's cookies
+    # It never gets this one's profile -- Chrome won't open a profile that's already in use
+    logging.debug("Cloning the current browser session...")
+    selenium_helper = SeleniumHelper(
+      self.__system_config,
+      self.__default_page_load_timeout,
+      self.__proxy_manager,
+      self.__platform,
+      self.__capture_network_events
+    )
+    cookies = []
+    for cookie in self.get_all_cookies():
+      cookie_param = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+      }
+      if not cookie.get("session"):
+        cookie_param["expires"] = cookie["expires"]
+      cookies.append(cookie_param)
+    selenium_helper.get_driver().execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+    self.__clones.append(selenium_helper)
+    return selenium_helper
+
+  def get_all_cookies(self) -> List[dict]:
+    # Every domain's cookies -- driver.get_cookies() only sees the current page's
+    return self.__driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+
+  def get_proxy_config(self) -> ProxyConfig | None:
+    return self.__proxy_config
+
+  def get_user_agent(self) -> str:
+    return self.__driver.execute_script("return navigator.userAgent;")
+
+  def quit(self) -> None:
+    for selenium_helper in self.__clones:
+      selenium_helper.quit()
+    self.__request_blocker.log_summary()
+    self.__event_bus.stop()
+    self.__driver.quit()
+
   def set_driver_timeout_to_default(self) -> None:
     self.__driver.set_page_load_timeout(self.__default_page_load_timeout)
 
   def open_new_tab(self) -> None:
     self.__driver.execute_script("window.open('about:blank', '_blank');")
     self.__driver.switch_to.window(self.__driver.window_handles[-1])
+    self.__request_blocker.apply(self.__driver)
+
+  def open_background_tab(self, url: str) -> str:
+    current_window_handle = self.__driver.current_window_handle
+    starting_window_handles = set(self.__driver.window_handles)
+    if self.__request_blocker.is_enabled():
+      # The new tab has to get the blocklist before its first request, so it starts out blank
+      self.__driver.execute_script("window.open('about:blank', '_blank');")
+    else:
+      self.__driver.execute_script("window.open(arguments[0], '_blank');", url)
+    new_window_handles = [
+      window_handle for window_handle in self.__driver.window_handles
+      if window_handle not in starting_window_handles
+    ]
+    assert len(new_window_handles) == 1, "Expected exactly one new tab to open"
+    if self.__request_blocker.is_enabled():
+      self.__driver.switch_to.window(new_window_handles[0])
+      self.__request_blocker.apply(self.__driver)
+      self.__driver.execute_script("window.location.href = arguments[0];", url)
+    self.__driver.switch_to.window(current_window_handle)
+    return new_window_handles[0]
+
+  def record_page_load(self) -> None:
+    self.__request_blocker.record_page_load(self.__driver)
+
+  def replace_current_tab(self, window_handle: str) -> None:
+    self.__driver.close()
+    self.__driver.switch_to.window(window_handle)
 
   def text_is_present(
     self,
@@ -63,20 +183,7 @@ class SeleniumHelper:
     base_element: WebElement | None = None
   ) -> bool:
     logging.debug("Checking if visible text is present: %s", some_text)
-    some_text = some_text.lower().strip()
-    if base_element:
-      elements = base_element.find_elements(By.TAG_NAME, element_type.value)
-    else:
-      elements = self.__driver.find_elements(By.TAG_NAME, element_type.value)
-    for el in elements:
-      try:
-        if el.is_displayed():
-          visible_text = (el.text or "").lower().strip()
-          if some_text in visible_text:
-            return True
-      except StaleElementReferenceException:
-        continue
-    return False
+    return self.__find_element_by_text(some_text, element_type, base_element, exact=False) is not None
 
   def exact_text_is_present(
     self,
@@ -85,20 +192,7 @@ class SeleniumHelper:
     base_element: WebElement | None = None
   ) -> bool:
     logging.debug("Checking if visible text is present: %s", some_text)
-    some_text = some_text.lower().strip()
-    if base_element:
-      elements = base_element.find_elements(By.TAG_NAME, element_type.value)
-    else:
-      elements = self.__driver.find_elements(By.TAG_NAME, element_type.value)
-    for el in elements:
-      try:
-        if el.is_displayed():
-          visible_text = (el.text or "").lower().strip()
-          if some_text == visible_text:
-            return True
-      except StaleElementReferenceException:
-        continue
-    return False
+    return self.__find_element_by_text(some_text, element_type, base_element, exact=True) is not None
 
   def get_element_by_text(
     self,
@@ -107,19 +201,10 @@ class SeleniumHelper:
     base_element: WebElement | None = None
   ) -> WebElement:
     logging.debug("Getting %s with text: %s", element_type.value, some_text)
-    some_text = some_text.lower().strip()
-    if base_element:
-      elements = base_element.find_elements(By.TAG_NAME, element_type.value)
-    else:
-      elements = self.__driver.find_elements(By.TAG_NAME, element_type.value)
-    for el in elements:
-      try:
-        visible_text = (el.text or "").lower().strip()
-        if some_text in visible_text:
-          return el
-      except StaleElementReferenceException:
-        continue
-    raise NoSuchElementException(f"Failed to find {element_type.value} with text: {some_text}")
+    element = self.__find_element_by_text(some_text, element_type, base_element, exact=False)
+    if element is None:
+      raise NoSuchElementException(f"Failed to find {element_type.value} with text: {some_text.lower().strip()}")
+    return element
 
   def get_element_by_exact_text(
     self,
@@ -128,19 +213,37 @@ class SeleniumHelper:
     base_element: WebElement | None = None
   ) -> WebElement:
     logging.debug("Getting %s with text: %s", element_type.value, some_text)
-    some_text = some_text.lower().strip()
-    if base_element:
-      elements = base_element.find_elements(By.TAG_NAME, element_type.value)
-    else:
-      elements = self.__driver.find_elements(By.TAG_NAME, element_type.value)
-    for el in elements:
-      try:
-        visible_text = (el.text or "").lower().strip()
-        if some_text == visible_text:
-          return el
-      except StaleElementReferenceException:
-        continue
-    raise NoSuchElementException(f"Failed to find {element_type.value} with text: {some_text}")
+    element = self.__find_element_by_text(some_text, element_type, base_element, exact=True)
+    if element is None:
+      raise NoSuchElementException(f"Failed to find {element_type.value} with text: {some_text.lower().strip()}")
+    return element
+
+  def get_page_snapshot(
+    self,
+    element_types: list[ElementType],
+    base_element: WebElement | None = None
+  ) -> PageSnapshot:
+    logging.debug("Taking page snapshot of: %s", ", ".join(element_type.value for element_type in element_types))
+    raw_snapshot = self.__driver.execute_script("""
+      const [baseElement, tagNames] = arguments;
+      const root = baseElement || document;
+      const isVisible = """ + IS_VISIBLE_JS + """;
+      const visibleTexts = {};
+      for (const tagName of tagNames) {
+        visibleTexts[tagName] = [];
+        for (const el of root.getElementsByTagName(tagName)) {
+          if (!isVisible(el)) {
+            continue;
+          }
+          const visibleText = (el.innerText || '').toLowerCase().trim();
+          if (visibleText) {
+            visibleTexts[tagName].push(visibleText);
+          }
+        }
+      }
+      return {url: window.location.href, visibleTexts: visibleTexts};
+    """, base_element, [element_type.value for element_type in element_types])
+    return PageSnapshot(raw_snapshot["url"], raw_snapshot["visibleTexts"])
 
   def exact_aria_label_is_present(
     self,
@@ -188,6 +291,136 @@ class SeleniumHelper:
       el.dispatchEvent(new Event('change'));
     """, select_el, some_text)
 
+  def fill_form(self, form_fields: List[FormField], base_element: WebElement | None = None) -> List[str]:
+    logging.debug("Filling %s form fields...", len(form_fields))
+    # Inputs, selects and radios are set in one round trip. Typeaheads only commit a value
+    # on real keystrokes, so their controls are handed back to be typed into from here.
+    result = self.__driver.execute_script("""
+      const [baseElement, formFields] = arguments;
+      const root = baseElement || document;
+      const isVisible = """ + IS_VISIBLE_JS + """;
+      const normalize = (text) => (text || '').toLowerCase().trim();
+      const getLabelElement = (formField) => {
+        for (const el of root.getElementsByTagName(formField.label_element_type)) {
+          if (isVisible(el) && normalize(el.innerText) === normalize(formField.label_text)) {
+            return el;
+          }
+        }
+        return null;
+      };
+      const getControl = (formField) => {
+        if (formField.label_text === null) {
+          for (const name of formField.input_names) {
+            const control = root.querySelector(`[name="${name}"]`);
+            if (control) {
+              return control;
+            }
+          }
+          return null;
+        }
+        const labelElement = getLabelElement(formField);
+        if (!labelElement) {
+          return null;
+        }
+        const label = labelElement.closest('label') || labelElement;
+        const controlId = label.getAttribute('for');
+        if (controlId) {
+          const control = document.getElementById(controlId);
+          if (control) {
+            return control;
+          }
+        }
+        return label.parentElement.querySelector('input, select, textarea');
+      };
+      const setValue = (control, value) => {
+        const prototype = control.tagName === 'TEXTAREA'
+          ? window.HTMLTextAreaElement.prototype
+          : window.HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(prototype, 'value').set.call(control, value);
+        control.dispatchEvent(new Event('focus', {bubbles: true}));
+        control.dispatchEvent(new Event('input', {bubbles: true}));
+        control.dispatchEvent(new Event('change', {bubbles: true}));
+        control.dispatchEvent(new Event('blur', {bubbles: true}));
+      };
+      const selectOption = (select, value) => {
+        const option = Array.from(select.options).find(
+          (someOption) => normalize(someOption.text) === normalize(value) || someOption.value === value
+        );
+        if (!option) {
+          return false;
+        }
+        select.value = option.value;
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+      };
+      const clickRadio = (formField, value) => {
+        const labelElement = getLabelElement(formField);
+        if (!labelElement) {
+          return false;
+        }
+        const group = labelElement.closest('fieldset') || labelElement.parentElement.parentElement;
+        for (const option of group.getElementsByTagName('label')) {
+          if (normalize(option.innerText) === normalize(value)) {
+            option.click();
+            return true;
+          }
+        }
+        return false;
+      };
+      const filled = [];
+      const typeaheads = [];
+      formFields.forEach((formField, index) => {
+        if (formField.field_type === 'radio') {
+          if (clickRadio(formField, formField.value)) {
+            filled.push(index);
+          }
+          return;
+        }
+        const control = getControl(formField);
+        if (!control) {
+          return;
+        }
+        if (formField.field_type === 'typeahead') {
+          typeaheads.push([index, control]);
+        } else if (formField.field_type === 'select') {
+          if (selectOption(control, formField.value)) {
+            filled.push(index);
+          }
+        } else {
+          if (normalize(control.value) !== normalize(formField.value)) {
+            setValue(control, formField.value);
+          }
+          filled.push(index);
+        }
+      });
+      return {filled: filled, typeaheads: typeaheads};
+    """, base_element, [
+      {
+        "field_type": form_field.field_type.value,
+        "value": form_field.value,
+        "label_text": form_field.label_text,
+        "label_element_type": form_field.label_element_type.value,
+        "input_names": form_field.input_names
+      }
+      for form_field in form_fields
+    ])
+    filled_indexes = list(result["filled"])
+    for index, typeahead_input in result["typeaheads"]:
+      self.write_to_input(form_fields[index].value, typeahead_input)
+      while str(typeahead_input.get_attribute("aria-expanded")).lower().strip() == "true":
+        typeahead_input.send_keys(Keys.TAB)
+      filled_indexes.append(index)
+    filled_fields = [form_fields[index].describe() for index in sorted(filled_indexes)]
+    logging.debug("Filled form fields: %s", ", ".join(filled_fields))
+    missing_fields = [
+      form_field.describe()
+      for index, form_field in enumerate(form_fields)
+      if form_field.required and index not in filled_indexes
+    ]
+    if missing_fields:
+      raise NoSuchElementException(f"Failed to find required form fields: {', '.join(missing_fields)}")
+    return filled_fields
+
   def check_box_by_name(self, some_name: str, checked: bool = True) -> None:
     logging.debug("Setting checkbox %s to %s", some_name, checked)
     checkbox = self.__driver.find_element(By.NAME, some_name)
@@ -211,8 +444,40 @@ class SeleniumHelper:
   def scroll_into_view(self, element: WebElement) -> None:
     self.__driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
 
+  def __find_element_by_text(
+    self,
+    some_text: str,
+    element_type: ElementType,
+    base_element: WebElement | None,
+    exact: bool
+  ) -> WebElement | None:
+    # One round trip instead of an is_displayed() and a .text call per candidate element.
+    # Hidden elements have no visible text, so they never match -- same as WebElement.text.
+    return self.__driver.execute_script("""
+      const [baseElement, tagName, someText, exact] = arguments;
+      const root = baseElement || document;
+      const isVisible = """ + IS_VISIBLE_JS + """;
+      for (const el of root.getElementsByTagName(tagName)) {
+        if (!isVisible(el)) {
+          continue;
+        }
+        const visibleText = (el.innerText || '').toLowerCase().trim();
+        if (exact ? visibleText === someText : visibleText.includes(someText)) {
+          return el;
+        }
+      }
+      return null;
+    """, base_element, element_type.value, some_text.lower().strip(), exact)
+
+  def __get_user_data_dir(self) -> str | None:
+    profiles_path = self.__system_config.browser.profiles_path
+    if not profiles_path or not self.__profile_name:
+      return None
+    return os.path.join(os.path.expanduser(profiles_path), re.sub(r"[^\w.@-]+", "_", self.__profile_name))
+
   def __handle_proxy_configuration(self, options: uc.ChromeOptions) -> uc.ChromeOptions:
-    proxy_config = self.__proxy_manager.get_best_proxy()
+    proxy_config = self.__proxy_manager.get_best_proxy(self.__platform)
+    self.__proxy_config = proxy_config
     if proxy_config:
       logging.info("Using proxy: %s", proxy_config.host)
       options.add_argument(f"--proxy-server=socks5://{proxy_config.host}:{proxy_config.port}")
@@ -0,0 +1,62 @@
+import re
+from typing import Dict, List, Tuple
+
+
+class TermMatcher:
+  # Matchers are compiled once per config term list -- the list is kept alongside so a recycled id() can't hit
+  __cache: Dict[int, Tuple[List[str | list], "TermMatcher"]] = {}
+  __terms: List[str | list]
+  __term_patterns: List[re.Pattern | list]
+  __any_string_term_pattern: re.Pattern | None
+
+  def __init__(self, terms: List[str | list]):
+    self.__terms = terms
+    self.__term_patterns = [self.__compile_term(term) for term in terms]
+    string_terms = [term.lower().strip() for term in terms if isinstance(term, str)]
+    if string_terms:
+      # Longest first so the alternation prefers the most specific term at a given position
+      string_terms.sort(key=len, reverse=True)
+      self.__any_string_term_pattern = self.__compile_pattern("|".join(re.escape(term) for term in string_terms))
+    else:
+      self.__any_string_term_pattern = None
+
+  @classmethod
+  def for_terms(cls, terms: List[str | list]) -> "TermMatcher":
+    cached = cls.__cache.get(id(terms))
+    if cached and cached[0] is terms:
+      return cached[1]
+    matcher = cls(terms)
+    cls.__cache[id(terms)] = (terms, matcher)
+    return matcher
+
+  def find_first_match(self, phrase: str) -> str | list | None:
+    phrase = phrase.lower().strip()
+    # One pass over the phrase rules out every plain term at once; only AND-lists need checking after a miss
+    string_terms_may_match = (
+      self.__any_string_term_pattern is not None
+      and self.__any_string_term_pattern.search(phrase) is not None
+    )
+    for term, term_pattern in zip(self.__terms, self.__term_patterns):
+      if isinstance(term_pattern, re.Pattern):
+        if string_terms_may_match and term_pattern.search(phrase):
+          return term
+      elif self.__all_patterns_match(term_pattern, phrase):
+        return term
+    return None
+
+  def __all_patterns_match(self, term_patterns: list, phrase: str) -> bool:
+    for term_pattern in term_patterns:
+      if isinstance(term_pattern, re.Pattern):
+        if not term_pattern.search(phrase):
+          return False
+      elif not self.__all_patterns_match(term_pattern, phrase):
+        return False
+    return True
+
+  def __compile_term(self, term: str | list) -> re.Pattern | list:
+    if isinstance(term, str):
+      return self.__compile_pattern(re.escape(term.lower().strip()))
+    return [self.__compile_term(item) for item in term]
+
+  def __compile_pattern(self, escaped_terms: str) -> re.Pattern:
+    return re.compile(rf"(?<!\w)\(?(?:{escaped_terms})\)?(?!\w)")
@@ -0,0 +1,188 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+import undetected_chromedriver as uc
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+
+IS_VISIBLE_JS = """
+  (el) => {
+    if (typeof el.checkVisibility === 'function') {
+      return el.checkVisibility({
+        checkOpacity: true,
+        checkVisibilityCSS: true,
+        opacityProperty: true,
+        visibilityProperty: true
+      });
+    }
+    const style = window.getComputedStyle(el);
+    return (
+      style.visibility !== 'hidden'
+      && style.opacity !== '0'
+      && el.getClientRects().length > 0
+    );
+  }
+"""
+
+
+@dataclass
+class WaitCondition:
+  by: str
+  value: str
+  text: str | None = None
+  exact: bool = True
+
+  def describe(self) -> str:
+    if self.text is None:
+      return f"{self.by}={self.value}"
+    return f"{self.by}={self.value} with text: {self.text.lower().strip()}"
+
+
+class WaitEngine:
+  # Resolves with the index of the first satisfied condition, or -1 once timeoutMs runs out.
+  # Conditions are re-checked on every DOM mutation instead of on a fixed sleep interval.
+  __WAIT_JS = """
+    const [baseElement, conditions, timeoutMs, done] = arguments;
+    const root = baseElement || document;
+    const isVisible = """ + IS_VISIBLE_JS + """;
+    const findAll = (condition) => {
+      if (condition.by === 'xpath') {
+        const result = document.evaluate(
+          condition.value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const elements = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+          elements.push(result.snapshotItem(i));
+        }
+        return elements;
+      }
+      return Array.from(root.querySelectorAll(condition.value));
+    };
+    const isSatisfied = (condition) => {
+      for (const el of findAll(condition)) {
+        if (condition.text === null) {
+          return true;
+        }
+        if (!isVisible(el)) {
+          continue;
+        }
+        const visibleText = (el.innerText || '').toLowerCase().trim();
+        if (condition.exact ? visibleText === condition.text : visibleText.includes(condition.text)) {
+          return true;
+        }
+      }
+      return false;
+    };
+    const check = () => conditions.findIndex(isSatisfied);
+    const initialIndex = check();
+    if (initialIndex >= 0) {
+      done(initialIndex);
+      return;
+    }
+    let timer = null;
+    const observer = new MutationObserver(() => {
+      const index = check();
+      if (index >= 0) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(index);
+      }
+    });
+    observer.observe(root === document ? document.documentElement : root, {
+      attributes: true,
+      characterData: true,
+      childList: true,
+      subtree: true
+    });
+    timer = setTimeout(() => {
+      observer.disconnect();
+      done(-1);
+    }, timeoutMs);
+  """
+  __SCRIPT_TIMEOUT_BUFFER = 5
+  # What Chrome reports when the page goes away under a running script -- anything else won't fix itself by retrying
+  __NAVIGATION_ERRORS = (
+    "document unloaded",
+    "execution context was destroyed",
+    "cannot find context",
+    "frame detached",
+    "navigated or closed"
+  )
+  __driver: uc.Chrome
+  __time_spent: Dict[str, Tuple[int, float]]
+
+  def __init__(self, driver: uc.Chrome):
+    self.__driver = driver
+    self.__time_spent = {}
+
+  def wait_for(
+    self,
+    condition: WaitCondition,
+    base_element: WebElement | None = None,
+    timeout: float = 10.0
+  ) -> bool:
+    return self.wait_for_any([condition], base_element, timeout) is not None
+
+  def wait_for_any(
+    self,
+    conditions: List[WaitCondition],
+    base_element: WebElement | None = None,
+    timeout: float = 10.0
+  ) -> int | None:
+    description = " | ".join(condition.describe() for condition in conditions)
+    logging.debug("Waiting for: %s", description)
+    raw_conditions = [
+      {
+        "by": "xpath" if condition.by == By.XPATH else "css",
+        "value": condition.value,
+        "text": None if condition.text is None else condition.text.lower().strip(),
+        "exact": condition.exact
+      }
+      for condition in conditions
+    ]
+    start_time = time.time()
+    index = -1
+    while time.time() - start_time < timeout:
+      remaining_time = timeout - (time.time() - start_time)
+      self.__driver.set_script_timeout(remaining_time + self.__SCRIPT_TIMEOUT_BUFFER)
+      try:
+        index = self.__driver.execute_async_script(
+          self.__WAIT_JS,
+          base_element,
+          raw_conditions,
+          int(remaining_time * 1000)
+        )
+        break
+      except TimeoutException:
+        logging.debug("Wait script outlived its timeout. Trying again...")
+      except JavascriptException as e:
+        if not self.__is_navigation_error(e):
+          raise
+        # The document navigated or unloaded mid-wait -- observe the new one
+        logging.debug("Wait was interrupted by a navigation. Trying again...")
+    time_spent = time.time() - start_time
+    self.__record_time_spent(description, time_spent)
+    if index is None or index < 0:
+      logging.debug("Timed out after %.3fs waiting for: %s", time_spent, description)
+      return None
+    logging.debug("Waited %.3fs for: %s", time_spent, conditions[index].describe())
+    return index
+
+  def log_time_spent(self) -> None:
+    for description, (count, total_time) in sorted(
+      self.__time_spent.items(),
+      key=lambda item: item[1][1],
+      reverse=True
+    ):
+      logging.info("Waited %.3fs over %s waits for: %s", total_time, count, description)
+
+  def __is_navigation_error(self, e: JavascriptException) -> bool:
+    message = (e.msg or "").lower()
+    return any(navigation_error in message for navigation_error in self.__NAVIGATION_ERRORS)
+
+  def __record_time_spent(self, description: str, time_spent: float) -> None:
+    count, total_time = self.__time_spent.get(description, (0, 0.0))
+    self.__time_spent[description] = (count + 1, total_time + time_spent)
@@ -1,4 +1,5 @@
 import re
+from typing import List
 
 
 class YoeParser:
@@ -85,7 +86,54 @@ class YoeParser:
     r"(\w+) years professional",
   ]
 
+  __patterns: List[str] = __range_patterns + __min_plus_patterns + __min_only_patterns
+  __single_pass_pattern: re.Pattern | None = None
+  __glued_number_pattern: re.Pattern | None = None
+  __ANCHOR = "years"
+  __MAX_LOOKBACK = 64
+  __MAX_LOOKAHEAD = len("years of professional")
+
+  def __init__(self):
+    if YoeParser.__single_pass_pattern is None:
+      YoeParser.__single_pass_pattern = self.__compile_single_pass_pattern()
+      YoeParser.__glued_number_pattern = self.__compile_glued_number_pattern()
+
   def parse(self, description: str) -> tuple[int | None, int | None]:
+    # Every pattern contains "years", so only the text around each occurrence gets matched against the alternation
+    description = description.lower()
+    single_pass_pattern = YoeParser.__single_pass_pattern
+    glued_number_pattern = YoeParser.__glued_number_pattern
+    assert single_pass_pattern and glued_number_pattern
+    if glued_number_pattern.search(description):
+      return self.parse_reference(description)
+    best_match: re.Match | None = None
+    best_rank = (len(self.__patterns), len(description))
+    anchor_position = description.find(self.__ANCHOR)
+    while anchor_position != -1:
+      window_start = max(0, anchor_position - self.__MAX_LOOKBACK)
+      while window_start > 0 and self.__is_word_character(description[window_start - 1]):
+        window_start -= 1
+      window_end = anchor_position + self.__MAX_LOOKAHEAD
+      for match in single_pass_pattern.finditer(description, window_start, window_end):
+        assert match.lastgroup
+        rank = (int(match.lastgroup[1:]), match.start())
+        if rank < best_rank:
+          best_match = match
+          best_rank = rank
+      anchor_position = description.find(self.__ANCHOR, anchor_position + 1)
+    if best_match is None:
+      return None, None
+    best_pattern_index = best_rank[0]
+    outer_group_index = single_pass_pattern.groupindex[f"p{best_pattern_index}"]
+    if best_pattern_index < len(self.__range_patterns):
+      return (
+        self.__to_int(best_match.group(outer_group_index + 1)),
+        self.__to_int(best_match.group(outer_group_index + 2))
+      )
+    return self.__to_int(best_match.group(outer_group_index + 1)), None
+
+  def parse_reference(self, description: str) -> tuple[int | None, int | None]:
+    # The original one-pass-per-pattern parser -- kept so the benchmark can check parse() against it
     description = description.lower()
     for pattern in self.__range_patterns:
       for match in re.finditer(pattern, description):
@@ -110,3 +158,27 @@ class YoeParser:
         if len(matching_nums) != 0:
           return max(matching_nums), None
     return None, None
+
+  def __compile_single_pass_pattern(self) -> re.Pattern:
+    # Word numbers only count as the whole word, same as (\w+) capturing the whole word before the lookup
+    word_number_pattern = r"(?<!\w)(?:" + "|".join(
+      sorted(self.__word_to_int, key=len, reverse=True)
+    ) + r"|\d+)"
+    # Every pattern as one alternation in priority order -- group p{i} wraps the i-th pattern
+    return re.compile("|".join(
+      f"(?P<p{i}>" + pattern.replace(r"(\w+)", f"({word_number_pattern})") + ")"
+      for i, pattern in enumerate(self.__patterns)
+    ))
+
+  def __compile_glued_number_pattern(self) -> re.Pattern:
+    # The reference parser resumes each pattern's search right where its last match ended, which can be mid-word.
+    # Every pattern ends in one of these words, so a number glued onto one can match there but not as a whole word.
+    return re.compile(r"(?:years|experience|professional)(?=\d|" + "|".join(self.__word_to_int) + ")")
+
+  def __is_word_character(self, character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+  def __to_int(self, term: str) -> int:
+    if term.isdigit():
+      return int(term)
+    return self.__word_to_int[term]
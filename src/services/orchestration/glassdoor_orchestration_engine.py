@@ -47,6 +47,7 @@ class GlassdoorOrchestrationEngine:
       language_parser,
       universal_config,
       quick_settings,
+      glassdoor_config,
       indeed_apply_now_page
     )
 
@@ -62,6 +63,9 @@ class GlassdoorOrchestrationEngine:
       except TimeoutException:
         logging.warning("Timed out. Trying again...")
         time.sleep(0.5)
+    if self.__selenium_helper.has_persistent_profile() and self.__glassdoor_login_page.is_logged_in():
+      logging.info("Reusing the stored Glassdoor session.")
+      return
     self.__glassdoor_login_page.login()
 
   def apply(self) -> None:
@@ -76,6 +80,9 @@ class GlassdoorOrchestrationEngine:
       logging.warning("Glassdoor service appears to be down. Skipping all Glassdoor queries...")
       return
 
+  def get_jobs_applied_count(self) -> int:
+    return self.__glassdoor_job_listings_page.get_jobs_applied_count()
+
   def __wait_for_human_verification_page(self) -> None:
     while True:
       if self.__selenium_helper.exact_text_is_present(
@@ -90,6 +97,8 @@ class GlassdoorOrchestrationEngine:
         ElementType.LABEL
       ):
         break
+      elif self.__glassdoor_login_page.is_logged_in():
+        break
       logging.info("Waiting for login page to appear...")
       time.sleep(0.5)
 
@@ -99,3 +108,4 @@ class GlassdoorOrchestrationEngine:
       self.__driver.get(url)
     except TimeoutException:
       pass
+    self.__selenium_helper.record_page_load()
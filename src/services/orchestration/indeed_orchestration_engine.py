@@ -17,7 +17,9 @@ from services.misc.language_parser import LanguageParser
 
 class IndeedOrchestrationEngine:
   __driver: uc.Chrome
+  __selenium_helper: SeleniumHelper
   __universal_config: UniversalConfig
+  __indeed_config: IndeedConfig
   __indeed_login_page: IndeedLoginPage
   __indeed_one_time_code_page: IndeedOneTimeCodePage
   __indeed_job_listings_page: IndeedJobListingsPage
@@ -33,7 +35,9 @@ class IndeedOrchestrationEngine:
     indeed_config: IndeedConfig
   ):
     self.__driver = driver
+    self.__selenium_helper = selenium_helper
     self.__universal_config = universal_config
+    self.__indeed_config = indeed_config
     self.__indeed_login_page = IndeedLoginPage(driver, selenium_helper, indeed_config)
     self.__indeed_one_time_code_page = IndeedOneTimeCodePage(driver, selenium_helper, indeed_config)
     self.__indeed_job_listings_page = IndeedJobListingsPage(
@@ -42,12 +46,16 @@ class IndeedOrchestrationEngine:
       database_manager,
       language_parser,
       universal_config,
-      quick_settings
+      quick_settings,
+      indeed_config
     )
 
   def login(self) -> None:
     base_url = "https://www.indeed.com"
     logging.debug("Applying to %s...", base_url)
+    if self.__selenium_helper.has_persistent_profile() and self.__indeed_login_page.is_logged_in():
+      logging.info("Reusing the stored Indeed session.")
+      return
     self.__indeed_login_page.login()
     while not self.__indeed_one_time_code_page.is_present():
       logging.debug("Waiting for one-time-code page to appear...")
@@ -58,15 +66,19 @@ class IndeedOrchestrationEngine:
     self.__indeed_one_time_code_page.wait_for_captcha_resolution()
 
   def apply(self) -> None:
-    self.__go_to_query()
+    query_url_builder = IndeedQueryUrlBuilder(self.__universal_config)
+    start_page = self.__indeed_config.start_page
+    self.__go_to_query(query_url_builder, start_page)
     while not self.__indeed_job_listings_page.is_present():
       logging.debug("Waiting for Job Listings page to appear...")
       time.sleep(0.5)
-    self.__indeed_job_listings_page.handle_current_query()
+    self.__indeed_job_listings_page.handle_current_query(query_url_builder, start_page)
 
-  def __go_to_query(self) -> None:
-    query_url_builder = IndeedQueryUrlBuilder(self.__universal_config)
-    query_url = query_url_builder.build()
+  def get_jobs_applied_count(self) -> int:
+    return self.__indeed_job_listings_page.get_jobs_applied_count()
+
+  def __go_to_query(self, query_url_builder: IndeedQueryUrlBuilder, page_number: int) -> None:
+    query_url = query_url_builder.build(page_number)
     logging.debug("Going to %s...",  query_url)
     self.__driver.get(query_url)
     verification_element_name = "q"
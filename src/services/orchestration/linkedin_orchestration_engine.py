@@ -1,5 +1,4 @@
 import logging
-import time
 import undetected_chromedriver as uc
 from models.configs.linkedin_config import LinkedinConfig
 from models.configs.quick_settings import QuickSettings
@@ -15,8 +14,10 @@ from services.misc.language_parser import LanguageParser
 
 class LinkedinOrchestrationEngine:
   __driver: uc.Chrome
+  __selenium_helper: SeleniumHelper
   __universal_config: UniversalConfig
   __quick_settings: QuickSettings
+  __linkedin_config: LinkedinConfig
   __linkedin_login_page: LinkedinLoginPage
   __linkedin_job_listings_page: LinkedinJobListingsPage
 
@@ -32,8 +33,10 @@ class LinkedinOrchestrationEngine:
     proxy_manager: ProxyManager
   ):
     self.__driver = driver
+    self.__selenium_helper = selenium_helper
     self.__universal_config = universal_config
     self.__quick_settings = quick_settings
+    self.__linkedin_config = linkedin_config
     self.__linkedin_login_page = LinkedinLoginPage(
       driver,
       selenium_helper,
@@ -52,21 +55,32 @@ class LinkedinOrchestrationEngine:
 
   def login(self) -> None:
     logging.debug("Applying...")
+    # Only a persistent profile can have a session left over from an earlier run
+    if self.__selenium_helper.has_persistent_profile() and self.__linkedin_login_page.is_logged_in():
+      logging.info("Reusing the stored Linkedin session.")
+      return
     self.__linkedin_login_page.login()
 
   def apply(self) -> None:
     query_terms = self.__universal_config.search.terms.match
     if not query_terms or len(query_terms) == 0:
       query_terms = [""]
-    for search_term in query_terms:
-      self.__go_to_query(search_term)
-      self.__linkedin_job_listings_page.handle_current_query()
-
-  def __go_to_query(self, search_term: str) -> None:
     query_url_builder = LinkedinQueryUrlBuilder(self.__universal_config, self.__quick_settings)
-    query_url = query_url_builder.build(search_term)
+    for i, search_term in enumerate(query_terms):
+      # Resuming only makes sense for the term that was interrupted -- the rest start from the top
+      start_page = self.__linkedin_config.start_page if i == 0 else 1
+      self.__go_to_query(query_url_builder, search_term, start_page)
+      self.__linkedin_job_listings_page.handle_current_query(query_url_builder, search_term, start_page)
+
+  def get_jobs_applied_count(self) -> int:
+    return self.__linkedin_job_listings_page.get_jobs_applied_count()
+
+  def __go_to_query(self, query_url_builder: LinkedinQueryUrlBuilder, search_term: str, page_number: int) -> None:
+    query_url = query_url_builder.build(search_term, page_number)
     logging.debug("Going to %s", query_url)
     self.__driver.get(query_url)
-    while not 'linkedin.com/jobs/search-results' in self.__driver.current_url:
+    while not self.__selenium_helper.get_event_bus().wait_for_url(
+      lambda url: 'linkedin.com/jobs/search-results' in url,
+      timeout=5
+    ):
       logging.debug("Waiting for url to include: linkedin.com/jobs/search-results...")
-      time.sleep(0.5)
@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+import traceback
+from entities.platform_run_result import PlatformRunResult
+from models.enums.platform import Platform
+from services.misc.selenium_helper import SeleniumHelper
+from services.orchestration.glassdoor_orchestration_engine import GlassdoorOrchestrationEngine
+from services.orchestration.indeed_orchestration_engine import IndeedOrchestrationEngine
+from services.orchestration.linkedin_orchestration_engine import LinkedinOrchestrationEngine
+
+
+class PlatformWorker:
+  __platform: Platform
+  __selenium_helper: SeleniumHelper
+  __orchestration_engine: IndeedOrchestrationEngine | GlassdoorOrchestrationEngine | LinkedinOrchestrationEngine
+  __thread: threading.Thread
+  __result: PlatformRunResult | None
+
+  def __init__(
+    self,
+    platform: Platform,
+    selenium_helper: SeleniumHelper,
+    orchestration_engine: IndeedOrchestrationEngine | GlassdoorOrchestrationEngine | LinkedinOrchestrationEngine
+  ):
+    self.__platform = platform
+    self.__selenium_helper = selenium_helper
+    self.__orchestration_engine = orchestration_engine
+    self.__thread = threading.Thread(target=self.run, name=f"{platform.value}Worker", daemon=True)
+    self.__result = None
+
+  def get_platform(self) -> Platform:
+    return self.__platform
+
+  def get_selenium_helper(self) -> SeleniumHelper:
+    return self.__selenium_helper
+
+  def get_result(self) -> PlatformRunResult | None:
+    return self.__result
+
+  def start(self) -> None:
+    self.__thread.start()
+
+  def join(self) -> None:
+    self.__thread.join()
+
+  def run(self) -> PlatformRunResult:
+    logging.info("Starting %s worker...", self.__platform.value)
+    start_time = time.time()
+    try:
+      self.__orchestration_engine.login()
+      self.__orchestration_engine.apply()
+      self.__result = PlatformRunResult(
+        platform=self.__platform,
+        succeeded=True,
+        duration=time.time() - start_time,
+        jobs_applied=self.__orchestration_engine.get_jobs_applied_count()
+      )
+    except Exception as e:
+      # One platform falling over shouldn't take the others down with it
+      logging.error("%s worker failed:\n%s", self.__platform.value, traceback.format_exc())
+      self.__result = PlatformRunResult(
+        platform=self.__platform,
+        succeeded=False,
+        duration=time.time() - start_time,
+        jobs_applied=self.__orchestration_engine.get_jobs_applied_count(),
+        error=f"{type(e).__name__}: {e}"
+      )
+    logging.info("Finished %s worker after %.3fs", self.__platform.value, self.__result.duration)
+    return self.__result
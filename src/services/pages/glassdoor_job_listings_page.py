@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import List
+from typing import Any, Dict, List, Tuple
 import psutil
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -8,23 +8,28 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
   ElementClickInterceptedException,
   NoSuchElementException,
-  StaleElementReferenceException
+  StaleElementReferenceException,
+  TimeoutException
 )
 from entities.glassdoor_brief_job_listing import GlassdoorBriefJobListing
 from entities.glassdoor_job_listing import GlassdoorJobListing
-from exceptions.no_more_job_listings_exception import NoMoreJobListingsException
 from exceptions.page_didnt_load_exception import PageDidntLoadException
 from exceptions.service_is_down_exception import ServiceIsDownException
 from exceptions.zero_search_results_exception import ZeroSearchResultsException
+from models.configs.glassdoor_config import GlassdoorConfig
 from models.configs.quick_settings import QuickSettings
 from models.enums.element_type import ElementType
 from models.configs.universal_config import UniversalConfig
 from models.enums.language import Language
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
+from services.misc.glassdoor_page_state_extractor import GlassdoorPageStateExtractor
+from services.misc.job_description_fetcher import JobDescriptionFetcher
+from services.misc.job_listing_pipeline import ApplyStage, JobListingPipeline
 from services.pages.indeed_apply_now_page.indeed_apply_now_page import IndeedApplyNowPage
 from services.misc.selenium_helper import SeleniumHelper
 from services.misc.language_parser import LanguageParser
+from services.misc.wait_engine import WaitCondition
 
 
 class GlassdoorJobListingsPage:
@@ -34,8 +39,11 @@ class GlassdoorJobListingsPage:
   __language_parser: LanguageParser
   __universal_config: UniversalConfig
   __quick_settings: QuickSettings
+  __glassdoor_config: GlassdoorConfig
   __indeed_apply_now_page: IndeedApplyNowPage
   __jobs_applied_to_this_session: List[dict[str, str]]
+  __job_description_fetcher: JobDescriptionFetcher | None
+  __page_state_extractor: GlassdoorPageStateExtractor
 
   def __init__(
     self,
@@ -45,6 +53,7 @@ class GlassdoorJobListingsPage:
     language_parser: LanguageParser,
     universal_config: UniversalConfig,
     quick_settings: QuickSettings,
+    glassdoor_config: GlassdoorConfig,
     indeed_apply_now_page: IndeedApplyNowPage
   ):
     self.__driver = driver
@@ -53,8 +62,19 @@ class GlassdoorJobListingsPage:
     self.__language_parser = language_parser
     self.__universal_config = universal_config
     self.__quick_settings = quick_settings
+    self.__glassdoor_config = glassdoor_config
     self.__indeed_apply_now_page = indeed_apply_now_page
     self.__jobs_applied_to_this_session = []
+    self.__job_description_fetcher = None
+    if quick_settings.bot_behavior.fetch_descriptions_over_http:
+      self.__job_description_fetcher = JobDescriptionFetcher(
+        quick_settings.bot_behavior.http_fetch_workers,
+        proxy_config=selenium_helper.get_proxy_config()
+      )
+    self.__page_state_extractor = GlassdoorPageStateExtractor()
+
+  def get_jobs_applied_count(self) -> int:
+    return len(self.__jobs_applied_to_this_session)
 
   def handle_current_query(self) -> None:
     try:
@@ -65,54 +85,124 @@ class GlassdoorJobListingsPage:
     while self.__page_didnt_load_is_present():
       logging.debug("Waiting for page to load...")
       time.sleep(0.5)
-    i = 0
-    while self.__is_show_more_jobs_span():
-      try:
-        self.__click_show_more_jobs_button()
-        time.sleep(0.1)
-      except NoSuchElementException:
-        time.sleep(0.1)
-    while True:
-      i += 1
-      logging.debug("Looping through Job Listings: %s...", i)
-      self.__remove_create_job_dialog()
-      self.__remove_survey_popup()
-      try:
-        job_listing_li = self.__get_job_listing_li(i)
-      except NoMoreJobListingsException:
-        logging.info("No Job Listings remaining. Returning...")
-        return
-      self.__selenium_helper.scroll_into_view(job_listing_li)
-      if not self.__is_job_listing(job_listing_li):
-        continue
-      brief_job_listing = GlassdoorBriefJobListing(self.__language_parser, job_listing_li)
-      temp_job_listing = GlassdoorJobListing(self.__language_parser, brief_job_listing)
-      self.__add_job_listing_to_db(temp_job_listing)
-      brief_job_listing.print()
-      if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
-        logging.info("Ignoring Job Listing because: we've already applied this session.\n")
-        continue
-      if brief_job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        self.__add_application_to_db(temp_job_listing)
-        continue
-      self.__remove_create_job_dialog()
-      self.__remove_survey_popup()
-      job_listing_li.click()
-      job_listing = self.__build_job_listing(brief_job_listing)
-      self.__add_job_listing_to_db(job_listing)
-      if job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        self.__add_application_to_db(job_listing)
-        continue
-      self.__apply_to_selected_job()
-      self.__jobs_applied_to_this_session.append(brief_job_listing.to_minimal_dict())
+    job_cards = self.__harvest_job_cards()
+    logging.debug("Harvested %s Job Listing cards.", len(job_cards))
+    self.__add_page_state_to_job_cards(job_cards)
+    brief_job_listings = [
+      GlassdoorBriefJobListing(self.__language_parser, job_card)
+      for job_card in job_cards
+    ]
+    # Classified as one batch so each listing's language check is a cache hit
+    self.__language_parser.get_languages([
+      brief_job_listing.get_language_content()
+      for brief_job_listing in brief_job_listings
+    ])
+    pipeline = JobListingPipeline(
+      Platform.GLASSDOOR.value,
+      self.__filter_brief_job_listing,
+      ApplyStage(self.__apply_to_brief_job_listing),
+      max_queue_size=self.__quick_settings.bot_behavior.pipeline_queue_size,
+      filter_workers=self.__quick_settings.bot_behavior.http_fetch_workers if self.__job_description_fetcher else 1
+    )
+    self.__sync_job_description_fetcher()
+    try:
+      for job_card, brief_job_listing in zip(job_cards, brief_job_listings):
+        pipeline.submit((job_card, brief_job_listing))
+      pipeline.drain()
+    finally:
+      pipeline.close()
+      self.__close_job_description_fetcher()
+
+  def __filter_brief_job_listing(self, item: Tuple[Dict[str, Any], GlassdoorBriefJobListing]) -> bool:
+    _, brief_job_listing = item
+    temp_job_listing = GlassdoorJobListing(self.__language_parser, brief_job_listing)
+    self.__add_job_listing_to_db(temp_job_listing)
+    brief_job_listing.print()
+    if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
+      logging.info("Ignoring Job Listing because: we've already applied this session.\n")
+      return False
+    if brief_job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if self.__quick_settings.bot_behavior.easy_apply_only.glassdoor and brief_job_listing.is_easy_apply() is False:
+      logging.info("Ignoring Job Listing because it isn't easy apply.")
+      temp_job_listing.set_ignore_category("Apply Type")
+      temp_job_listing.set_ignore_term("Not Easy Apply")
+      self.__add_application_to_db(temp_job_listing)
+      return False
+    company_rating = brief_job_listing.get_company_rating()
+    if company_rating is not None and company_rating < self.__universal_config.search.misc.min_company_rating:
+      logging.info("Ignoring Job Listing because its company rating is too low: %s", company_rating)
+      temp_job_listing.set_ignore_category("Company Rating")
+      temp_job_listing.set_ignore_term(str(company_rating))
+      self.__add_application_to_db(temp_job_listing)
+      return False
+    if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      self.__add_application_to_db(temp_job_listing)
+      return False
+    if self.__job_description_fetcher:
+      return self.__filter_fetched_job_listing(self.__job_description_fetcher, brief_job_listing)
+    return True
+
+  def __filter_fetched_job_listing(
+    self,
+    job_description_fetcher: JobDescriptionFetcher,
+    brief_job_listing: GlassdoorBriefJobListing
+  ) -> bool:
+    job_description_html = job_description_fetcher.fetch_description_html(
+      brief_job_listing.get_url(),
+      '[class*="JobDetails_jobDescription"]'
+    )
+    if job_description_html is None:
+      return True   # The browser will have to take a look
+    job_listing = GlassdoorJobListing(
+      self.__language_parser,
+      brief_job_listing,
+      job_description_html=job_description_html
+    )
+    self.__add_job_listing_to_db(job_listing)
+    if job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      self.__add_application_to_db(job_listing)
+      return False
+    return True
+
+  def __close_job_description_fetcher(self) -> None:
+    # Drops the kept-alive connections between queries -- the session reconnects on its next fetch
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.close()
+
+  def __sync_job_description_fetcher(self) -> None:
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.sync_session(
+        self.__selenium_helper.get_user_agent(),
+        self.__selenium_helper.get_all_cookies()
+      )
+
+  def __apply_to_brief_job_listing(self, item: Tuple[Dict[str, Any], GlassdoorBriefJobListing]) -> None:
+    job_card, brief_job_listing = item
+    self.__remove_create_job_dialog()
+    self.__remove_survey_popup()
+    try:
+      job_listing_li = self.__get_job_listings_ul().find_element(By.XPATH, f"./li[{job_card['li_number']}]")
+    except StaleElementReferenceException:
+      job_listing_li = self.__get_job_listings_ul().find_element(By.XPATH, f"./li[{job_card['li_number']}]")
+    self.__selenium_helper.scroll_into_view(job_listing_li)
+    job_listing_li.click()
+    job_listing = self.__build_job_listing(brief_job_listing)
+    self.__add_job_listing_to_db(job_listing)
+    if job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return
+    if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
       self.__add_application_to_db(job_listing)
-      self.__handle_potential_overload()
+      return
+    self.__apply_to_selected_job()
+    self.__jobs_applied_to_this_session.append(brief_job_listing.to_minimal_dict())
+    self.__add_application_to_db(job_listing)
+    self.__handle_potential_overload()
 
   def __confirm_page_stability(self, timeout=60.0) -> None:
     start_time = time.time()
@@ -176,66 +266,127 @@ class GlassdoorJobListingsPage:
       job_listings_ul = self.__selenium_helper.get_element_by_aria_label("Jobs List")
     return job_listings_ul
 
-  def __get_job_listing_li(self, index: int) -> WebElement:
-    job_listings_ul = self.__get_job_listings_ul()
-    while True:
-      try:
-        job_listing_li = job_listings_ul.find_element(By.XPATH, f"./li[{index}]")
-        return job_listing_li
-      except NoSuchElementException as e:
-        if self.__is_show_more_jobs_span():
-          self.__click_show_more_jobs_button()
-          self.__wait_for_new_job_listing_li(index + 1)
-        else:
-          raise NoMoreJobListingsException() from e
-      except StaleElementReferenceException:
-        logging.debug("Failed to get Job Listing li. Trying again...")
-        job_listings_ul = self.__get_job_listings_ul()
-
-  def __is_show_more_jobs_span(self) -> bool:
-    self.__selenium_helper.scroll_to_bottom()
+  def __harvest_job_cards(self, timeout=300) -> List[Dict[str, Any]]:
+    # Expands "Show more jobs" up to the configured cap and reads every card in-page,
+    # dismissing the overlays that would otherwise intercept the clicks along the way.
+    max_job_listings = self.__glassdoor_config.max_job_listings_per_query
+    logging.debug("Expanding Job Listings to at most %s and harvesting cards...", max_job_listings)
+    previous_script_timeout = self.__driver.timeouts.script
     try:
-      job_listings_ul = self.__get_job_listings_ul()
-      job_listings_ul.find_element(By.XPATH, "../div/div/button")
-      return True
-    except NoSuchElementException:
-      return False
-
-  def __click_show_more_jobs_button(self) -> None:
-    self.__selenium_helper.scroll_to_bottom()
-    while True:
+      # The script stops expanding at its own deadline -- the driver's timeout is only a backstop
+      self.__driver.set_script_timeout(timeout + 30)
       try:
-        while True:
-          try:
-            job_listings_ul = self.__get_job_listings_ul()
-            break
-          except NoSuchElementException:
-            logging.debug("Waiting for job listings ul...")
-            time.sleep(0.1)
-        show_more_jobs_button = job_listings_ul.find_element(By.XPATH, "../div/div/button")
-        show_more_jobs_button.click()
-      except ElementClickInterceptedException:
-        self.__remove_create_job_dialog()
-        self.__remove_survey_popup()
-        time.sleep(0.1)
-      except StaleElementReferenceException:
-        time.sleep(0.1)
+        return self.__run_harvest_job_cards_script(max_job_listings, timeout)
+      except TimeoutException:
+        logging.warning("Timed out expanding Job Listings. Harvesting the cards loaded so far...")
+        return self.__run_harvest_job_cards_script(max_job_listings, 0)
+    finally:
+      self.__driver.set_script_timeout(previous_script_timeout)
 
-  def __wait_for_new_job_listing_li(self, index: int, timeout=10) -> None:
-    start_time = time.time()
-    job_listings_ul = self.__get_job_listings_ul()
-    while time.time() - start_time < timeout:
-      try:
-        job_listings_ul.find_element(By.XPATH, f"./li[{index}]")
-        return
-      except NoSuchElementException:
-        logging.debug("Waiting for job listing li...")
-        time.sleep(0.1)
-    raise NoSuchElementException("Failed waiting for job listing li.")
+  def __run_harvest_job_cards_script(self, max_job_listings: int, expand_timeout: float) -> List[Dict[str, Any]]:
+    return self.__driver.execute_async_script("""
+      const [maxJobListings, expandTimeoutMs, done] = arguments;
+      const expandDeadline = performance.now() + expandTimeoutMs;
+      const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+      const getByXpath = (xpath, context) => document.evaluate(
+        xpath, context || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+      ).singleNodeValue;
+      const dismissOverlays = () => {
+        const createJobAlertDialog = getByXpath('/html/body/div[8]/div/dialog');
+        if (createJobAlertDialog) {
+          const cancelButton = getByXpath('./div[2]/div[1]/div[1]/button[1]', createJobAlertDialog);
+          if (cancelButton) {
+            cancelButton.click();
+          }
+        }
+        const surveyExitButton = document.getElementById('qual_close_open');
+        if (surveyExitButton) {
+          surveyExitButton.click();
+        }
+      };
+      const getJobListingsUl = () => document.querySelector('[aria-label="Jobs List"]');
+      const getJobListingLis = (ul) => Array.from(ul.children).filter(
+        (li) => (li.getAttribute('data-test') || '').includes('jobListing')
+      );
+      const getText = (li, className) => {
+        const el = li.getElementsByClassName(className)[0];
+        return el ? el.innerText.trim() : null;
+      };
+      (async () => {
+        dismissOverlays();
+        let ul = getJobListingsUl();
+        while (ul && getJobListingLis(ul).length < maxJobListings && performance.now() < expandDeadline) {
+          const showMoreJobsButton = getByXpath('../div/div/button', ul);
+          if (!showMoreJobsButton) {
+            break;
+          }
+          const countBefore = getJobListingLis(ul).length;
+          showMoreJobsButton.scrollIntoView({block: 'center'});
+          showMoreJobsButton.click();
+          for (let waited = 0; waited < 10000 && performance.now() < expandDeadline; waited += 100) {
+            await sleep(100);
+            dismissOverlays();
+            ul = getJobListingsUl();
+            if (!ul || getJobListingLis(ul).length > countBefore) {
+              break;
+            }
+          }
+          if (!ul || getJobListingLis(ul).length <= countBefore) {
+            break;
+          }
+        }
+        dismissOverlays();
+        const jobCards = [];
+        if (!ul) {
+          done(jobCards);
+          return;
+        }
+        const lis = Array.from(ul.children);
+        for (const li of getJobListingLis(ul).slice(0, maxJobListings)) {
+          const anchor = li.getElementsByClassName('JobCard_trackingLink__HMyun')[0];
+          const title = getText(li, 'JobCard_jobTitle__GLyJ1');
+          const company = getText(li, 'EmployerProfile_compactEmployerName__9MGcV');
+          const location = getText(li, 'JobCard_location__Ds1fM');
+          if (!anchor || !anchor.href || title === null || company === null || location === null) {
+            continue;
+          }
+          jobCards.push({
+            li_number: lis.indexOf(li) + 1,
+            listing_id: li.getAttribute('data-jobid') || new URL(anchor.href).searchParams.get('jl'),
+            title: title,
+            company: company,
+            location: location,
+            url: anchor.href
+          });
+        }
+        done(jobCards);
+      })();
+    """, max_job_listings, int(expand_timeout * 1000))
+
+  def __add_page_state_to_job_cards(self, job_cards: List[Dict[str, Any]]) -> None:
+    # The page state carries pay estimates, ratings and the apply type that cards only show once they're clicked.
+    # Cards stay the source of what's listed, since clicking still needs their position in the ul.
+    state_job_cards = self.__page_state_extractor.get_job_cards(self.__driver)
+    if state_job_cards is None:
+      logging.debug("No Job Listing data in the page state. Cards won't have pay, rating or apply type.")
+      return
+    state_job_cards_by_listing_id = {
+      state_job_card["listing_id"]: state_job_card
+      for state_job_card in state_job_cards
+    }
+    matched_count = 0
+    for job_card in job_cards:
+      state_job_card = state_job_cards_by_listing_id.get(job_card["listing_id"])
+      if state_job_card is None:
+        continue
+      matched_count += 1
+      for key in ("min_pay", "max_pay", "company_rating", "easy_apply"):
+        job_card[key] = state_job_card[key]
+    logging.debug("Matched %s of %s Job Listing cards to the page state.", matched_count, len(job_cards))
 
   def __apply_to_selected_job(self) -> None:
     logging.debug("Applying to selected job...")
-    starting_window_count = len(self.__driver.window_handles)
+    starting_window_handles = self.__driver.window_handles
     self.__remove_create_job_dialog()
     self.__remove_survey_popup()
     apply_button = self.__get_apply_button()
@@ -246,10 +397,12 @@ class GlassdoorJobListingsPage:
       return
     if apply_button.is_enabled():
       apply_button.click()
-    while len(self.__driver.window_handles) == starting_window_count:
+    event_bus = self.__selenium_helper.get_event_bus()
+    new_window_handle = event_bus.wait_for_new_tab(starting_window_handles, timeout=5)
+    while new_window_handle is None:
       logging.debug("Waiting for new tab to open...")
-      time.sleep(0.1)
-    self.__driver.switch_to.window(self.__driver.window_handles[-1])
+      new_window_handle = event_bus.wait_for_new_tab(starting_window_handles, timeout=5)
+    self.__driver.switch_to.window(new_window_handle)
     self.__handle_potential_human_verification_wait()
     self.__handle_potential_too_many_requests()
     self.__handle_application(apply_button_text)
@@ -271,14 +424,7 @@ class GlassdoorJobListingsPage:
 
   def __wait_for_job_info_div(self, timeout=10) -> None:
     job_info_div_xpath = "/html/body/div[4]/div[4]/div[2]/div[2]/div/div[1]"
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      try:
-        self.__driver.find_element(By.XPATH, job_info_div_xpath)
-        break
-      except NoSuchElementException:
-        logging.debug("Waiting for job info div to load...")
-        time.sleep(0.1)
+    self.__selenium_helper.get_wait_engine().wait_for(WaitCondition(By.XPATH, job_info_div_xpath), timeout=timeout)
 
   def __get_job_info_div(self) -> WebElement:
     self.__wait_for_job_info_div()
@@ -335,12 +481,6 @@ class GlassdoorJobListingsPage:
       # TODO: Implement proxy swap
       input("Heck, rate limited...")
 
-  def __is_job_listing(self, element: WebElement) -> bool:
-    attr = element.get_attribute("data-test")
-    result = attr is not None and "jobListing" in attr
-    logging.debug("Checked if is Job Listing: %s", result)
-    return result
-
   def __returned_zero_results(self) -> bool:
     search_h1_class = "SearchResultsHeader_jobCount__eHngv"
     try:
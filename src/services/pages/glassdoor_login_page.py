@@ -24,6 +24,10 @@ class GlassdoorLoginPage:
     self.__selenium_helper = selenium_helper
     self.__glassdoor_config = glassdoor_config
 
+  def is_logged_in(self) -> bool:
+    # Signed in members land on the community page instead of the sign in form
+    return "https://www.glassdoor.com/Community/index.htm" in self.__driver.current_url
+
   def login(self) -> None:
     logging.debug("Logging in...")
     self.__wait_for_email_form()
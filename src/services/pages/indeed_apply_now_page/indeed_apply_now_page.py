@@ -3,10 +3,12 @@ import time
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
+from entities.page_snapshot import PageSnapshot
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
+from services.misc.wait_engine import WaitCondition
 from services.pages.indeed_apply_now_page.steppers.indeed_commute_check_stepper import IndeedCommuteCheckStepper
 from services.pages.indeed_apply_now_page.steppers.indeed_contact_info_stepper import IndeedContactInfoStepper
 from services.pages.indeed_apply_now_page.steppers.indeed_location_stepper import IndeedLocationStepper
@@ -47,12 +49,10 @@ class IndeedApplyNowPage:
       universal_config
     )
     self.__location_stepper = IndeedLocationStepper(
-      driver,
       selenium_helper,
       universal_config
     )
     self.__contact_info_stepper = IndeedContactInfoStepper(
-      driver,
       selenium_helper,
       universal_config
     )
@@ -68,66 +68,68 @@ class IndeedApplyNowPage:
     ALREADY_APPLIED_URL = "smartapply.indeed.com/beta/indeedapply/form/applied"
     REVIEW_URL = "smartapply.indeed.com/beta/indeedapply/form/review"
     while self.is_present():
-      self.__wait_for_some_stepper()
-      if self.__relevant_experience_stepper.is_present():
+      page_snapshot = self.__wait_for_some_stepper()
+      if self.__relevant_experience_stepper.is_present(page_snapshot):
         self.__relevant_experience_stepper.resolve()
-      elif self.__resume_stepper.is_present():
+      elif self.__resume_stepper.is_present(page_snapshot):
         self.__resume_stepper.resolve()
-      elif self.__location_stepper.is_present():
+      elif self.__location_stepper.is_present(page_snapshot):
         self.__location_stepper.resolve()
-      elif self.__contact_info_stepper.is_present():
+      elif self.__contact_info_stepper.is_present(page_snapshot):
         self.__contact_info_stepper.resolve()
-      elif self.__commute_check_stepper.is_present():
+      elif self.__commute_check_stepper.is_present(page_snapshot):
         self.__commute_check_stepper.resolve()
-      if self.__is_automation_roadblock():
+      current_url = self.__driver.current_url
+      if self.__is_automation_roadblock(current_url):
         self.__driver.switch_to.window(self.__driver.window_handles[0])
         return
-      elif ALREADY_APPLIED_URL in self.__driver.current_url:
+      elif ALREADY_APPLIED_URL in current_url:
         self.__driver.close()
         self.__driver.switch_to.window(self.__driver.window_handles[0])
         return
-      elif POTENTIAL_ALREADY_APPLIED_URL in self.__driver.current_url:
+      elif POTENTIAL_ALREADY_APPLIED_URL in current_url:
         IS_GENUINE_ALREADY_APPLIED_PAGE = self.__is_already_applied_page(POTENTIAL_ALREADY_APPLIED_URL)
         if IS_GENUINE_ALREADY_APPLIED_PAGE:
           self.__driver.close()
           self.__driver.switch_to.window(self.__driver.window_handles[0])
           return
-      elif REVIEW_URL in self.__driver.current_url:
+      elif REVIEW_URL in current_url:
         self.__selenium_helper.scroll_to_bottom()
         self.__driver.switch_to.window(self.__driver.window_handles[0])
         return
       else:
         time.sleep(0.5)
         self.__click_continue_button()
-        time.sleep(0.5)
+        # Each stepper is its own url, so moving on shows up as a navigation
+        self.__selenium_helper.get_event_bus().wait_for_url(lambda url: url != current_url, timeout=0.5)
         if False: # TODO: Figure out how to clearly determine when a stepper is not filled -- see LinkedinApplyNowPage
           if self.__quick_settings.bot_behavior.pause_on_unknown_stepper:
             input("Unknown stepper found. Press enter to continue...")
 
-  def __wait_for_some_stepper(self) -> None:
-    while not self.__selenium_helper.exact_aria_label_is_present("Progress"):
+  def __wait_for_some_stepper(self) -> PageSnapshot:
+    while not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, '[aria-label="Progress"]')
+    ):
       logging.debug("Waiting for some stepper to load...")
-      time.sleep(0.1)
     time.sleep(0.5)
+    return self.__selenium_helper.get_page_snapshot([])
 
   def __is_already_applied_page(self, potential_already_applied_url: str) -> bool:
+    # The page is only genuine if it doesn't redirect anywhere else within the confirm time
     confirm_time = 7
-    start_time = time.time()
-    IS_GENUINE_ALREADY_APPLIED_PAGE = True
-    while time.time() - start_time < confirm_time:
-      if not potential_already_applied_url in self.__driver.current_url:
-        IS_GENUINE_ALREADY_APPLIED_PAGE = False
-        break
-    return IS_GENUINE_ALREADY_APPLIED_PAGE
+    return not self.__selenium_helper.get_event_bus().wait_for_url(
+      lambda url: potential_already_applied_url not in url,
+      timeout=confirm_time
+    )
 
-  def __is_automation_roadblock(self) -> bool:
+  def __is_automation_roadblock(self, current_url: str) -> bool:
     VAGUE_QUESTIONS_URL = "smartapply.indeed.com/beta/indeedapply/form/questions-module/questions/1"
     DEMOGRAPHIC_QUESTIONS_URL = "smartapply.indeed.com/beta/indeedapply/form/demographic-questions/1"
     ADDITIONAL_DOCUMENTS_URL = "smartapply.indeed.com/beta/indeedapply/form/resume-module/additional-documents"
     return (
-      VAGUE_QUESTIONS_URL in self.__driver.current_url
-      or DEMOGRAPHIC_QUESTIONS_URL in self.__driver.current_url
-      or ADDITIONAL_DOCUMENTS_URL in self.__driver.current_url
+      VAGUE_QUESTIONS_URL in current_url
+      or DEMOGRAPHIC_QUESTIONS_URL in current_url
+      or ADDITIONAL_DOCUMENTS_URL in current_url
     )
 
   def __click_continue_button(self) -> None:
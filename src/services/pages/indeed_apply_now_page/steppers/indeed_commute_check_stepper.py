@@ -1,4 +1,5 @@
 import undetected_chromedriver as uc
+from entities.page_snapshot import PageSnapshot
 
 
 class IndeedCommuteCheckStepper:
@@ -10,9 +11,9 @@ class IndeedCommuteCheckStepper:
   ):
     self.__driver = driver
 
-  def is_present(self) -> bool:
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
     COMMUTE_CHECK_URL = "smartapply.indeed.com/beta/indeedapply/form/commute-check"
-    return COMMUTE_CHECK_URL in self.__driver.current_url
+    return COMMUTE_CHECK_URL in page_snapshot.get_url()
 
   def resolve(self) -> None:
     pass # ???
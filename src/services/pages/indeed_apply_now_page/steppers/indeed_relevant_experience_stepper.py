@@ -3,6 +3,7 @@ import time
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
+from entities.page_snapshot import PageSnapshot
 from models.configs.universal_config import UniversalConfig
 from services.misc.selenium_helper import SeleniumHelper
 
@@ -22,9 +23,9 @@ class IndeedRelevantExperienceStepper:
     self.__selenium_helper = selenium_helper
     self.__universal_config = universal_config
 
-  def is_present(self) -> bool:
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
     RELEVANT_EXPERIENCE_URL = "smartapply.indeed.com/beta/indeedapply/form/resume-module/relevant-experience"
-    return RELEVANT_EXPERIENCE_URL in self.__driver.current_url
+    return RELEVANT_EXPERIENCE_URL in page_snapshot.get_url()
 
   def resolve(self) -> None:
     self.__handle_company_name_input()
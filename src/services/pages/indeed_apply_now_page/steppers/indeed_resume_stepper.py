@@ -2,6 +2,7 @@ import logging
 import time
 import undetected_chromedriver as uc
 from selenium.common.exceptions import NoSuchElementException
+from entities.page_snapshot import PageSnapshot
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
@@ -22,14 +23,15 @@ class IndeedResumeStepper:
     self.__selenium_helper = selenium_helper
     self.__universal_config = universal_config
 
-  def is_present(self) -> bool:
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
     RESUME_URL = "smartapply.indeed.com/beta/indeedapply/form/resume"
     EXCLUSION_URL_1 = "relevant-experience"
     EXCLUSION_URL_2 = "additional-documents"
+    current_url = page_snapshot.get_url()
     return (
-      RESUME_URL in self.__driver.current_url
-      and EXCLUSION_URL_1 not in self.__driver.current_url
-      and EXCLUSION_URL_2 not in self.__driver.current_url
+      RESUME_URL in current_url
+      and EXCLUSION_URL_1 not in current_url
+      and EXCLUSION_URL_2 not in current_url
     )
 
   def resolve(self) -> None:
@@ -1,6 +1,7 @@
 import logging
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Set, Tuple
+from urllib.parse import urlparse
 import psutil
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -11,27 +12,44 @@ from selenium.common.exceptions import (
 )
 from entities.indeed_brief_job_listing import IndeedBriefJobListing
 from entities.indeed_job_listing import IndeedJobListing
+from exceptions.no_matching_jobs_page_exception import NoMatchingJobsPageException
+from models.configs.indeed_config import IndeedConfig
 from models.configs.quick_settings import QuickSettings
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from models.enums.language import Language
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
+from services.misc.indeed_page_data_extractor import IndeedPageDataExtractor
+from services.misc.job_description_fetcher import JobDescriptionFetcher
+from services.misc.job_listing_pipeline import ApplyStage, JobListingPipeline
 from services.misc.selenium_helper import SeleniumHelper
 from services.pages.indeed_apply_now_page.indeed_apply_now_page import IndeedApplyNowPage
 from services.misc.language_parser import LanguageParser
+from services.misc.wait_engine import IS_VISIBLE_JS, WaitCondition
+from services.query_url_builders.indeed_query_url_builder import IndeedQueryUrlBuilder
 
 
 class IndeedJobListingsPage:
+  __JOB_LISTINGS_UL_XPATHS = [
+    "/html/body/main/div/div[2]/div/div[5]/div/div[1]/div[4]/div/ul",
+    "/html/body/main/div/div/div[2]/div/div[5]/div/div[1]/div[4]/div/div/ul"
+  ]
   __driver: uc.Chrome
   __selenium_helper: SeleniumHelper
   __database_manager: DatabaseManager
   __language_parser: LanguageParser
   __universal_config: UniversalConfig
   __quick_settings: QuickSettings
+  __indeed_config: IndeedConfig
   __apply_now_page: IndeedApplyNowPage
   __jobs_applied_to_this_session: List[dict[str, str]]
-  __current_page_number: int
+  __prefetched_page: Tuple[int, str] | None
+  __job_listings_window_handle: str
+  __apply_worker_pages: List["IndeedJobListingsPage"]
+  __prefetched_job_tabs: Dict[str, str]
+  __job_description_fetcher: JobDescriptionFetcher | None
+  __page_data_extractor: IndeedPageDataExtractor
 
   def __init__(
     self,
@@ -40,7 +58,8 @@ class IndeedJobListingsPage:
     database_manager: DatabaseManager,
     language_parser: LanguageParser,
     universal_config: UniversalConfig,
-    quick_settings: QuickSettings
+    quick_settings: QuickSettings,
+    indeed_config: IndeedConfig
   ):
     self.__driver = driver
     self.__selenium_helper = selenium_helper
@@ -48,9 +67,21 @@ class IndeedJobListingsPage:
     self.__language_parser = language_parser
     self.__universal_config = universal_config
     self.__quick_settings = quick_settings
+    self.__indeed_config = indeed_config
     self.__apply_now_page = IndeedApplyNowPage(driver, selenium_helper, universal_config, quick_settings)
     self.__jobs_applied_to_this_session = []
-    self.__current_page_number = 1
+    self.__prefetched_page = None
+    # Tracked by handle -- once a prefetched page takes over, the results tab is no longer the oldest one
+    self.__job_listings_window_handle = driver.current_window_handle
+    self.__apply_worker_pages = []
+    self.__prefetched_job_tabs = {}
+    self.__page_data_extractor = IndeedPageDataExtractor()
+    self.__job_description_fetcher = None
+    if quick_settings.bot_behavior.fetch_descriptions_over_http:
+      self.__job_description_fetcher = JobDescriptionFetcher(
+        quick_settings.bot_behavior.http_fetch_workers,
+        proxy_config=selenium_helper.get_proxy_config()
+      )
 
   def is_present(self) -> bool:
     try:
@@ -59,120 +90,300 @@ class IndeedJobListingsPage:
     except NoSuchElementException:
       return False
 
-  def handle_current_query(self) -> None:
-    PROPER_JOB_INDEXES = [2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18]
-    INVISIBLE_AD_INDEXES = [1, 19]
-    VISIBLE_AD_INDEXES = [7]
-    LIS_PER_PAGE = len(PROPER_JOB_INDEXES) + len(INVISIBLE_AD_INDEXES) + len(VISIBLE_AD_INDEXES)
-    i = 0
+  def get_jobs_applied_count(self) -> int:
+    return len(self.__jobs_applied_to_this_session) + sum(
+      apply_worker_page.get_jobs_applied_count()
+      for apply_worker_page in self.__apply_worker_pages
+    )
+
+  def handle_current_query(self, query_url_builder: IndeedQueryUrlBuilder, page_number=1) -> None:
+    self.__job_listings_window_handle = self.__driver.current_window_handle
+    pipeline = JobListingPipeline(
+      Platform.INDEED.value,
+      self.__filter_brief_job_listing,
+      self.get_apply_stage(),
+      [apply_worker_page.get_apply_stage() for apply_worker_page in self.__get_apply_worker_pages()],
+      self.__quick_settings.bot_behavior.pipeline_queue_size,
+      self.__quick_settings.bot_behavior.job_tab_look_ahead,
+      self.__quick_settings.bot_behavior.http_fetch_workers if self.__job_description_fetcher else 1
+    )
+    try:
+      self.__discover_job_listings(pipeline, query_url_builder, page_number)
+      pipeline.drain()
+    finally:
+      pipeline.close()
+      self.__close_prefetched_job_tabs()
+      self.__close_job_description_fetcher()
+      for apply_worker_page in self.__apply_worker_pages:
+        apply_worker_page.__close_prefetched_job_tabs()
+        apply_worker_page.__close_job_description_fetcher()
+
+  def get_apply_stage(self) -> ApplyStage:
+    return ApplyStage(self.__apply_to_brief_job_listing, self.__prefetch_job_tab)
+
+  def __prefetch_job_tab(self, brief_job_listing: IndeedBriefJobListing) -> None:
+    logging.debug("Prefetching Job Listing: %s", brief_job_listing.get_url())
+    window_handle = self.__selenium_helper.open_background_tab(brief_job_listing.get_url())
+    self.__prefetched_job_tabs[brief_job_listing.get_job_key()] = window_handle
+
+  def __close_prefetched_job_tabs(self) -> None:
+    current_window_handle = self.__driver.current_window_handle
+    for window_handle in self.__prefetched_job_tabs.values():
+      self.__driver.switch_to.window(window_handle)
+      self.__driver.close()
+    self.__prefetched_job_tabs.clear()
+    if current_window_handle in self.__driver.window_handles:
+      self.__driver.switch_to.window(current_window_handle)
+    else:
+      self.__driver.switch_to.window(self.__job_listings_window_handle)
+
+  def __apply_to_brief_job_listing(self, brief_job_listing: IndeedBriefJobListing) -> None:
+    prefetched_window_handle = self.__prefetched_job_tabs.pop(brief_job_listing.get_job_key(), None)
+    if prefetched_window_handle:
+      self.__driver.switch_to.window(prefetched_window_handle)
+    else:
+      self.__open_job_in_new_tab(brief_job_listing.get_url())
+    try:
+      self.__wait_for_new_job_tab_to_load()
+    except RuntimeError:
+      logging.debug("Some HTTP error... Skipping this job...")
+      self.__driver.close()
+      self.__driver.switch_to.window(self.__job_listings_window_handle)
+      return
+    job_listing = self.__build_job_listing(brief_job_listing)
+    self.__add_job_listing_to_db(job_listing)
+    if job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      self.__driver.switch_to.window(self.__job_listings_window_handle)
+      return
+    if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      self.__driver.close()
+      self.__driver.switch_to.window(self.__job_listings_window_handle)
+      self.__add_application_to_db(job_listing)
+      return
+    while self.__selenium_helper.get_wait_engine().wait_for_any([
+      WaitCondition(By.CSS_SELECTOR, ElementType.SPAN.value, "Apply now"),
+      WaitCondition(By.CSS_SELECTOR, ElementType.SPAN.value, "Apply on company site")
+    ]) is None:
+      logging.debug("Waiting for apply button...")
+    if self.__quick_settings.bot_behavior.easy_apply_only.indeed and self.__is_apply_on_company_site_span():
+      logging.info("Ignoring because job is not easy apply...")
+      self.__driver.close()
+      self.__driver.switch_to.window(self.__job_listings_window_handle)
+      return
+    self.__apply_to_job(brief_job_listing)
+    self.__driver.switch_to.window(self.__job_listings_window_handle)
+    self.__add_application_to_db(job_listing)
+    self.__handle_potential_overload()
+
+  def __discover_job_listings(
+    self,
+    pipeline: JobListingPipeline,
+    query_url_builder: IndeedQueryUrlBuilder,
+    page_number: int
+  ) -> None:
+    seen_job_keys: Set[str] = set()
     while True:
-      i += 1
-      job_listing_li_number = (i % LIS_PER_PAGE) + 1
-      JOB_IS_ON_NEXT_PAGE = i > 1 and job_listing_li_number == 1
-      if JOB_IS_ON_NEXT_PAGE:
-        if self.__is_a_next_page():
-          self.__go_to_next_page()
-        else:
-          logging.info("End of Job Listings.")
-          return
-      elif job_listing_li_number in INVISIBLE_AD_INDEXES + VISIBLE_AD_INDEXES:
-        logging.debug("Job Listing is an ad. Skipping...")
-        continue  # Don't try to run against ads
-      job_listing_li = self.__get_job_listing_li(job_listing_li_number)
-      if job_listing_li is None:
+      job_cards = self.__harvest_job_cards(seen_job_keys)
+      if len(job_cards) == 0:
         logging.info("End of Job Listings.")
         return
-      brief_job_listing = self.__build_brief_job_listing(job_listing_li)
-      if brief_job_listing is None:
-        logging.debug("Skipping a fake Job Listing / advertisement...")
-        continue
-      temp_job_listing = IndeedJobListing(self.__language_parser, brief_job_listing)
-      self.__add_job_listing_to_db(temp_job_listing)
-      brief_job_listing.print()
-      if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
-        logging.info("Ignoring Job Listing because: we've already applied this session.\n")
-        continue
-      if brief_job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        self.__add_application_to_db(temp_job_listing)
-        continue
-      self.__open_job_in_new_tab(job_listing_li)
+      is_a_next_page = self.__is_a_next_page(page_number)
+      if is_a_next_page and self.__indeed_config.prefetch_next_page:
+        self.__prefetch_page(query_url_builder, page_number + 1)
+      brief_job_listings = [
+        IndeedBriefJobListing(self.__language_parser, job_card)
+        for job_card in job_cards
+      ]
+      # Classified as one batch so each listing's language check is a cache hit
+      self.__language_parser.get_languages([
+        brief_job_listing.get_language_content()
+        for brief_job_listing in brief_job_listings
+      ])
+      self.__sync_job_description_fetcher()
+      for brief_job_listing in brief_job_listings:
+        seen_job_keys.add(brief_job_listing.get_job_key())
+        pipeline.submit(brief_job_listing)
+      if not is_a_next_page:
+        logging.info("End of Job Listings.")
+        return
+      page_number += 1
       try:
-        self.__wait_for_new_job_tab_to_load()
-      except RuntimeError:
-        logging.debug("Some HTTP error... Skipping this job...")
-        self.__driver.close()
-        self.__driver.switch_to.window(self.__driver.window_handles[0])
-        continue
-      job_listing = self.__build_job_listing(brief_job_listing)
-      self.__add_job_listing_to_db(job_listing)
-      if job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        self.__driver.close()
-        self.__driver.switch_to.window(self.__driver.window_handles[0])
-        self.__add_application_to_db(job_listing)
-        continue
-      while not self.__is_apply_now_span() and not self.__is_apply_on_company_site_span():
-        logging.debug("Waiting for apply button...")
-        time.sleep(0.5)
-      if self.__quick_settings.bot_behavior.easy_apply_only.indeed and self.__is_apply_on_company_site_span():
-        logging.info("Ignoring because job is not easy apply...")
-        self.__driver.close()
-        self.__driver.switch_to.window(self.__driver.window_handles[0])
-        continue
-      self.__apply_to_job(brief_job_listing)
-      self.__driver.switch_to.window(self.__driver.window_handles[0])
+        self.__go_to_page(query_url_builder, page_number)
+      except NoMatchingJobsPageException:
+        logging.info("No Job Listings page -- End of Job Listings.")
+        return
+
+  def __filter_brief_job_listing(self, brief_job_listing: IndeedBriefJobListing) -> bool:
+    temp_job_listing = IndeedJobListing(self.__language_parser, brief_job_listing)
+    self.__add_job_listing_to_db(temp_job_listing)
+    brief_job_listing.print()
+    if self.__has_applied_this_session(brief_job_listing):
+      logging.info("Ignoring Job Listing because: we've already applied this session.\n")
+      return False
+    if brief_job_listing.is_applied():
+      logging.info("Ignoring Job Listing because: Indeed says we've already applied.\n")
+      return False
+    if brief_job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      self.__add_application_to_db(temp_job_listing)
+      return False
+    if self.__job_description_fetcher:
+      return self.__filter_fetched_job_listing(self.__job_description_fetcher, brief_job_listing)
+    return True
+
+  def __filter_fetched_job_listing(
+    self,
+    job_description_fetcher: JobDescriptionFetcher,
+    brief_job_listing: IndeedBriefJobListing
+  ) -> bool:
+    parsed_url = urlparse(brief_job_listing.get_url())
+    view_job_url = f"{parsed_url.scheme}://{parsed_url.netloc}/viewjob?jk={brief_job_listing.get_job_key()}"
+    page_html = job_description_fetcher.fetch_html(view_job_url)
+    if page_html is None:
+      return True   # The browser will have to take a look
+    job_description_html = (
+      self.__page_data_extractor.get_job_description_html_from_html(page_html)
+      or job_description_fetcher.select_inner_html(page_html, "#jobDescriptionText")
+    )
+    if job_description_html is None:
+      return True
+    job_listing = IndeedJobListing(self.__language_parser, brief_job_listing, job_description_html)
+    self.__add_job_listing_to_db(job_listing)
+    if job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
       self.__add_application_to_db(job_listing)
-      self.__handle_potential_overload()
+      return False
+    return True
 
-  def __build_brief_job_listing(self, job_listing_li: WebElement) -> Optional[IndeedBriefJobListing]:
-    try:
-      brief_job_listing = IndeedBriefJobListing(self.__language_parser, job_listing_li)
-      return brief_job_listing
-    except NoSuchElementException:
-      return None
+  def __close_job_description_fetcher(self) -> None:
+    # Drops the kept-alive connections between queries -- the session reconnects on its next fetch
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.close()
+
+  def __sync_job_description_fetcher(self) -> None:
+    # Cookies change as the browser moves around -- the fetcher is brought up to date before each batch
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.sync_session(
+        self.__selenium_helper.get_user_agent(),
+        self.__selenium_helper.get_all_cookies()
+      )
+
+  def __has_applied_this_session(self, brief_job_listing: IndeedBriefJobListing) -> bool:
+    if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
+      return True
+    return any(
+      apply_worker_page.__has_applied_this_session(brief_job_listing)
+      for apply_worker_page in self.__apply_worker_pages
+    )
+
+  def __get_apply_worker_pages(self) -> List["IndeedJobListingsPage"]:
+    # Extra browsers apply while this one keeps paging through results
+    while len(self.__apply_worker_pages) < self.__indeed_config.apply_workers:
+      selenium_helper = self.__selenium_helper.clone()
+      self.__apply_worker_pages.append(IndeedJobListingsPage(
+        selenium_helper.get_driver(),
+        selenium_helper,
+        self.__database_manager,
+        self.__language_parser,
+        self.__universal_config,
+        self.__quick_settings,
+        self.__indeed_config
+      ))
+    return self.__apply_worker_pages
 
-  def __get_job_listing_link(self, job_listing_li: WebElement) -> str:
-    job_listing_anchor = self.__get_job_listing_anchor(job_listing_li)
-    job_listing_link = job_listing_anchor.get_attribute("href")
-    assert job_listing_link
-    assert isinstance(job_listing_link, str)
-    return job_listing_link
+  def __harvest_job_cards(self, seen_job_keys: Set[str], timeout=10) -> List[Dict[str, Any]]:
+    # Results repeat across pages, so the page is only ready once a card that hasn't been seen yet shows up
+    new_job_card_selector = "a[data-jk]" + "".join(
+      f':not([data-jk="{job_key}"])' for job_key in sorted(seen_job_keys)
+    )
+    logging.debug("Waiting for new Job Listing cards...")
+    if not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, new_job_card_selector),
+      timeout=timeout
+    ):
+      logging.debug("No new Job Listing cards appeared. Harvesting anyway...")
+    job_cards = self.__page_data_extractor.get_job_cards(self.__driver)
+    if job_cards is None:
+      logging.debug("No embedded Job Listing data. Harvesting cards from the DOM instead...")
+      job_cards = self.__harvest_job_cards_from_dom()
+    new_job_cards = [job_card for job_card in job_cards if job_card["job_key"] not in seen_job_keys]
+    logging.debug("Harvested %s Job Listing cards.", len(new_job_cards))
+    return new_job_cards
 
-  def __open_job_in_new_tab(self, job_listing_li: WebElement) -> None:
-    job_listing_link = self.__get_job_listing_link(job_listing_li)
+  def __harvest_job_cards_from_dom(self) -> List[Dict[str, Any]]:
+    # Real results carry their job key ("jk") on the title anchor -- ads and spacer lis don't,
+    # so cards are classified by content instead of by their position in the list.
+    return self.__driver.execute_script("""
+      const [jobListingsUl] = arguments;
+      const isVisible = """ + IS_VISIBLE_JS + """;
+      const getText = (li, selector, relativeXpath) => {
+        let node = li.querySelector(selector);
+        if (!node) {
+          node = document.evaluate(
+            relativeXpath, li, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+          ).singleNodeValue;
+        }
+        return node ? node.innerText.trim() : '';
+      };
+      const jobCards = [];
+      for (const li of jobListingsUl.children) {
+        const titleAnchor = li.querySelector('h2 a[data-jk]') || li.querySelector('a[data-jk]');
+        if (!titleAnchor || !titleAnchor.dataset.jk || !isVisible(li)) {
+          continue;
+        }
+        const title = titleAnchor.innerText.trim();
+        const company = getText(
+          li,
+          '[data-testid="company-name"]',
+          './div/div/div/div/div/div/table/tbody/tr/td/div[2]/div/div[1]/span'
+        );
+        if (!title || !company) {
+          continue;
+        }
+        jobCards.push({
+          job_key: titleAnchor.dataset.jk,
+          title: title,
+          company: company,
+          location: getText(
+            li,
+            '[data-testid="text-location"]',
+            './div/div/div/div/div/div/table/tbody/tr/td/div[2]/div/div[2]'
+          ),
+          url: titleAnchor.href
+        });
+      }
+      return jobCards;
+    """, self.__get_job_listings_ul())
+
+  def __open_job_in_new_tab(self, job_listing_link: str, max_attempts=3) -> None:
     self.__selenium_helper.open_new_tab()
-    while True:
+    for attempt in range(1, max_attempts + 1):
       try:
         self.__driver.get(job_listing_link)
-        break
+        self.__selenium_helper.record_page_load()
+        return
       except TimeoutException:
-        logging.warning("Failed to go to: %s -- Trying again...", job_listing_link)
+        logging.warning("Failed to go to: %s (attempt %s of %s)", job_listing_link, attempt, max_attempts)
+    logging.warning("Giving up on reloading: %s -- Proceeding with whatever loaded...", job_listing_link)
+    self.__selenium_helper.record_page_load()
 
   def __wait_for_new_job_tab_to_load(self, timeout=10) -> None:
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      if self.__selenium_helper.exact_text_is_present(
-        "Profile insights",
-        ElementType.H2
-      ):
-        return
-      elif self.__selenium_helper.exact_text_is_present(
-        "Job details",
-        ElementType.H2
-      ):
-        return
-      elif self.__selenium_helper.exact_text_is_present(
-        "We can’t find this page",
-        ElementType.H1
-      ):
-        raise RuntimeError("Failed to arrive at new job tab... \"We can't find this page\".")
-      logging.debug("Waiting for page to load...")
-      time.sleep(0.5)
+    CANT_FIND_PAGE_INDEX = 2
+    index = self.__selenium_helper.get_wait_engine().wait_for_any(
+      [
+        WaitCondition(By.CSS_SELECTOR, ElementType.H2.value, "Profile insights"),
+        WaitCondition(By.CSS_SELECTOR, ElementType.H2.value, "Job details"),
+        WaitCondition(By.CSS_SELECTOR, ElementType.H1.value, "We can’t find this page")
+      ],
+      timeout=timeout
+    )
+    if index == CANT_FIND_PAGE_INDEX:
+      raise RuntimeError("Failed to arrive at new job tab... \"We can't find this page\".")
 
   def __build_job_listing(self, brief_job_listing: IndeedBriefJobListing) -> IndeedJobListing:
     job_description_html = self.__get_job_description_html()
@@ -195,7 +406,9 @@ class IndeedJobListingsPage:
     raise RuntimeError("Tried to apply to a job, but expected conditions were not met regarding the apply button.")
 
   def __handle_potential_overload(self) -> None:
-    jobs_open = len(self.__driver.window_handles) - 1
+    jobs_open = len(self.__driver.window_handles) - 1 - len(self.__prefetched_job_tabs)
+    if self.__prefetched_page:
+      jobs_open -= 1
     pause_every_x_jobs = self.__quick_settings.bot_behavior.pause_every_x_jobs
     current_memory_usage = psutil.virtual_memory().percent
     logging.debug("Current memory usage: %s%s", current_memory_usage, "%")
@@ -210,36 +423,47 @@ class IndeedJobListingsPage:
       print("\nCurrent memory usage is too high. Please clean up existing tabs to continue safely.")
       input("\tPress enter to proceed...")
 
-  def __is_a_next_page(self) -> bool:
+  def __is_a_next_page(self, page_number: int) -> bool:
     visible_page_numbers = self.__get_visible_page_numbers()
-    current_page_number = self.__get_current_page_number()
-    if current_page_number + 1 in visible_page_numbers:
+    if page_number + 1 in visible_page_numbers:
       return True
     return False
 
-  def __go_to_next_page(self) -> None:
-    logging.info("Going to page %s...", self.__current_page_number + 1)
-    next_page_anchor = self.__get_next_page_anchor()
-    try:
-      next_page_anchor.click()
-    except TimeoutException:
-      logging.warning("Received a TimeoutException that has historically shown to not be an issue. Continuing...")
-    self.__current_page_number += 1
+  def __prefetch_page(self, query_url_builder: IndeedQueryUrlBuilder, page_number: int) -> None:
+    logging.debug("Prefetching page %s...", page_number)
+    page_url = query_url_builder.build(page_number)
+    window_handle = self.__selenium_helper.open_background_tab(page_url)
+    self.__prefetched_page = (page_number, window_handle)
 
-  def __get_job_listing_li(self, index: int) -> Optional[WebElement]:
-    try:
-      job_listings_ul = self.__get_job_listings_ul()
-      job_listing_li = job_listings_ul.find_element(By.XPATH, f"./li[{index}]")
-      return job_listing_li
-    except NoSuchElementException:
-      return None
+  def __go_to_page(self, query_url_builder: IndeedQueryUrlBuilder, page_number: int, timeout=30) -> None:
+    logging.info("Going to page %s...", page_number)
+    self.__driver.switch_to.window(self.__job_listings_window_handle)
+    if self.__prefetched_page and self.__prefetched_page[0] == page_number:
+      # The prefetched tab takes over as the Job Listings tab
+      self.__selenium_helper.replace_current_tab(self.__prefetched_page[1])
+      self.__job_listings_window_handle = self.__prefetched_page[1]
+      self.__prefetched_page = None
+    else:
+      page_url = query_url_builder.build(page_number)
+      try:
+        self.__driver.get(page_url)
+      except TimeoutException:
+        logging.warning("Timed out waiting for page %s. Proceeding anyway...", page_number)
+      self.__selenium_helper.record_page_load()
+    logging.debug("Waiting for Job Listings page to appear...")
+    # A direct page URL can land on a captcha or an empty page -- either way there's nothing left to harvest
+    NO_RESULTS_INDEX = len(self.__JOB_LISTINGS_UL_XPATHS)
+    index = self.__selenium_helper.get_wait_engine().wait_for_any(
+      [WaitCondition(By.XPATH, xpath) for xpath in self.__JOB_LISTINGS_UL_XPATHS] + [
+        WaitCondition(By.CSS_SELECTOR, ElementType.H1.value, "did not match any jobs", exact=False)
+      ],
+      timeout=timeout
+    )
+    if index is None or index == NO_RESULTS_INDEX:
+      raise NoMatchingJobsPageException()
 
   def __get_job_listings_ul(self) -> WebElement:
-    potential_job_listings_ul_xpaths = [
-      "/html/body/main/div/div[2]/div/div[5]/div/div[1]/div[4]/div/ul",
-      "/html/body/main/div/div/div[2]/div/div[5]/div/div[1]/div[4]/div/div/ul"
-    ]
-    for xpath in potential_job_listings_ul_xpaths:
+    for xpath in self.__JOB_LISTINGS_UL_XPATHS:
       try:
         job_listings_ul = self.__driver.find_element(By.XPATH, xpath)
         return job_listings_ul
@@ -247,18 +471,6 @@ class IndeedJobListingsPage:
         pass
     raise NoSuchElementException("Failed to find Job Listings ul.")
 
-  def __get_next_page_anchor(self) -> WebElement:
-    page_buttons_ul = self.__get_page_buttons_ul()
-    current_page_number = self.__get_current_page_number()
-    for i in range(1, 7):
-      potential_relative_next_page_anchor_xpath = f"./li[{i}]/a[1]"
-      potential_next_page_anchor = page_buttons_ul.find_element(By.XPATH, potential_relative_next_page_anchor_xpath)
-      potential_next_page_anchor_text = potential_next_page_anchor.text
-      if potential_next_page_anchor_text:
-        if potential_next_page_anchor_text == str(current_page_number + 1):
-          return potential_next_page_anchor
-    raise NoSuchElementException("Failed to find next page anchor.")
-
   def __get_visible_page_numbers(self) -> List[int]:
     page_buttons_ul = self.__get_page_buttons_ul()
     visible_page_numbers = []
@@ -273,9 +485,6 @@ class IndeedJobListingsPage:
         visible_page_numbers.append(int(page_anchor_text))
     return visible_page_numbers
 
-  def __get_current_page_number(self) -> int:
-    return self.__current_page_number
-
   def __get_page_buttons_ul(self, timeout=5) -> WebElement:
     potential_page_buttons_ul_xpaths = [
       "/html/body/main/div/div[2]/div/div[5]/div/div[1]/nav/ul",
@@ -292,21 +501,16 @@ class IndeedJobListingsPage:
           time.sleep(0.1)
     raise NoSuchElementException("Failed to find page buttons ul.")
 
-  def __get_job_listing_anchor(self, job_listing_li: WebElement) -> WebElement:
-    relative_job_listing_anchor_xpath = "./div/div/div/div/div/div/table/tbody/tr/td/div[1]/h2/a"
-    job_listing_anchor = job_listing_li.find_element(By.XPATH, relative_job_listing_anchor_xpath)
-    return job_listing_anchor
-
   def __get_job_description_html(self, timeout=30) -> str:
+    job_description_html = self.__page_data_extractor.get_job_description_html(self.__driver)
+    if job_description_html:
+      return job_description_html
     job_description_id = "jobDescriptionText"
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      try:
-        job_description_div = self.__driver.find_element(By.ID, job_description_id)
-        break
-      except NoSuchElementException:
-        logging.debug("Failed to get job description div. Trying again...")
-        time.sleep(0.5)
+    self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, f"#{job_description_id}"),
+      timeout=timeout
+    )
+    job_description_div = self.__driver.find_element(By.ID, job_description_id)
     job_description_html = job_description_div.get_attribute("innerHTML")
     if job_description_html:
       return job_description_html
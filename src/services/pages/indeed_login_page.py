@@ -2,10 +2,11 @@ import logging
 import time
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from models.configs.indeed_config import IndeedConfig
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
+from services.misc.wait_engine import WaitCondition
 
 
 class IndeedLoginPage:
@@ -18,6 +19,22 @@ class IndeedLoginPage:
     self.__selenium_helper = selenium_helper
     self.__indeed_config = indeed_config
 
+  def is_logged_in(self, timeout=10) -> bool:
+    # Only the signed in header has the account menu -- anything else, including a slow redirect to the sign in page
+    # on secure.indeed.com, counts as signed out
+    try:
+      self.__driver.get("https://myjobs.indeed.com/")
+    except TimeoutException:
+      logging.warning("Timed out loading My Jobs. Checking what loaded...")
+    SIGNED_IN_INDEX = 0
+    return self.__selenium_helper.get_wait_engine().wait_for_any(
+      [
+        WaitCondition(By.CSS_SELECTOR, '[data-gnav-element-name="AccountMenu"], #AccountMenu'),
+        WaitCondition(By.CSS_SELECTOR, '[data-gnav-element-name="SignIn"], input[type="email"]')
+      ],
+      timeout=timeout
+    ) == SIGNED_IN_INDEX
+
   def login(self) -> None:
     base_url = "https://www.indeed.com"
     logging.debug("Logging into %s...", base_url)
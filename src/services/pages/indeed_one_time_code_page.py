@@ -42,25 +42,28 @@ class IndeedOneTimeCodePage:
 
   def resolve_with_mail_dot_com(self) -> None:
     assert self.can_resolve_with_mail_dot_com()
-    while True:
-      try:
-        code = self.__email_handler.get_indeed_one_time_code_from_mdc()
-        break
-      except TimeoutError:
-        send_new_code_span = self.__selenium_helper.get_element_by_exact_text(
-          "Send new code",
-          ElementType.SPAN
-        )
-        send_new_code_span.click()
-        time.sleep(1)
+    # The mailbox connection stays open across resends and is only closed once there's a code
+    try:
+      while True:
+        try:
+          code = self.__email_handler.get_indeed_one_time_code_from_mdc()
+          break
+        except TimeoutError:
+          send_new_code_span = self.__selenium_helper.get_element_by_exact_text(
+            "Send new code",
+            ElementType.SPAN
+          )
+          send_new_code_span.click()
+          time.sleep(1)
+    finally:
+      self.__email_handler.close()
     self.__wait_for_one_time_code_label()
     self.__enter_one_time_code(code)
 
   def wait_for_captcha_resolution(self) -> None:
     captcha_url = "secure.indeed.com"
-    while captcha_url in self.__driver.current_url:
+    while not self.__selenium_helper.get_event_bus().wait_for_url(lambda url: captcha_url not in url, timeout=5):
       logging.debug("Waiting for captcha resolution...")
-      time.sleep(0.5)
 
   def __wait_for_one_time_code_label(self, timeout=10) -> None:
     start_time = time.time()
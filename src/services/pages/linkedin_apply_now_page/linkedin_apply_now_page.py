@@ -9,6 +9,7 @@ from selenium.common.exceptions import (
   NoSuchElementException,
   StaleElementReferenceException
 )
+from entities.page_snapshot import PageSnapshot
 from models.configs.quick_settings import QuickSettings
 from models.enums.element_type import ElementType
 from models.configs.linkedin_config import LinkedinConfig
@@ -93,24 +94,25 @@ class LinkedinApplyNowPage:
     self.__reset_contexts()
     try:
       while self.is_present():
-        self.__wait_for_some_stepper()
-        if self.__contact_info_stepper.is_present():
+        page_snapshot = self.__wait_for_some_stepper()
+        if self.__contact_info_stepper.is_present(page_snapshot):
           self.__contact_info_stepper.resolve()
-        elif self.__home_address_stepper.is_present():
+        elif self.__home_address_stepper.is_present(page_snapshot):
           self.__home_address_stepper.resolve()
-        elif self.__resume_stepper.is_present():
+        elif self.__resume_stepper.is_present(page_snapshot):
           self.__resume_stepper.resolve()
-        elif self.__voluntary_self_indentification_stepper.is_present():
+        elif self.__voluntary_self_indentification_stepper.is_present(page_snapshot):
           self.__voluntary_self_indentification_stepper.resolve()
-        elif self.__work_experience_stepper.is_present():
+        elif self.__work_experience_stepper.is_present(page_snapshot):
           self.__work_experience_stepper.resolve()
-        elif self.__education_stepper.is_present():
+        elif self.__education_stepper.is_present(page_snapshot):
           self.__education_stepper.resolve()
-        elif self.__privacy_policy_stepper.is_present():
+        elif self.__privacy_policy_stepper.is_present(page_snapshot):
           self.__privacy_policy_stepper.resolve()
-        if self.__is_automation_roadblock():
+        page_snapshot = self.__get_page_snapshot()
+        if self.__is_automation_roadblock(page_snapshot):
           return
-        elif self.__is_final_stepper():
+        elif self.__is_final_stepper(page_snapshot):
           if self.__is_easy_apply_scrollable_div():
             self.__selenium_helper.scroll_to_bottom(self.__get_easy_apply_scrollable_div())
           return
@@ -124,18 +126,18 @@ class LinkedinApplyNowPage:
       logging.debug("StaleElementReferenceException. Querying for new easy_apply_div...")
       self.__reset_contexts()
 
-  def __wait_for_some_stepper(self) -> None:
+  def __wait_for_some_stepper(self) -> PageSnapshot:
     while True:
-      if self.__selenium_helper.exact_text_is_present(
+      page_snapshot = self.__get_page_snapshot()
+      if page_snapshot.exact_text_is_present(
         "Submitting this application won’t change your LinkedIn profile.",
-        ElementType.PARAGRAPH,
-        self.__easy_apply_div
+        ElementType.PARAGRAPH
       ):
         time.sleep(0.1)
-        return
-      if self.__is_final_stepper():
+        return self.__get_page_snapshot()
+      if self.__is_final_stepper(page_snapshot):
         time.sleep(0.1)
-        return
+        return self.__get_page_snapshot()
       if self.__is_job_search_safety_reminder():
         logging.debug("Found job search safety reminder. Removing...")
         self.__remove_job_search_safety_reminder()
@@ -154,16 +156,28 @@ class LinkedinApplyNowPage:
     self.__voluntary_self_indentification_stepper.set_context(easy_apply_div)
     self.__work_experience_stepper.set_context(easy_apply_div)
 
-  def __is_automation_roadblock(self) -> bool:
+  def __get_page_snapshot(self) -> PageSnapshot:
+    return self.__selenium_helper.get_page_snapshot(
+      [
+        ElementType.BUTTON,
+        ElementType.H3,
+        ElementType.LABEL,
+        ElementType.PARAGRAPH,
+        ElementType.SPAN
+      ],
+      self.__easy_apply_div
+    )
+
+  def __is_automation_roadblock(self, page_snapshot: PageSnapshot) -> bool:
     return (
-      self.__selenium_helper.exact_text_is_present("Additional", ElementType.H3, self.__easy_apply_div)
-      or self.__selenium_helper.exact_text_is_present("Additional Questions", ElementType.H3, self.__easy_apply_div)
+      page_snapshot.exact_text_is_present("Additional", ElementType.H3)
+      or page_snapshot.exact_text_is_present("Additional Questions", ElementType.H3)
     )
 
-  def __is_final_stepper(self) -> bool:
+  def __is_final_stepper(self, page_snapshot: PageSnapshot) -> bool:
     return (
-      self.__selenium_helper.exact_text_is_present("Submit application", ElementType.BUTTON, self.__easy_apply_div)
-      or self.__selenium_helper.exact_text_is_present('Review your application', ElementType.H3, self.__easy_apply_div)
+      page_snapshot.exact_text_is_present("Submit application", ElementType.BUTTON)
+      or page_snapshot.exact_text_is_present('Review your application', ElementType.H3)
     )
 
   def __continue_stepper(self) -> None:
@@ -6,6 +6,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException
+from entities.page_snapshot import PageSnapshot
 from models.configs.universal_config import Date, UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
@@ -30,12 +31,8 @@ class LinkedinEducationStepper:
   def set_context(self, context_element: WebElement) -> None:
     self.__context_element = context_element
 
-  def is_present(self) -> bool:
-    return self.__selenium_helper.exact_text_is_present(
-      "Education",
-      ElementType.SPAN,
-      self.__context_element
-    )
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
+    return page_snapshot.exact_text_is_present("Education", ElementType.SPAN)
 
   def resolve(self) -> None:
     self.__remove_all_education()
@@ -1,4 +1,5 @@
 from selenium.webdriver.remote.webelement import WebElement
+from entities.page_snapshot import PageSnapshot
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
 
@@ -16,12 +17,8 @@ class LinkedinPrivacyPolicyStepper:
   def set_context(self, context_element: WebElement) -> None:
     self.__context_element = context_element
 
-  def is_present(self) -> bool:
-    return self.__selenium_helper.exact_text_is_present(
-      "Privacy Policy",
-      ElementType.H3,
-      self.__context_element
-    )
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
+    return page_snapshot.exact_text_is_present("Privacy Policy", ElementType.H3)
 
   def resolve(self) -> None:
     if self.__is_terms_and_conditions_label():
@@ -3,6 +3,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 from selenium.common.exceptions import NoSuchElementException
+from entities.page_snapshot import PageSnapshot
 from models.configs.universal_config import UniversalConfig
 from models.enums.element_type import ElementType
 from services.misc.selenium_helper import SeleniumHelper
@@ -33,12 +34,8 @@ class LinkedinResumeStepper:
   def set_context(self, context_element: WebElement) -> None:
     self.__context_element = context_element
 
-  def is_present(self) -> bool:
-    return self.__selenium_helper.exact_text_is_present(
-      "Resume",
-      ElementType.H3,
-      self.__context_element
-    )
+  def is_present(self, page_snapshot: PageSnapshot) -> bool:
+    return page_snapshot.exact_text_is_present("Resume", ElementType.H3)
 
   def resolve(self) -> None:
     if self.__is_compensation_label():
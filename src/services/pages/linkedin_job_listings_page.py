@@ -1,15 +1,13 @@
 import logging
-import math
 import sys
 import time
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 import psutil
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import (
   ElementClickInterceptedException,
-  ElementNotInteractableException,
   NoSuchElementException,
   StaleElementReferenceException,
   TimeoutException
@@ -24,10 +22,15 @@ from models.configs.universal_config import UniversalConfig
 from models.enums.language import Language
 from models.enums.platform import Platform
 from services.misc.database_manager import DatabaseManager
+from services.misc.job_description_fetcher import JobDescriptionFetcher
+from services.misc.job_listing_pipeline import ApplyStage, JobListingPipeline
+from services.misc.linkedin_network_capture import LinkedinNetworkCapture
 from services.misc.proxy_manager import ProxyManager
 from services.pages.linkedin_apply_now_page.linkedin_apply_now_page import LinkedinApplyNowPage
 from services.misc.selenium_helper import SeleniumHelper
 from services.misc.language_parser import LanguageParser
+from services.misc.wait_engine import WaitCondition
+from services.query_url_builders.linkedin_query_url_builder import LinkedinQueryUrlBuilder
 
 
 class LinkedinJobListingsPage:
@@ -35,11 +38,16 @@ class LinkedinJobListingsPage:
   __selenium_helper: SeleniumHelper
   __universal_config: UniversalConfig
   __quick_settings: QuickSettings
+  __linkedin_config: LinkedinConfig
   __database_manager: DatabaseManager
   __language_parser: LanguageParser
   __linkedin_apply_now_page: LinkedinApplyNowPage
   __proxy_manager: ProxyManager
   __jobs_applied_to_this_session: List[dict[str, str]]
+  __prefetched_page: Tuple[int, str] | None
+  __job_listings_window_handle: str
+  __job_description_fetcher: JobDescriptionFetcher | None
+  __network_capture: LinkedinNetworkCapture | None
 
   def __init__(
     self,
@@ -58,6 +66,7 @@ class LinkedinJobListingsPage:
     self.__language_parser = language_parser
     self.__universal_config = universal_config
     self.__quick_settings = quick_settings
+    self.__linkedin_config = linkedin_config
     self.__linkedin_apply_now_page = LinkedinApplyNowPage(
       driver,
       selenium_helper,
@@ -67,90 +76,286 @@ class LinkedinJobListingsPage:
     )
     self.__proxy_manager = proxy_manager
     self.__jobs_applied_to_this_session = []
+    self.__prefetched_page = None
+    # Tracked by handle -- once a prefetched page takes over, the results tab is no longer the oldest one
+    self.__job_listings_window_handle = driver.current_window_handle
+    self.__job_description_fetcher = None
+    if quick_settings.bot_behavior.fetch_descriptions_over_http:
+      self.__job_description_fetcher = JobDescriptionFetcher(
+        quick_settings.bot_behavior.http_fetch_workers,
+        proxy_config=selenium_helper.get_proxy_config()
+      )
+    self.__network_capture = None
+    if linkedin_config.capture_job_postings:
+      self.__network_capture = LinkedinNetworkCapture(driver, selenium_helper.get_event_bus())
+
+  def get_jobs_applied_count(self) -> int:
+    return len(self.__jobs_applied_to_this_session)
+
+  def handle_current_query(
+    self,
+    query_url_builder: LinkedinQueryUrlBuilder,
+    search_term: str,
+    start_page=1
+  ) -> None:
+    self.__job_listings_window_handle = self.__driver.current_window_handle
+    pipeline = JobListingPipeline(
+      Platform.LINKEDIN.value,
+      self.__filter_brief_job_listing,
+      ApplyStage(self.__apply_to_brief_job_listing),
+      max_queue_size=self.__quick_settings.bot_behavior.pipeline_queue_size,
+      filter_workers=self.__quick_settings.bot_behavior.http_fetch_workers if self.__job_description_fetcher else 1
+    )
+    try:
+      self.__discover_job_listings(pipeline, query_url_builder, search_term, start_page)
+    finally:
+      pipeline.close()
+      self.__close_job_description_fetcher()
 
-  def handle_current_query(self) -> None:
-    total_jobs_tried = 0
-    job_listing_li_index = 0
+  def __discover_job_listings(
+    self,
+    pipeline: JobListingPipeline,
+    query_url_builder: LinkedinQueryUrlBuilder,
+    search_term: str,
+    start_page: int
+  ) -> None:
+    page_number = start_page
     while True:
-      total_jobs_tried, job_listing_li_index = self.__handle_incrementors(total_jobs_tried, job_listing_li_index)
-      try:
-        self.__handle_page_context(total_jobs_tried)
-      except NoSuchElementException:
-        logging.info("No Job Listings left -- Finished with query.")
-        return
-      except NoMatchingJobsPageException:
-        logging.info("No Job Listings left -- Finished with query.")
-        return
+      if page_number > start_page:
+        try:
+          self.__go_to_page(query_url_builder, search_term, page_number)
+        except NoMatchingJobsPageException:
+          logging.info("No Job Listings left -- Finished with query.")
+          return
       if self.__is_no_matching_jobs_page():
         logging.info("No matching jobs... Ending query.")
         return
-      job_listing_li = self.__get_job_listing_li(job_listing_li_index)
-      if job_listing_li is None:
+      job_cards = self.__harvest_job_cards()
+      self.__capture_network_responses()
+      if len(job_cards) == 0:
         logging.info("No Job Listings left -- Finished with query.")
         return
-      brief_job_listing = self.__build_new_brief_job_listing(job_listing_li)
-      temp_job_listing = LinkedinJobListing(self.__language_parser, brief_job_listing)
-      self.__add_job_listing_to_db(temp_job_listing)
-      brief_job_listing.print()
-      if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
-        logging.info("Ignoring Brief Job Listing because we've already applied this session. Skipping...")
-        continue
-      if brief_job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        logging.info("Ignoring Brief Job Listing because it doesn't pass the filter check. Skipping...")
-        self.__add_application_to_db(temp_job_listing)
-        continue
-      if self.__something_went_wrong():
-        logging.info('"Something went wrong", likely rate limited behavior. Skipping...')
-        continue
-      try:
-        self.__select_job(job_listing_li)
-      except StaleElementReferenceException:
-        job_listing_li = self.__get_job_listing_li(job_listing_li_index)
+      is_a_next_page = self.__is_a_next_page()
+      if is_a_next_page and self.__linkedin_config.prefetch_next_page:
+        self.__prefetch_page(query_url_builder, search_term, page_number + 1)
+      brief_job_listings = [
+        LinkedinBriefJobListing(self.__language_parser, job_card)
+        for job_card in job_cards
+      ]
+      # Classified as one batch so each listing's language check is a cache hit
+      self.__language_parser.get_languages([
+        brief_job_listing.get_language_content()
+        for brief_job_listing in brief_job_listings
+      ])
+      self.__sync_job_description_fetcher()
+      for brief_job_listing in brief_job_listings:
+        pipeline.submit(brief_job_listing)
+      # Applying means selecting the listing's li, so this page has to be finished before leaving it
+      pipeline.drain()
+      if not is_a_next_page:
+        logging.info("No Job Listings left -- Finished with query.")
+        return
+      page_number += 1
+
+  def __filter_brief_job_listing(self, brief_job_listing: LinkedinBriefJobListing) -> bool:
+    temp_job_listing = LinkedinJobListing(self.__language_parser, brief_job_listing)
+    self.__add_job_listing_to_db(temp_job_listing)
+    brief_job_listing.print()
+    if brief_job_listing.to_minimal_dict() in self.__jobs_applied_to_this_session:
+      logging.info("Ignoring Brief Job Listing because we've already applied this session. Skipping...")
+      return False
+    if brief_job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if not brief_job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      logging.info("Ignoring Brief Job Listing because it doesn't pass the filter check. Skipping...")
+      self.__add_application_to_db(temp_job_listing)
+      return False
+    job_description_html = self.__get_captured_job_description_html(brief_job_listing)
+    if job_description_html is None and self.__job_description_fetcher and brief_job_listing.get_job_id():
+      job_description_html = self.__fetch_job_description_html(self.__job_description_fetcher, brief_job_listing)
+    if job_description_html is None:
+      return True   # The browser will have to take a look
+    return self.__filter_full_job_listing(
+      LinkedinJobListing(self.__language_parser, brief_job_listing, job_description_html=job_description_html)
+    )
+
+  def __fetch_job_description_html(
+    self,
+    job_description_fetcher: JobDescriptionFetcher,
+    brief_job_listing: LinkedinBriefJobListing
+  ) -> str | None:
+    # The guest job posting endpoint serves the description without the logged in page's scripts
+    job_posting_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{brief_job_listing.get_job_id()}"
+    return job_description_fetcher.fetch_description_html(
+      job_posting_url,
+      ".show-more-less-html__markup"
+    )
+
+  def __get_captured_job_description_html(self, brief_job_listing: LinkedinBriefJobListing) -> str | None:
+    job_id = brief_job_listing.get_job_id()
+    if self.__network_capture is None or not job_id:
+      return None
+    return self.__network_capture.get_job_description_html(job_id)
+
+  def __capture_network_responses(self) -> None:
+    if self.__network_capture:
+      self.__network_capture.capture()
+      logging.debug("Captured %s job descriptions so far.", self.__network_capture.get_job_description_count())
+
+  def __filter_full_job_listing(self, job_listing: LinkedinJobListing) -> bool:
+    self.__add_job_listing_to_db(job_listing)
+    if job_listing.get_language() != Language.ENGLISH:
+      logging.info("Ignoring Job Listing because its not in english.")
+      return False
+    if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
+      logging.info("Ignoring Job Listing because it doesn't pass the filter check. Skipping...")
+      self.__add_application_to_db(job_listing)
+      return False
+    return True
+
+  def __close_job_description_fetcher(self) -> None:
+    # Drops the kept-alive connections between queries -- the session reconnects on its next fetch
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.close()
+
+  def __sync_job_description_fetcher(self) -> None:
+    if self.__job_description_fetcher:
+      self.__job_description_fetcher.sync_session(
+        self.__selenium_helper.get_user_agent(),
+        self.__selenium_helper.get_all_cookies()
+      )
+
+  def __apply_to_brief_job_listing(self, brief_job_listing: LinkedinBriefJobListing) -> None:
+    if self.__something_went_wrong():
+      logging.info('"Something went wrong", likely rate limited behavior. Skipping...')
+      return
+    # Clicking earlier cards can have loaded this one's posting -- if it's there, rejects never get clicked
+    self.__capture_network_responses()
+    job_description_html = self.__get_captured_job_description_html(brief_job_listing)
+    job_listing = None
+    if job_description_html is not None:
+      job_listing = LinkedinJobListing(
+        self.__language_parser,
+        brief_job_listing,
+        job_description_html=job_description_html
+      )
+      if not self.__filter_full_job_listing(job_listing):
+        return
+    job_listing_li = self.__get_job_listing_li(brief_job_listing.get_job_id())
+    if job_listing_li is None:
+      logging.info("Job Listing li is no longer on the page. Skipping...")
+      return
+    try:
+      self.__select_job(job_listing_li)
+    except StaleElementReferenceException:
+      job_listing_li = self.__get_job_listing_li(brief_job_listing.get_job_id())
+    if job_listing is None:
       job_listing = self.__build_new_job_listing(brief_job_listing)
-      self.__add_job_listing_to_db(job_listing)
-      if job_listing.get_language() != Language.ENGLISH:
-        logging.info("Ignoring Job Listing because its not in english.")
-        continue
-      if not job_listing.passes_filter_check(self.__universal_config, self.__quick_settings):
-        logging.info("Ignoring Job Listing because it doesn't pass the filter check. Skipping...")
-        self.__add_application_to_db(job_listing)
-        continue
-      if not self.__is_apply_button() and not self.__is_easy_apply_button():
-        logging.info("This Job Listing has no apply button. Skipping...")
-        continue
+      if not self.__filter_full_job_listing(job_listing):
+        return
+    if not self.__is_apply_button() and not self.__is_easy_apply_button():
+      logging.info("This Job Listing has no apply button. Skipping...")
+      return
+    try:
+      self.__apply_to_selected_job()
+    except NoMatchingJobsPageException:
+      input("Lets get a proper logging statement in here -- what happened?")
+    self.__driver.switch_to.window(self.__job_listings_window_handle)
+    self.__jobs_applied_to_this_session.append(brief_job_listing.to_minimal_dict())
+    self.__add_application_to_db(job_listing)
+    self.__handle_potential_overload()
+
+  def __harvest_job_cards(self, timeout=30) -> List[Dict[str, str | None]]:
+    # The results list is virtualized -- cards only render once they're near the viewport,
+    # so each li is scrolled into view in-page and read as soon as its content exists.
+    logging.debug("Harvesting Job Listing cards...")
+    job_listings_ul = self.__get_job_listings_ul()
+    previous_script_timeout = self.__driver.timeouts.script
+    try:
+      # The script stops at its own deadline with what it has -- the driver's timeout is only a backstop
+      self.__driver.set_script_timeout(timeout + 30)
       try:
-        self.__apply_to_selected_job()
-      except NoMatchingJobsPageException:
-        input("Lets get a proper logging statement in here -- what happened?")
-      self.__driver.switch_to.window(self.__driver.window_handles[0])
-      self.__jobs_applied_to_this_session.append(brief_job_listing.to_minimal_dict())
-      self.__add_application_to_db(job_listing)
-      self.__handle_potential_overload()
-
-  def __handle_incrementors(self, total_jobs_tried: int, job_listing_li_index: int) -> Tuple[int, int]:
-    total_jobs_tried += 1
-    if total_jobs_tried >= 4:
-      self.__selenium_helper.scroll_down(self.__get_job_listings_ul())
-    job_listing_li_index = total_jobs_tried % 26
-    if job_listing_li_index == 0:
-      total_jobs_tried += 1
-      job_listing_li_index = 1
-    return (total_jobs_tried, job_listing_li_index)
+        job_cards = self.__run_harvest_job_cards_script(job_listings_ul, timeout)
+      except TimeoutException:
+        logging.warning("Timed out harvesting Job Listing cards. Harvesting the cards rendered so far...")
+        job_cards = self.__run_harvest_job_cards_script(job_listings_ul, 0)
+    finally:
+      self.__driver.set_script_timeout(previous_script_timeout)
+    logging.debug("Harvested %s Job Listing cards.", len(job_cards))
+    return job_cards
+
+  def __run_harvest_job_cards_script(
+    self,
+    job_listings_ul: WebElement,
+    timeout: float
+  ) -> List[Dict[str, str | None]]:
+    return self.__driver.execute_async_script(r"""
+      const [jobListingsUl, harvestTimeoutMs, done] = arguments;
+      const harvestDeadline = performance.now() + harvestTimeoutMs;
+      const getText = (li, relativeXpath) => {
+        const node = document.evaluate(
+          relativeXpath, li, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        return node ? node.innerText.trim() : null;
+      };
+      const getJobId = (li, url) => {
+        if (li.dataset.occludableJobId) {
+          return li.dataset.occludableJobId;
+        }
+        const match = /\/jobs\/view\/(\d+)|currentJobId=(\d+)/.exec(url || '');
+        return match ? (match[1] || match[2]) : null;
+      };
+      const waitForFrame = () => new Promise((resolve) => setTimeout(resolve, 50));
+      (async () => {
+        const jobCards = [];
+        const lis = Array.from(jobListingsUl.children).filter((el) => el.tagName === 'LI');
+        for (const li of lis) {
+          li.scrollIntoView({block: 'center'});
+          let anchor = li.querySelector(':scope > div > a');
+          // Past the deadline only cards that already rendered are read
+          for (let attempt = 0; attempt < 20 && !anchor && performance.now() < harvestDeadline; attempt++) {
+            await waitForFrame();
+            anchor = li.querySelector(':scope > div > a');
+          }
+          if (!anchor) {
+            continue;
+          }
+          const title = getText(li, './div/a/div/div/div[2]/div[1]/div[1]/span[1]/strong');
+          const company = getText(li, './div/a/div/div/div[2]/div[1]/div[2]/div');
+          const jobId = getJobId(li, anchor.href);
+          if (title === null || company === null || jobId === null) {
+            continue;
+          }
+          jobCards.push({
+            title: title,
+            company: company,
+            // Some cards have no location line
+            location: getText(li, './div/a/div/div/div[2]/div[1]/div[3]/div') || '',
+            pay: getText(li, './div/a/div/div/div[2]/div[1]/div[4]/div[1]'),
+            url: anchor.href,
+            job_id: jobId
+          });
+        }
+        if (lis.length > 0) {
+          lis[0].scrollIntoView({block: 'center'});
+        }
+        done(jobCards);
+      })();
+    """, job_listings_ul, int(timeout * 1000))
 
   def __select_job(self, job_listing_li: WebElement, timeout=60) -> None:
     assert not self.__job_listing_li_is_active(job_listing_li)
     self.__selenium_helper.scroll_into_view(job_listing_li)
     self.__click_job_listing_li(job_listing_li)
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      if self.__job_listing_li_is_active(job_listing_li):
-        return
-      logging.debug("Waiting for Job Listing li to be active to confirm Job Listing click...")
-      time.sleep(0.1)
-    raise TimeoutError("Timed out waiting for full Job Listing to load.")
+    active_class = "job-card-job-posting-card-wrapper--active"
+    logging.debug("Waiting for Job Listing li to be active to confirm Job Listing click...")
+    if not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, f".{active_class}"),
+      job_listing_li,
+      timeout
+    ):
+      raise TimeoutError("Timed out waiting for full Job Listing to load.")
 
   def __job_listing_li_is_active(self, job_listing_li: WebElement) -> bool:
     active_class = "job-card-job-posting-card-wrapper--active"
@@ -171,25 +376,42 @@ class LinkedinJobListingsPage:
         logging.debug("Attempting to click Job Listing li...")
         time.sleep(0.1)
 
-  def __handle_page_context(self, total_jobs_tried: int) -> None:
-    if total_jobs_tried > 26 and total_jobs_tried % 26 == 1:
-      logging.info("Attempting to go to page: %s...", math.ceil(total_jobs_tried / 26))
+  def __is_a_next_page(self) -> bool:
+    try:
       next_page_span = self.__get_next_page_span()
-      while True:
-        try:
-          next_page_span.click()
-          while True:
-            if self.__is_job_listings_ul():
-              break
-            if self.__is_no_matching_jobs_page():
-              raise NoMatchingJobsPageException()
-            logging.info("Waiting for next page to load...")
-            time.sleep(0.1)
-          return
-        except ElementNotInteractableException:
-          logging.debug("Failed to click next page span... Scrolling down and trying again...")
-          self.__selenium_helper.scroll_down(self.__get_job_listings_ul())
-          time.sleep(0.1)
+    except NoSuchElementException:
+      return False
+    return next_page_span.get_attribute("disabled") is None
+
+  def __prefetch_page(self, query_url_builder: LinkedinQueryUrlBuilder, search_term: str, page_number: int) -> None:
+    logging.debug("Prefetching page %s...", page_number)
+    page_url = query_url_builder.build(search_term, page_number)
+    window_handle = self.__selenium_helper.open_background_tab(page_url)
+    self.__prefetched_page = (page_number, window_handle)
+
+  def __go_to_page(self, query_url_builder: LinkedinQueryUrlBuilder, search_term: str, page_number: int) -> None:
+    logging.info("Attempting to go to page: %s...", page_number)
+    self.__driver.switch_to.window(self.__job_listings_window_handle)
+    if self.__prefetched_page and self.__prefetched_page[0] == page_number:
+      # The prefetched tab takes over as the Job Listings tab
+      self.__selenium_helper.replace_current_tab(self.__prefetched_page[1])
+      self.__job_listings_window_handle = self.__prefetched_page[1]
+      self.__prefetched_page = None
+    else:
+      self.__driver.get(query_url_builder.build(search_term, page_number))
+      self.__selenium_helper.record_page_load()
+    logging.info("Waiting for page to load...")
+    NO_MATCHING_JOBS_INDEX = 1
+    while True:
+      index = self.__selenium_helper.get_wait_engine().wait_for_any([
+        WaitCondition(By.CSS_SELECTOR, '#main [aria-label="LinkedIn Footer Content"]'),
+        WaitCondition(By.CSS_SELECTOR, ElementType.H2.value, "No matching jobs found")
+      ])
+      if index == NO_MATCHING_JOBS_INDEX:
+        raise NoMatchingJobsPageException()
+      if index is not None:
+        return
+      logging.info("Waiting for page to load...")
 
   def __apply_to_selected_job(self) -> None:
     logging.info("Applying to job...")
@@ -202,15 +424,14 @@ class LinkedinJobListingsPage:
     else:
       raise RuntimeError("An apply button is found, but doesn't meet criteria of either apply button.")
 
-  def __wait_for_new_tab_to_open(self, starting_tab_count: int, timeout=10) -> None:
+  def __wait_for_new_tab_to_open(self, starting_window_handles: List[str], timeout=10) -> None:
     start_time = time.time()
     while time.time() - start_time < timeout:
-      if len(self.__driver.window_handles) > starting_tab_count:
+      if self.__selenium_helper.get_event_bus().wait_for_new_tab(starting_window_handles, timeout=1):
         time.sleep(0.1)   # This little bit of buffer time seems to help with some issues
         return
       self.__handle_potential_problems()
       logging.debug("Waiting for new tab to open...")
-      time.sleep(0.1)
     raise TimeoutError("Timed out waiting for a new tab to open...")
 
   def __click_apply_button(self) -> None:
@@ -234,24 +455,14 @@ class LinkedinJobListingsPage:
     self.__linkedin_apply_now_page.apply()
 
   def __apply_on_company_site(self) -> None:
-    starting_tab_count = len(self.__driver.window_handles)
+    starting_window_handles = self.__driver.window_handles
     self.__click_apply_button()
     try:
-      self.__wait_for_new_tab_to_open(starting_tab_count)
+      self.__wait_for_new_tab_to_open(starting_window_handles)
     except TimeoutError:
       # Weird bug where occasionally the Linkedin apply button does nothing
       logging.warning("Apply button is dead... skipping...")
 
-  def __build_new_brief_job_listing(self, job_listing_li: WebElement) -> LinkedinBriefJobListing:
-    self.__selenium_helper.scroll_into_view(job_listing_li)
-    while True:
-      try:
-        brief_job_listing = LinkedinBriefJobListing(self.__language_parser, job_listing_li)
-        break
-      except NoSuchElementException:
-        self.__selenium_helper.scroll_down(self.__get_job_listings_ul())
-    return brief_job_listing
-
   def __build_new_job_listing(self, brief_job_listing: LinkedinBriefJobListing, timeout=3) -> LinkedinJobListing:
     start_time = time.time()
     while time.time() - start_time < timeout:
@@ -270,15 +481,13 @@ class LinkedinJobListingsPage:
 
   def __get_job_description_content_div(self, timeout=5.0) -> WebElement:
     job_description_content_div_selector = "div.jobs-description-content__text--stretch"
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-      try:
-        job_description_content_div = self.__driver.find_element(By.CSS_SELECTOR, job_description_content_div_selector)
-        return job_description_content_div
-      except NoSuchElementException:
-        logging.info("Waiting for job description content div...")
-        time.sleep(0.1)
-    raise TimeoutException("Timed out waiting for job description content div.")
+    logging.info("Waiting for job description content div...")
+    if not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, job_description_content_div_selector),
+      timeout=timeout
+    ):
+      raise TimeoutException("Timed out waiting for job description content div.")
+    return self.__driver.find_element(By.CSS_SELECTOR, job_description_content_div_selector)
 
   def __get_full_job_details_div(self) -> WebElement | None:
     full_job_details_div_selector = ".jobs-details__main-content.jobs-details__main-content--single-pane.full-width"
@@ -299,8 +508,10 @@ class LinkedinJobListingsPage:
           return None
     return full_job_details_div
 
-  def __get_job_listing_li(self, index: int) -> WebElement | None:
-    relative_job_listing_li_xpath = f"./li[{index}]"
+  def __get_job_listing_li(self, job_id: str) -> WebElement | None:
+    relative_job_listing_li_xpath = (
+      f"./li[@data-occludable-job-id='{job_id}' or .//a[contains(@href, '{job_id}')]]"
+    )
     job_listings_ul = self.__get_job_listings_ul()
     if job_listings_ul is None:
       return None
@@ -310,19 +521,6 @@ class LinkedinJobListingsPage:
       return None
     return job_listing_li
 
-  def __is_job_listings_ul(self) -> bool:
-    try:
-      linkedin_footer = self.__selenium_helper.get_element_by_aria_label(
-        "LinkedIn Footer Content",
-        self.__get_main_content_div()
-      )
-      linkedin_footer.find_element(By.XPATH, "..")
-      return True
-    except NoSuchElementException:
-      return False
-    except StaleElementReferenceException:
-      return False
-
   def __get_job_listings_ul(self, timeout=10) -> WebElement | None:
     logging.debug("Getting Job Listings ul...")
     start_time = time.time()
@@ -355,24 +553,42 @@ class LinkedinJobListingsPage:
     )
 
   def __wait_for_any_apply_button(self) -> None:
-    while True:
-      if self.__is_apply_button():
-        return
-      elif self.__is_easy_apply_button():
-        return
+    apply_span_selector = "#jobs-apply-button-id > span"
+    while self.__selenium_helper.get_wait_engine().wait_for_any(
+      [
+        WaitCondition(By.CSS_SELECTOR, apply_span_selector, "Apply"),
+        WaitCondition(By.CSS_SELECTOR, apply_span_selector, "Easy Apply")
+      ],
+      self.__wait_for_full_job_details_div()
+    ) is None:
       logging.debug("Waiting for any apply button...")
-      time.sleep(0.1)
 
   def __wait_for_apply_button(self) -> None:
-    while not self.__is_apply_button():
+    while not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, "#jobs-apply-button-id > span", "Apply"),
+      self.__wait_for_full_job_details_div(),
+      timeout=1
+    ):
       self.__handle_potential_problems()
       logging.debug("Waiting for apply button...")
-      time.sleep(0.1)
 
   def __wait_for_easy_apply_button(self) -> None:
-    while not self.__is_easy_apply_button():
+    while not self.__selenium_helper.get_wait_engine().wait_for(
+      WaitCondition(By.CSS_SELECTOR, "#jobs-apply-button-id > span", "Easy Apply"),
+      self.__wait_for_full_job_details_div(),
+      timeout=1
+    ):
       self.__handle_potential_problems()
       logging.debug("Waiting for Easy Apply button...")
+
+  def __wait_for_full_job_details_div(self) -> WebElement:
+    # Waiting without a base element would search the whole document, where other cards' buttons could match
+    while True:
+      full_job_details_div = self.__get_full_job_details_div()
+      if full_job_details_div is not None:
+        return full_job_details_div
+      self.__handle_potential_problems()
+      logging.debug("Waiting for full job details div to load...")
       time.sleep(0.1)
 
   def __is_apply_button(self) -> bool:
@@ -472,6 +688,8 @@ class LinkedinJobListingsPage:
 
   def __handle_potential_overload(self) -> None:
     jobs_open = len(self.__driver.window_handles) - 1
+    if self.__prefetched_page:
+      jobs_open -= 1
     pause_every_x_jobs = self.__quick_settings.bot_behavior.pause_every_x_jobs
     current_memory_usage = psutil.virtual_memory().percent
     logging.debug("Current memory usage: %s%s", current_memory_usage, "%")
@@ -1,10 +1,10 @@
 import logging
-import time
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
 from models.configs.linkedin_config import LinkedinConfig
 from services.misc.selenium_helper import SeleniumHelper
+from services.misc.wait_engine import WaitCondition
 
 
 class LinkedinLoginPage:
@@ -17,6 +17,21 @@ class LinkedinLoginPage:
     self.__selenium_helper = selenium_helper
     self.__linkedin_config = linkedin_config
 
+  def is_logged_in(self, timeout=10) -> bool:
+    # Only the signed in nav has the "Me" menu -- anything else, including a slow redirect, counts as signed out
+    try:
+      self.__driver.get("https://www.linkedin.com/feed/")
+    except TimeoutException:
+      logging.warning("Timed out loading the feed. Checking what loaded...")
+    SIGNED_IN_INDEX = 0
+    return self.__selenium_helper.get_wait_engine().wait_for_any(
+      [
+        WaitCondition(By.CSS_SELECTOR, ".global-nav__me"),
+        WaitCondition(By.CSS_SELECTOR, "#username, #session_key, .authwall-join-form")
+      ],
+      timeout=timeout
+    ) == SIGNED_IN_INDEX
+
   def login(self) -> None:
     logging.debug("Logging in...")
     self.__driver.get("https://linkedin.com/login")
@@ -37,9 +52,11 @@ class LinkedinLoginPage:
     sign_in_button_selector = ".btn__primary--large.from__button--floating"
     sign_in_button = self.__driver.find_element(By.CSS_SELECTOR, sign_in_button_selector)
     sign_in_button.click()
-    while (
-      'https://www.linkedin.com/checkpoint/challenge' in self.__driver.current_url
-      or 'https://www.linkedin.com/login' in self.__driver.current_url
+    while not self.__selenium_helper.get_event_bus().wait_for_url(
+      lambda url: (
+        'https://www.linkedin.com/checkpoint/challenge' not in url
+        and 'https://www.linkedin.com/login' not in url
+      ),
+      timeout=5
     ):
       logging.debug('Waiting for user to resolve security checkpoint...')
-      time.sleep(0.5)
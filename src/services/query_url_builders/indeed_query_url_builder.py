@@ -4,6 +4,7 @@ from models.configs.universal_config import UniversalConfig
 
 
 class IndeedQueryUrlBuilder:
+  __RESULTS_PER_PAGE = 10
   __search_terms: List[str]
   __ignore_terms: List[str]
   __location: str | None
@@ -31,7 +32,7 @@ class IndeedQueryUrlBuilder:
     self.__senior_level = universal_config.search.experience.senior
     self.__url = ""
 
-  def build(self) -> str:
+  def build(self, page_number=1) -> str:
     self.__add_base()
     self.__add_search_terms()
     self.__add_ignore_terms()
@@ -45,6 +46,7 @@ class IndeedQueryUrlBuilder:
     self.__add_hybrid_if_needed()
     # self.__add_exp_level_tags_as_needed()
     self.__add_post_attributes_tag_if_needed()
+    self.__add_page(page_number)
     return self.__url
 
   def __add_base(self) -> None:
@@ -115,3 +117,7 @@ class IndeedQueryUrlBuilder:
       post_tag_needed = True
     if post_tag_needed:
       self.__url += "%3B"
+
+  def __add_page(self, page_number: int) -> None:
+    if page_number > 1:
+      self.__url += f"&start={(page_number - 1) * self.__RESULTS_PER_PAGE}"
@@ -4,6 +4,7 @@ from models.configs.universal_config import UniversalConfig
 
 
 class LinkedinQueryUrlBuilder:
+  __RESULTS_PER_PAGE = 25
   __ignore_terms: List[str]
   __location: str | None
   __max_age_in_days: int
@@ -31,7 +32,7 @@ class LinkedinQueryUrlBuilder:
     self.__easy_apply_only = quick_settings.bot_behavior.easy_apply_only.linkedin
     self.__url = ""
 
-  def build(self, search_term: str) -> str:
+  def build(self, search_term: str, page_number=1) -> str:
     self.__add_base()
     self.__add_location()
     self.__add_remote_hybrid_onsite()
@@ -39,6 +40,7 @@ class LinkedinQueryUrlBuilder:
     self.__add_max_age()
     self.__add_easy_apply_only()
     self.__add_search_term(search_term)
+    self.__add_page(page_number)
     return self.__url
 
   def __add_base(self) -> None:
@@ -111,3 +113,7 @@ class LinkedinQueryUrlBuilder:
         if term != first_ignore_term:
           self.__url += f"%20or%20{term}"
       self.__url += "%29"
+
+  def __add_page(self, page_number: int) -> None:
+    if page_number > 1:
+      self.__url += f"&start={(page_number - 1) * self.__RESULTS_PER_PAGE}"
@@ -0,0 +1,185 @@
+import re
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, Iterator, List
+import pytest
+from services.misc.email_handler import EmailHandler
+
+
+class StandInMailbox:
+  messages: List[Dict]
+  idling_handlers: List["StandInImapHandler"]
+  lock: threading.Lock
+  answers_done: bool
+  message_with_idle_continuation: Dict | None
+
+  def __init__(self):
+    self.messages = []
+    self.idling_handlers = []
+    self.lock = threading.Lock()
+    self.answers_done = True
+    self.message_with_idle_continuation = None
+
+  def add(self, sender: str, subject: str) -> None:
+    with self.lock:
+      self.messages.append({"uid": len(self.messages) + 1, "sender": sender, "subject": subject, "deleted": False})
+      for handler in self.idling_handlers:
+        handler.write_lines(f"* {len(self.messages)} EXISTS")
+
+
+class StandInImapHandler(socketserver.StreamRequestHandler):
+  # Just enough IMAP4rev1 + IDLE for EmailHandler, speaking plain text on a local port
+  server: "StandInImapServer"
+
+  def handle(self):
+    mailbox = self.server.mailbox
+    self.write_lines("* OK [CAPABILITY IMAP4rev1 IDLE] Stand-in ready")
+    while True:
+      line = self.rfile.readline()
+      if not line:
+        return
+      tag, command, arguments = (line.decode().rstrip("\r\n").split(" ", 2) + [""])[:3]
+      command = command.upper()
+      if command == "CAPABILITY":
+        self.write_lines("* CAPABILITY IMAP4rev1 IDLE", f"{tag} OK CAPABILITY completed")
+      elif command in ("LOGIN", "EXPUNGE", "NOOP"):
+        self.write_lines(f"{tag} OK {command} completed")
+      elif command == "SELECT":
+        self.write_lines(f"* {len(mailbox.messages)} EXISTS", f"{tag} OK [READ-WRITE] SELECT completed")
+      elif command == "UID":
+        self.__handle_uid(tag, arguments)
+      elif command == "IDLE":
+        self.__handle_idle(tag)
+      elif command == "LOGOUT":
+        self.write_lines("* BYE Logging out", f"{tag} OK LOGOUT completed")
+        return
+      else:
+        self.write_lines(f"{tag} BAD Unknown command")
+
+  def write_lines(self, *lines: str) -> None:
+    self.wfile.write("".join(line + "\r\n" for line in lines).encode())
+
+  def __handle_uid(self, tag: str, arguments: str) -> None:
+    mailbox = self.server.mailbox
+    subcommand, arguments = arguments.split(" ", 1)
+    subcommand = subcommand.upper()
+    if subcommand == "SEARCH":
+      sender_match = re.search(r'FROM "([^"]+)"', arguments)
+      assert sender_match
+      uids = [
+        str(message["uid"])
+        for message in mailbox.messages
+        if not message["deleted"] and sender_match.group(1) in message["sender"].lower()
+      ]
+      self.write_lines(" ".join(["* SEARCH"] + uids), f"{tag} OK SEARCH completed")
+      return
+    uid = int(arguments.split(" ", 1)[0])
+    message = next(message for message in mailbox.messages if message["uid"] == uid)
+    if subcommand == "FETCH":
+      headers = f"From: {message['sender']}\r\nSubject: {message['subject']}\r\n\r\n"
+      self.wfile.write(
+        f"* {uid} FETCH (UID {uid} BODY[HEADER.FIELDS (FROM SUBJECT)] {{{len(headers)}}}\r\n{headers})\r\n".encode()
+      )
+    elif subcommand == "STORE":
+      message["deleted"] = True
+    self.write_lines(f"{tag} OK UID {subcommand} completed")
+
+  def __handle_idle(self, tag: str) -> None:
+    mailbox = self.server.mailbox
+    with mailbox.lock:
+      if mailbox.message_with_idle_continuation is not None:
+        # The new mail's EXISTS goes out in the same packet as the continuation
+        message = mailbox.message_with_idle_continuation
+        mailbox.message_with_idle_continuation = None
+        mailbox.messages.append({**message, "uid": len(mailbox.messages) + 1, "deleted": False})
+        self.write_lines("+ idling", f"* {len(mailbox.messages)} EXISTS")
+      else:
+        self.write_lines("+ idling")
+      mailbox.idling_handlers.append(self)
+    line = self.rfile.readline()
+    with mailbox.lock:
+      mailbox.idling_handlers.remove(self)
+    if line.strip().upper() == b"DONE" and mailbox.answers_done:
+      self.write_lines(f"{tag} OK IDLE terminated")
+    elif line.strip().upper() == b"DONE":
+      # Gone quiet -- holds the connection without ever answering
+      self.rfile.readline()
+
+
+class StandInImapServer(socketserver.ThreadingTCPServer):
+  daemon_threads = True
+  allow_reuse_address = True
+  mailbox: StandInMailbox
+
+  def __init__(self, mailbox: StandInMailbox):
+    super().__init__(("127.0.0.1", 0), StandInImapHandler)
+    self.mailbox = mailbox
+
+
+@pytest.fixture(name="mailbox")
+def fixture_mailbox() -> StandInMailbox:
+  return StandInMailbox()
+
+
+@pytest.fixture(name="email_handler")
+def fixture_email_handler(mailbox: StandInMailbox, monkeypatch: pytest.MonkeyPatch) -> Iterator[EmailHandler]:
+  monkeypatch.setenv("MAIL_DOT_COM_EMAIL", "applicant@mail.com")
+  monkeypatch.setenv("MAIL_DOT_COM_PASS", "password")
+  server = StandInImapServer(mailbox)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  email_handler = EmailHandler(host="127.0.0.1", port=server.server_address[1], use_ssl=False)
+  yield email_handler
+  email_handler.close()
+  server.shutdown()
+  server.server_close()
+
+
+def test_returns_the_newest_code_already_in_the_inbox(email_handler: EmailHandler, mailbox: StandInMailbox):
+  mailbox.add("Indeed <alert@indeed.com>", "123456 is your Indeed one-time code")
+  mailbox.add("Someone <someone@example.com>", "999999 is not from Indeed")
+  mailbox.add("Indeed <alert@indeed.com>", "654321 is your Indeed one-time code")
+  assert email_handler.get_indeed_one_time_code_from_mdc(timeout=5) == "654321"
+  assert [message["deleted"] for message in mailbox.messages] == [False, False, True]
+
+
+def test_wakes_up_when_mail_arrives_while_idling(email_handler: EmailHandler, mailbox: StandInMailbox):
+  timer = threading.Timer(0.3, mailbox.add, ("Indeed <alert@indeed.com>", "246810 is your Indeed one-time code"))
+  timer.start()
+  start_time = time.time()
+  code = email_handler.get_indeed_one_time_code_from_mdc(timeout=10)
+  timer.join()
+  assert code == "246810"
+  assert time.time() - start_time < 2   # Well inside the 3 s refresh, so the EXISTS woke it up
+
+
+def test_sees_exists_sent_along_with_the_idle_continuation(email_handler: EmailHandler, mailbox: StandInMailbox):
+  mailbox.message_with_idle_continuation = {
+    "sender": "Indeed <alert@indeed.com>",
+    "subject": "135790 is your Indeed one-time code"
+  }
+  start_time = time.time()
+  code = email_handler.get_indeed_one_time_code_from_mdc(timeout=10)
+  assert code == "135790"
+  assert time.time() - start_time < 2
+
+
+def test_times_out_when_the_server_sends_no_greeting(monkeypatch: pytest.MonkeyPatch):
+  monkeypatch.setenv("MAIL_DOT_COM_EMAIL", "applicant@mail.com")
+  monkeypatch.setenv("MAIL_DOT_COM_PASS", "password")
+  with socket.create_server(("127.0.0.1", 0)) as silent_server:
+    email_handler = EmailHandler(host="127.0.0.1", port=silent_server.getsockname()[1], use_ssl=False)
+    start_time = time.time()
+    with pytest.raises(TimeoutError, match="one-time code"):
+      email_handler.get_indeed_one_time_code_from_mdc(timeout=1)
+    assert time.time() - start_time < 4
+
+
+def test_times_out_when_idle_is_never_ended(email_handler: EmailHandler, mailbox: StandInMailbox):
+  mailbox.answers_done = False
+  start_time = time.time()
+  with pytest.raises(TimeoutError, match="one-time code"):
+    email_handler.get_indeed_one_time_code_from_mdc(timeout=1)
+  assert time.time() - start_time < 4
@@ -0,0 +1,82 @@
+from pathlib import Path
+import pytest
+
+pytest.importorskip("undetected_chromedriver")
+
+from services.misc.indeed_page_data_extractor import IndeedPageDataExtractor   # pylint: disable=wrong-import-position
+
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+SEARCH_URL = "https://www.indeed.com/jobs?q=python+developer&l=Remote&start=10"
+
+
+def read_fixture(name: str) -> str:
+  return (FIXTURES_PATH / name).read_text(encoding="utf-8")
+
+
+def test_get_job_cards_from_html_reads_the_embedded_results():
+  job_cards = IndeedPageDataExtractor().get_job_cards_from_html(read_fixture("indeed_search_results.html"), SEARCH_URL)
+  assert job_cards is not None
+  assert [job_card["job_key"] for job_card in job_cards] == [
+    "5f1e2d3c4b5a6978",
+    "0a1b2c3d4e5f6a7b",
+    "1122334455667788",
+    "99aa88bb77cc66dd"
+  ]
+  assert job_cards[0] == {
+    "job_key": "5f1e2d3c4b5a6978",
+    "title": "Senior Python Developer",
+    "company": "Acme Corp",
+    "location": "Remote",
+    "url": "https://www.indeed.com/viewjob?jk=5f1e2d3c4b5a6978",
+    "min_pay": 120000.0,
+    "max_pay": 150000.0,
+    "applied": False
+  }
+
+
+def test_get_job_cards_from_html_annualizes_pay():
+  job_cards = IndeedPageDataExtractor().get_job_cards_from_html(read_fixture("indeed_search_results.html"), SEARCH_URL)
+  assert job_cards is not None
+  job_cards_by_key = {job_card["job_key"]: job_card for job_card in job_cards}
+  assert (job_cards_by_key["0a1b2c3d4e5f6a7b"]["min_pay"], job_cards_by_key["0a1b2c3d4e5f6a7b"]["max_pay"]) == (
+    45 * 2080,
+    65 * 2080
+  )
+  assert (job_cards_by_key["99aa88bb77cc66dd"]["min_pay"], job_cards_by_key["99aa88bb77cc66dd"]["max_pay"]) == (
+    7500 * 12,
+    9000 * 12
+  )
+  assert (job_cards_by_key["1122334455667788"]["min_pay"], job_cards_by_key["1122334455667788"]["max_pay"]) == (
+    None,
+    None
+  )
+
+
+def test_get_job_cards_from_html_fills_in_missing_fields():
+  job_cards = IndeedPageDataExtractor().get_job_cards_from_html(read_fixture("indeed_search_results.html"), SEARCH_URL)
+  assert job_cards is not None
+  job_cards_by_key = {job_card["job_key"]: job_card for job_card in job_cards}
+  assert job_cards_by_key["0a1b2c3d4e5f6a7b"]["company"] == "Globex"
+  assert job_cards_by_key["0a1b2c3d4e5f6a7b"]["applied"] is True
+  assert job_cards_by_key["1122334455667788"]["title"] == "Data Engineer"
+  assert job_cards_by_key["1122334455667788"]["location"] == ""
+
+
+def test_get_job_cards_from_html_returns_none_without_the_state():
+  page_html = read_fixture("indeed_job_view.html")
+  assert IndeedPageDataExtractor().get_job_cards_from_html(page_html, SEARCH_URL) is None
+
+
+def test_get_job_description_html_from_html_reads_the_embedded_description():
+  job_description_html = IndeedPageDataExtractor().get_job_description_html_from_html(
+    read_fixture("indeed_job_view_state.html")
+  )
+  assert job_description_html == (
+    "<p>Acme is hiring a <b>Senior Python Developer</b>.</p><ul><li>5+ years of experience</li>"
+    "<li>Django or FastAPI</li></ul>"
+  )
+
+
+def test_get_job_description_html_from_html_returns_none_without_the_state():
+  assert IndeedPageDataExtractor().get_job_description_html_from_html(read_fixture("indeed_job_view.html")) is None
@@ -0,0 +1,92 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List
+import pytest
+from services.misc.job_description_fetcher import JobDescriptionFetcher
+
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  requests_seen: List[Dict[str, str]] = []
+  client_ports_seen: List[int] = []
+
+  def do_GET(self):   # pylint: disable=invalid-name
+    FixtureRequestHandler.requests_seen.append(dict(self.headers))
+    FixtureRequestHandler.client_ports_seen.append(self.client_address[1])
+    if self.path.startswith("/viewjob"):
+      body = (FIXTURES_PATH / "indeed_job_view.html").read_bytes()
+      self.send_response(200)
+      self.send_header("Content-Type", "text/html; charset=utf-8")
+      self.send_header("Content-Length", str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+      return
+    self.send_error(404)
+
+  def log_message(self, format, *args):   # pylint: disable=redefined-builtin
+    pass
+
+
+@pytest.fixture(name="base_url")
+def fixture_base_url() -> Iterator[str]:
+  FixtureRequestHandler.requests_seen = []
+  FixtureRequestHandler.client_ports_seen = []
+  server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureRequestHandler)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield f"http://127.0.0.1:{server.server_port}"
+  server.shutdown()
+  server.server_close()
+
+
+def test_fetch_description_html_returns_the_description(base_url: str):
+  job_description_fetcher = JobDescriptionFetcher()
+  description_html = job_description_fetcher.fetch_description_html(
+    f"{base_url}/viewjob?jk=0123456789abcdef",
+    "#jobDescriptionText"
+  )
+  job_description_fetcher.close()
+  assert description_html is not None
+  assert description_html.startswith("<p>We're hiring a <b>Backend Engineer</b>.</p>")
+  assert "<li>3+ years of experience with Python</li>" in description_html
+
+
+def test_fetch_description_html_sends_the_browser_session(base_url: str):
+  job_description_fetcher = JobDescriptionFetcher()
+  job_description_fetcher.sync_session(
+    "Mozilla/5.0 (X11; Linux x86_64) Chrome/138.0.0.0",
+    [{"name": "CTK", "value": "abc123", "domain": "127.0.0.1", "path": "/"}]
+  )
+  job_description_fetcher.fetch_description_html(f"{base_url}/viewjob?jk=0123456789abcdef", "#jobDescriptionText")
+  job_description_fetcher.close()
+  headers = FixtureRequestHandler.requests_seen[-1]
+  assert headers["User-Agent"] == "Mozilla/5.0 (X11; Linux x86_64) Chrome/138.0.0.0"
+  assert headers["Cookie"] == "CTK=abc123"
+
+
+def test_fetch_description_html_keeps_connections_alive(base_url: str):
+  job_description_fetcher = JobDescriptionFetcher(max_connections=1)
+  for _ in range(3):
+    job_description_fetcher.fetch_description_html(f"{base_url}/viewjob?jk=0123456789abcdef", "#jobDescriptionText")
+  job_description_fetcher.close()
+  assert len(FixtureRequestHandler.client_ports_seen) == 3
+  assert len(set(FixtureRequestHandler.client_ports_seen)) == 1
+
+
+def test_fetch_description_html_returns_none_on_http_errors(base_url: str):
+  job_description_fetcher = JobDescriptionFetcher()
+  assert job_description_fetcher.fetch_description_html(f"{base_url}/missing", "#jobDescriptionText") is None
+  job_description_fetcher.close()
+
+
+def test_fetch_description_html_returns_none_without_a_description(base_url: str):
+  job_description_fetcher = JobDescriptionFetcher()
+  assert job_description_fetcher.fetch_description_html(
+    f"{base_url}/viewjob?jk=0123456789abcdef",
+    "div.jobs-description-content__text--stretch"
+  ) is None
+  job_description_fetcher.close()
@@ -0,0 +1,21 @@
+import pytest
+from models.enums.language import Language
+from services.misc.language_parser import LanguageParser
+
+pytest.importorskip("langid")
+
+
+@pytest.mark.parametrize("string, language", [
+  ("Desarrollador Backend Senior Globant Buenos Aires", Language.SPANISH),
+  ("Ingeniero Informatico Telefonica Madrid", Language.SPANISH),
+  ("Developpeur logiciel Capgemini Paris", Language.FRENCH),
+  ("Senior Backend Engineer Google Mountain View", Language.ENGLISH),
+  ("Data Scientist Amazon Seattle", Language.ENGLISH)
+])
+def test_card_text_without_stopwords_goes_to_the_model(string: str, language: Language):
+  assert LanguageParser().get_language(string) == language
+
+
+def test_text_with_english_stopwords_is_english():
+  language_parser = LanguageParser()
+  assert language_parser.get_language("Join the team and build the future of payments with us") == Language.ENGLISH
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+import pytest
+
+pytest.importorskip("undetected_chromedriver")
+
+# pylint: disable=wrong-import-position
+from services.misc.cdp_event_bus import CdpEventBus
+from services.misc.linkedin_network_capture import LinkedinNetworkCapture
+
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+def build_network_capture() -> LinkedinNetworkCapture:
+  # Replaying a HAR never touches the browser
+  network_capture = LinkedinNetworkCapture(None, CdpEventBus(None))
+  with open(FIXTURES_PATH / "linkedin_job_search.har", "r", encoding="utf-8") as har_file:
+    network_capture.index_har(json.load(har_file))
+  return network_capture
+
+
+def test_index_har_indexes_normalized_job_postings():
+  network_capture = build_network_capture()
+  assert network_capture.get_job_description_html("4012345678") == (
+    "Build APIs in Python &amp; Django.\n5+ years of experience &lt;required&gt;."
+  )
+
+
+def test_index_har_indexes_dash_job_postings():
+  network_capture = build_network_capture()
+  assert network_capture.get_job_description_html("4087654321") == (
+    "Work on distributed systems. 3 years of professional Go or Python."
+  )
+
+
+def test_index_har_decodes_base64_bodies():
+  network_capture = build_network_capture()
+  assert network_capture.get_job_description_html("4022222222") == "Encoded on the wire: Rust &amp; Python."
+
+
+def test_index_har_skips_everything_else():
+  network_capture = build_network_capture()
+  assert network_capture.get_job_description_count() == 3
+  # A blank description, a company entity and a response from outside the voyager API
+  assert network_capture.get_job_description_html("4011111111") is None
+  assert network_capture.get_job_description_html("1337") is None
+  assert network_capture.get_job_description_html("4099999999") is None